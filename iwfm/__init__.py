@@ -27,15 +27,18 @@ from iwfm.sim_info import sim_info
 
 # -- IWFM preprocessor files -------------------------------
 from iwfm.iwfm_read_preproc import iwfm_read_preproc
+from iwfm.iwfm_read_table import iwfm_read_table
 from iwfm.iwfm_read_elements import iwfm_read_elements
 from iwfm.iwfm_read_nodes import iwfm_read_nodes
 from iwfm.iwfm_read_chars import iwfm_read_chars
 from iwfm.iwfm_read_lake import iwfm_read_lake
 from iwfm.iwfm_read_streams import iwfm_read_streams
+from iwfm.stream_network import stream_network
 from iwfm.iwfm_read_strat import iwfm_read_strat
 from iwfm.read_elements_csv import read_elements_csv
 from iwfm.read_nodes_csv import read_nodes_csv
 
+from iwfm.stratigraphy import stratigraphy
 from iwfm.iwfm_strat_arrays import iwfm_strat_arrays
 from iwfm.iwfm_lse import iwfm_lse
 from iwfm.iwfm_aquifer_thickness import iwfm_aquifer_thickness
@@ -112,6 +115,7 @@ from iwfm.wdl_ts_4_wells import wdl_ts_4_wells
 # --- plotting methods --for IWFM output ------------------
 from iwfm.read_obs_smp import read_obs_smp
 from iwfm.read_sim_wells import read_sim_wells
+from iwfm.read_hyd_array import read_hyd_array
 from iwfm.read_sim_hyds import read_sim_hyds
 from iwfm.hyd_diff import hyd_diff
 from iwfm.write_smp import write_smp
@@ -121,8 +125,17 @@ from iwfm.bnds2mask import bnds2mask
 
 # -- post-process headall.out file ------------------------
 from iwfm.headall_read import headall_read
+from iwfm.headall_data import headall_data
+from iwfm.headall_read_array import headall_read_array
+from iwfm.headall_header import headall_header
+from iwfm.headall_chunks import headall_chunks
+from iwfm.headall_cache import headall_cache
+from iwfm.headall_index import headall_index
+from iwfm.heads_for_dates import heads_for_dates
+from iwfm.seek_heads import seek_heads
 from iwfm.headall2csv import headall2csv
 from iwfm.headall2dtw import headall2dtw
+from iwfm.headall2map import headall2map
 from iwfm.headall2shp import headall2shp
 from iwfm.headall2table import headall2table
 from iwfm.headall2ts import headall2ts
@@ -132,12 +145,15 @@ from iwfm.read_nodes import read_nodes
 from iwfm.find_line_num import find_line_num
 
 # -- finite-element methods -------------------------------
+from iwfm.mesh import mesh
 from iwfm.elem_poly_coords import elem_poly_coords
 from iwfm.iwfm_nearest_nodes import iwfm_nearest_nodes
 from iwfm.iwfm_nearest_node import iwfm_nearest_node
 from iwfm.nearest_node import nearest_node
 from iwfm.nearest import nearest
+from iwfm.node_index import node_index
 from iwfm.in_element import in_element
+from iwfm.elem_locator import elem_locator
 from iwfm.elem_centroids import elem_centroids
 from iwfm.get_elem_centroids import get_elem_centroids
 
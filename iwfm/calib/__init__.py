@@ -18,9 +18,15 @@
 
 # -- PEST functions ---------------------------------------
 from iwfm.calib.read_settings import read_settings
+from iwfm.calib.read_obs_config import read_obs_config
 from iwfm.calib.fac2iwfm import fac2iwfm
+from iwfm.calib.read_factors import read_factors
+from iwfm.calib.apply_factors import apply_factors
 from iwfm.calib.iwfm2obs import iwfm2obs
+from iwfm.calib.iwfm2obs_batch import iwfm2obs_batch
+from iwfm.calib.iwfm2obs_hyds import iwfm2obs_hyds
 from iwfm.calib.real2iwfm import real2iwfm
+from iwfm.calib.overwrite_params import overwrite_params
 from iwfm.calib.par2iwfm import par2iwfm
 from iwfm.calib.ppk2fac_trans import ppk2fac_trans
 from iwfm.calib.stacdep2obs import stacdep2obs
@@ -37,6 +43,7 @@ from iwfm.calib.setrot import setrot
 from iwfm.calib.obs_smp import obs_smp
 from iwfm.calib.sim_smp import sim_smp
 from iwfm.calib.smp_avg import smp_avg
+from iwfm.calib.smp_store import smp_store
 from iwfm.calib.to_smp_ins import to_smp_ins
 
 # -- math functions ---------------------------------------
@@ -46,6 +53,8 @@ from iwfm.calib.do_avgonly import do_avgonly
 from iwfm.calib.idw import idw
 from iwfm.calib.interp_val import interp_val
 from iwfm.calib.res_stats import res_stats
+from iwfm.calib.res_group_stats import res_group_stats
+from iwfm.calib.res_period import res_period
 from iwfm.calib.rmse_calc import rmse_calc
 from iwfm.calib.pest_res_stats import pest_res_stats
 
@@ -57,12 +66,16 @@ from iwfm.calib.get_obs_hyd import get_obs_hyd
 from iwfm.calib.get_sim_hyd import get_sim_hyd
 from iwfm.calib.headdiff_hyds import headdiff_hyds
 from iwfm.calib.headdiff_read import headdiff_read
+from iwfm.calib.read_pest_res import read_pest_res
+from iwfm.calib.read_smp_res import read_smp_res
 from iwfm.calib.hyds_missed import hyds_missed
+from iwfm.calib.obs_plan import obs_plan, sim_hyd_array
 from iwfm.calib.sim_4_sites import sim_4_sites
 from iwfm.calib.well_pairs_2_obs_list import well_pairs_2_obs_list
 
 # -- file writing functions ---------------------------------------
 from iwfm.calib.write_missing import write_missing
 from iwfm.calib.write_results import write_results
+from iwfm.calib.write_res_stats import write_res_stats
 from iwfm.calib.write_rmse_bias import write_rmse_bias
 from iwfm.calib.simout2gw import simout2gw
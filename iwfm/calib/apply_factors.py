@@ -0,0 +1,64 @@
+# apply_factors.py
+# Calculate nodal values from pilot point values with a sparse factors matrix
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def apply_factors(factors, offsets, n_used, pp_values, rlow=0, rhigh=1000000, empty=-999):
+    ''' apply_factors() - Calculate nodal parameter values from pilot point
+        values with the factors from read_factors(), for one set of pilot
+        point values or an ensemble of them in one sparse matrix product
+
+    Parameters
+    ----------
+    factors : scipy.sparse.csr_matrix
+        factor of each pilot point for each node, shape (no_nodes, no_ppts)
+
+    offsets : numpy array
+        value added to the weighted sum for each node
+
+    n_used : numpy array
+        number of pilot points for each node
+
+    pp_values : array-like
+        pilot point values, shape (no_ppts,) or (no_ppts, realizations)
+
+    rlow : float, default=0
+        Lower interpolation limit, smaller nodal values are set to rlow
+
+    rhigh : float, default=1000000
+        Upper interpolation limit, larger nodal values are set to rhigh
+
+    empty : float, default=-999
+        Nodal parameter value if no pilot point value
+
+    Returns
+    -------
+    values : numpy array
+        nodal values, shape (no_nodes,) or (no_nodes, realizations)
+
+    '''
+    import numpy as np
+
+    pp_values = np.asarray(pp_values, dtype=float)
+    if len(pp_values) != factors.shape[1]:
+        raise ValueError(f'{len(pp_values)} pilot point values for {factors.shape[1]} pilot points')
+
+    values = factors @ pp_values
+    values += offsets if values.ndim == 1 else offsets[:, None]
+    values = np.clip(values, rlow, rhigh)
+    values[np.asarray(n_used) == 0] = empty
+    return values
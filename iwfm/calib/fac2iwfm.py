@@ -1,6 +1,6 @@
 # fac2iwfm.py
 # Transfer parameter values from pilot points to model nodes
-# Copyright (C) 2020-2023 University of California
+# Copyright (C) 2020-2024 University of California
 # from fac2reali.f90 by M Tonkin, SSPA
 # -----------------------------------------------------------------------------
 # This information is free; you can redistribute it and/or modify it
@@ -19,18 +19,21 @@
 
 def fac2iwfm(pp_file_name, param_file_name, save_name, rlow=0, rhigh=1000000, empty=-999, verbose=False):
     ''' fac2iwfm() - Transfer parameter values from pilot points to model nodes
-        from fac2reali.f90 by M Tonkin
+        from fac2reali.f90 by M Tonkin. The factors are read once into a
+        sparse matrix, and an ensemble of parameter files is transferred
+        with one sparse matrix product.
 
     Parameters
     ----------
     pp_file_name : str
         File of pilot point factors for nodes
 
-    param_file_name : str
-        File with parameter values at pilot points
+    param_file_name : str or list of str
+        File with parameter values at pilot points, or one file for each
+        realization of an ensemble
 
-    save_name : str
-        Name of output file
+    save_name : str or list of str
+        Name of output file, or one for each item of param_file_name
 
     rlow : float, default=0
         Lower inerppolation threshold value
@@ -44,49 +47,44 @@ def fac2iwfm(pp_file_name, param_file_name, save_name, rlow=0, rhigh=1000000, em
     Returns
     -------
     count : int
-        Number of PDFs combined
+        Number of output files written
 
     '''
-
+    import numpy as np
     import iwfm as iwfm
+    import iwfm.calib as calib
+
     if verbose:
         print('\n FAC2IWFM carries out spatial parameter interpolation to IWFM 2015 node')
         print(' locations using interpolation factors calculated by PPK2FACI and ')
         print(' pilot point values contained in a pilot points file.')
     
-    iwfm.file_test(pp_file_name)
-    pp_file_lines = open(pp_file_name).read().splitlines()
+    factors, nodes, offsets, n_used = calib.read_factors(pp_file_name)
     if verbose: print(f'\n Read {pp_file_name}')
- 
-    no_nodes = int(pp_file_lines[1])            # number of model nodes
-    no_ppts  = int(pp_file_lines[2])            # number of pilot points
-    
-    # put pilot point allocation factors into list
-    pp_factors = pp_file_lines[(no_ppts + 3):(no_ppts + no_nodes + 3)]
-
-
-    # read parameter values at pilot points into a dictionary
-    iwfm.file_test(param_file_name)
-    param_file_lines = open(param_file_name).read().splitlines()
-    if verbose: print(f' Read {param_file_name}')
-    pp_params, i = {}, 0
-    for line in param_file_lines:
-        items = line.split()
-        i += 1
-        pp_params[i] = [items[4]]              # dictionary key: pp_name, value: param_value
-
-
-    # parse the spatial interpolation factors and calculate the parameter value
-    with open(save_name, 'w') as f:
-        for item in pp_factors:
-            item = item.split()
-            node, na, pval = int(item[0]), int(item[2]), 0
-            for i in range(0, na):
-                pp, factor = int(item[4 + i * 2]), float(item[4 + i * 2 + 1])
-                pval += float(pp_params[pp][0]) * factor
-            pval_str = iwfm.pad_back(str(round(pval,3)),n=8,t='0')
-            f.write(f' node:      {iwfm.pad_front(node,n=6)} value:  {pval_str}\n')
-    if verbose: print(f' Wrote nodal parameter values to {save_name}')
+
+    if isinstance(param_file_name, str):
+        param_file_name, save_name = [param_file_name], [save_name]
+
+    # read parameter values at pilot points, one column for each parameter file
+    pp_params = []
+    for param_file in param_file_name:
+        iwfm.file_test(param_file)
+        param_file_lines = open(param_file).read().splitlines()
+        pp_params.append([float(line.split()[4]) for line in param_file_lines])
+        if verbose: print(f' Read {param_file}')
+    pp_params = np.column_stack(pp_params)
+
+    # calculate the parameter values at all nodes for all parameter files
+    pvals = calib.apply_factors(factors, offsets, n_used, pp_params, rlow, rhigh, empty)
+
+    node_text = [f' node:      {iwfm.pad_front(node,n=6)} value:  ' for node in nodes.tolist()]
+    for k, save in enumerate(save_name):
+        with open(save, 'w') as f:
+            f.write(''.join(f'{text}{iwfm.pad_back(str(round(pval,3)),n=8,t="0")}\n'
+                            for text, pval in zip(node_text, pvals[:, k].tolist())))
+        if verbose: print(f' Wrote nodal parameter values to {save}')
+
+    return len(save_name)
 
 
 if __name__ == "__main__":
@@ -20,7 +20,7 @@
 def get_obs_hyd(obs_file,start_date):
     ''' get_obs_hyd - reads an observation sample bore (smp) file, and returns a list 
         of observation sites and a list of observation data as [site_id, days since 
-        start, date as datetime object]
+        start, date as datetime object, observed value]
 
     Parameters
     ----------
@@ -37,7 +37,7 @@ def get_obs_hyd(obs_file,start_date):
         observation site names
 
     obs_data : list
-        [site name, days since start, date as datetime object]
+        [site name, days since start, date as datetime object, observed value]
 
     '''
 
@@ -50,7 +50,7 @@ def get_obs_hyd(obs_file,start_date):
         if item[0] not in obs_sites:
             obs_sites.append(item[0])
         days = iwfm.dts2days(iwfm.str2datetime(item[1]), start_date)                # days since start_date
-        obs_data.append([item[0],days,iwfm.str2datetime(item[1])])             # site, days since start, date as datetime object
+        obs_data.append([item[0],days,iwfm.str2datetime(item[1]),float(item[3])])  # site, days since start, date as datetime object, value
 
     obs_data.sort( key = lambda l: (l[0], l[1]))
     obs_sites.sort( key = lambda l: (l[0]))
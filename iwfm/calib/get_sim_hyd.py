@@ -45,20 +45,9 @@ def get_sim_hyd(nt,file_name,start_date):
     import iwfm as iwfm
     import numpy as np
 
-    hyd_lines = open(file_name).read().splitlines()
-    hyd_index, dates, sim_hyd = 1, [], []
+    values, hyd_dates, hyd_names = iwfm.read_hyd_array(file_name)
 
-    while hyd_lines[hyd_index][0].isdigit() != True:                    # skip to the dates
-        hyd_index += 1
-
-    while hyd_index < len(hyd_lines) and hyd_lines[hyd_index][0].isdigit() == True:   # get the dates
-        temp = hyd_lines[hyd_index].split()
-        dates.append(iwfm.dts2days(iwfm.str2datetime(temp[0][:10]), start_date))    # days since start_date
-
-        arr = []
-        for i in range(1,len(temp)):
-            arr.append(float(temp[i]))
-        sim_hyd.append(np.array(arr))
-        hyd_index += 1
+    dates = (hyd_dates - np.datetime64(start_date.date(), 'D')).astype(int).tolist()   # days since start_date
+    sim_hyd = list(values)                                              # one array per time step
 
     return sim_hyd, dates
@@ -50,6 +50,9 @@ def headdiff_hyds(hdiff_pairs, hdiff_data, rthresh, ts_func, start_date, verbose
         instructions for reading smp_out data
 
     '''
+    from math import ceil
+    import iwfm as iwfm
+    import iwfm.calib as calib
 
     smp_out, ins_out, temp, data, sites = [], [], [], [], []
     hdiff_data.sort( key = lambda l: (l[0], l[1]))                      # sort by site then by date
@@ -74,13 +77,13 @@ def headdiff_hyds(hdiff_pairs, hdiff_data, rthresh, ts_func, start_date, verbose
             site, left, right = pair[0], pair[1], pair[2]
             left_col, right_col = sites.index(left), sites.index(right)     # which columns of data
 
-            for i in range(0,len(data[left_col])):
+            for i in range(0,min(len(data[left_col]),len(data[right_col]))):
                 d_left, d_right = data[left_col][i][0],data[right_col][i][0]
                 if abs((d_left - d_right).days) <= rthresh:
                     obs_val = data[left_col][i][1] - data[right_col][i][1]
-                    ts = ceil(float(ts_func(dts2days(d_left, start_date))))     # date to time step w/interpolation function
-                    smp, ins = to_smp_ins(site,d_left,obs_val,ts)               # put into smp and ins strings
+                    ts = ceil(float(ts_func(iwfm.dts2days(d_left, start_date))))    # date to time step w/interpolation function
+                    smp, ins = calib.to_smp_ins(site,d_left,obs_val,ts)         # put into smp and ins strings
 
-                smp_out.append(smp)                                           # add smp string to smp_out list
-                ins_out.append(ins)                                           # add ins string to ins_out list
+                    smp_out.append(smp)                                       # add smp string to smp_out list
+                    ins_out.append(ins)                                       # add ins string to ins_out list
     return smp_out, ins_out
@@ -42,11 +42,6 @@ def iwfm2obs(verbose=False):
     import os,sys
     import iwfm as iwfm
     import iwfm.calib as calib
-    import numpy as np
-    import pandas as pd
-    from math import ceil
-    from scipy.interpolate import interp1d
-    from itertools import islice
 
     # == Get main simulation file name via prompt -----------------------------------
     sim_file    = input('IWFM Simulation main file: ')
@@ -138,82 +133,14 @@ def iwfm2obs(verbose=False):
     with open(missing_file, 'w') as fmiss:                                        # erase old version
         fmiss.write('')
 
-    # == read simulated hydrographs --------------------------------------------------------
+    # == interpolate simulated hydrographs to observations ---------------------------------
     for nt in nametype:
         if file_dict[nt][0] != 'none'and file_dict[nt][5] == True:
-            if verbose: print(f'\n  Processing {nt.lower()} hydrographs')
-            sim_sites = hyd_dict[nt][1]
-            sim_hyd, sim_dates = calib.get_sim_hyd(nt,hyd_dict[nt][0],start_date) # read simulated hydrograph values into lists
-
-            # set up function to interpolate time step from date
-            time_steps = [x+1 for x in list(range(len(sim_dates)))]
-            ts = pd.DataFrame({ 'sim_dates': sim_dates, 'time_steps':  np.array(time_steps)}) # time steps to pandas dataframe
-            ts.set_index('sim_dates')['time_steps']                               # dataframe index for function
-            ts_func = interp1d(ts.sim_dates,ts.time_steps,kind='linear')          # scipy interpolation function uses dataframe
-
-            obs_file = file_dict[nt][1]
-            obs_sites, obs_data = calib.get_obs_hyd(obs_file,start_date)           # get the observation sites and dates
-
-            sim_miss, sim_both = calib.compare(sim_sites,obs_sites)               # how many obs_sites not in sim_sites?
-            calib.write_missing(sim_miss,obs_file,fname=missing_file)
-
-            if verbose: print(f'    Read {len(sim_hyd[0])} simulated {nt.lower()} hydrographs')
-
-            # -- interpolate simulated values to observation dates and put into smp- and ins-format strings
-            obs_data.sort( key = lambda l: (l[0], l[1]))                          # sort by site then by date
-            obs_site, obs_date, obs_dt = islice(zip(*obs_data), 3)                # put each obs_data col into a separate list
-            smp_out, ins_out, hdiff_data, old_site = [], [], [], ''
-            for i in range(0,len(obs_data)):
-                if obs_site[i] in sim_sites:
-                    if obs_site[i] != old_site:                                   # set up interpolation function for new site
-                        old_site = obs_site[i]
-                        col_id = sim_sites.index(obs_site[i])
-                        sim = []
-                        for j in range(0,len(sim_hyd)):
-                            sim.append(sim_hyd[j][col_id])
-                        # set up function to interpolate simulated values to obs dates
-                        df = pd.DataFrame({ 'dates': sim_dates, 'sim_vals':  np.array(sim)}) # sim values to pandas dataframe
-                        df.set_index('dates')['sim_vals']                         # dataframe index for function
-                        sim_func = interp1d(df.dates,df.sim_vals,kind='linear')   # scipy interpolation function uses dataframe
-
-                    if obs_date[i] < latest:                                      # should latest be end_date?
-                        obs_val = float(sim_func(obs_date[i]))                    # use interpolation function
-                        ts = ceil(float(ts_func(obs_date[i])))                    # use interpolation function
-
-                        smp, ins = calib.to_smp_ins(obs_site[i],obs_dt[i],round(obs_val,3),ts)   # put into smp and ins strings
-                        smp_out.append(smp)                                       # add smp string to smp_out list
-                        ins_out.append(ins)                                       # add ins string to ins_out list
-
-                        if nt == 'Groundwater' and headdiffs == True and obs_site[i] in hdiff_sites:
-                            hdiff_data.append([obs_site[i],obs_dt[i],obs_val,ts])
-
-            if nt == 'Groundwater' and headdiffs == True and len(hdiff_data) > 0:  # process headdiffs
-                smp, ins = calib.headdiff_hyds(hdiff_pairs, hdiff_data, file_dict[nt][5], ts_func, start_date, verbose)
-                smp_out.extend(smp)                                                # add smp string list to smp_out list
-                ins_out.extend(ins)                                                # add ins string list to ins_out list
-
-            # -- write smp file ----------------------------------------------------------------
-            smp_outfile  = file_dict[nt][2]
-            with open(smp_outfile, 'w') as f:
-                for item in smp_out:
-                    f.write("%s\n" % item)
-            if verbose: print(f'    Wrote {len(smp_out):,} simulated {nt.lower()} values to {smp_outfile}')
-
-            # -- write ins file ----------------------------------------------------------------
-            if file_dict[nt][6] == True:        # iwriteins
-                ins_outfile  = file_dict[nt][3]
-                with open(ins_outfile, 'w') as f:
-                    f.write("pif #\n")
-                    for item in ins_out:
-                        f.write("%s\n" % item)
-                if verbose: print(f'    Wrote instrutions to {ins_outfile}')
-
-                # -- if pcf creation is added to smp2smp, write pcf file -------------------------
-                #pcf_file  = file_dict[nt][4]
-                #with open(pcf_file, 'w') as fpcf:
-                #  for item in pcf_out:
-                #    fpcf.write("%s\n" % item)
-                #print('    Wrote pcf to {}'.format(pcf_file))
+            hdiff = (hdiff_sites, hdiff_pairs) if nt == 'Groundwater' and headdiffs == True else None
+            task = (nt, hyd_dict[nt][0], hyd_dict[nt][1], file_dict[nt][1], file_dict[nt][2], file_dict[nt][3],
+                    file_dict[nt][4], file_dict[nt][7], hdiff, start_date, latest, verbose)
+            sim_miss, count = calib.iwfm2obs_hyds(task)
+            calib.write_missing(list(sim_miss),file_dict[nt][1],fname=missing_file)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,141 @@
+# iwfm2obs_batch.py
+# Non-interactive iwfm2obs driven by a configuration file
+# Copyright (C) 2020-2024 University of California
+#-----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#-----------------------------------------------------------------------------
+
+
+def iwfm2obs_batch(config_file='iwfm2obs.ini', workers=None, verbose=False):
+    ''' iwfm2obs_batch() - Interpolate model output to the times and
+        locations of calibration observations and write PEST-compatible
+        smp, ins and pcf files, with all file names and options read from a
+        configuration file instead of prompts, so it can run unattended
+        under a PEST run manager. Each hydrograph type is processed in a
+        separate worker process.
+
+    Parameters
+    ----------
+    config_file : str, default='iwfm2obs.ini'
+        JSON, YAML or INI configuration file, see read_obs_config()
+
+    workers : int, default=None
+        number of worker processes, None = the 'workers' setting, 0 = one
+        per hydrograph type up to the number of cpu cores, 1 = no
+        multiprocessing
+
+    verbose : bool, default=False
+        True = command-line output on
+
+    Returns
+    -------
+    counts : dictionary
+        key = hydrograph type, value = number of simulated values written
+
+    '''
+    import os
+    import iwfm as iwfm
+    import iwfm.calib as calib
+
+    settings = calib.read_obs_config(config_file)
+    if workers is None:
+        workers = settings['workers']
+
+    # == Read Time Step info from IWFM Simulation Input File ------------------------
+    sim_file = settings['sim_file']
+    iwfm.file_test(sim_file)
+    start_date, end_date, time_step = iwfm.sim_info(sim_file)
+    if verbose: print(f'\n  Read Simulation Main File {sim_file}')
+
+    start_date = iwfm.str2datetime(start_date[0:10])                         # starting data as datetime
+    end_date   = iwfm.str2datetime(end_date[0:10])                           # ending date as datetime
+    latest     = iwfm.dts2days(end_date,start_date)                          # number of days between start and end
+
+    sim_file_d = iwfm.iwfm_read_sim(sim_file)                                # get package file names from simulation file
+    gw_file_d = iwfm.iwfm_read_gw(sim_file_d['gw'])[0]                       # get groundwater file names from groundwater file
+
+    file_dict = {   # 0                              1     2     3     4     5     6     7  8  9
+        'Streams':     [sim_file_d['stream']   ,'none','none','none','none',False,False, 0, 1, [ 6,6]],
+        'Groundwater': [sim_file_d['gw']       ,'none','none','none','none',False,False, 0, 5, [20,2]],
+        'Subsidence':  [gw_file_d['subsidence'],'none','none','none','none',False,False, 0, 5, [ 5,2]],
+        'Tile drains': [gw_file_d['tiledrain'] ,'none','none','none','none',False,False, 0, 2, [-1,3]]
+    }
+
+    # == one task per hydrograph type in the configuration file ----------------------
+    tasks = []
+    for nt, old_value in file_dict.items():
+        if nt not in settings or old_value[0] == 'none':
+            continue
+        s = settings[nt]
+        iwfm.file_test(old_value[0])
+        iwfm.file_test(s['obs_file'])
+        file_dict[nt] = [old_value[0], s['obs_file'], s['smp_file'], s['ins_file'], s['pcf_file'], True,
+                         not (s['ins_file'] or 'none').lower().startswith('n'), s['rthresh'], old_value[8], old_value[9]]
+
+        hyd_file, hyd_names = calib.get_hyd_info(nt, file_dict)
+        if verbose: print(f'    Read {len(hyd_names)} {nt.lower()} hydrograph locations')
+        if len(hyd_names) == 0:
+            continue
+
+        hdiff = None
+        if nt == 'Groundwater' and not (s['headdiff_file'] or 'none').lower().startswith('n'):
+            iwfm.file_test(s['headdiff_file'])
+            hdiff_sites, hdiff_pairs, hdiff_link = calib.headdiff_read(s['headdiff_file'])
+            hdiff = (hdiff_sites, hdiff_pairs)
+            if verbose: print(f'    Read {len(hdiff_sites)} vertical well pairs')
+
+        tasks.append((nt, hyd_file, hyd_names, s['obs_file'], s['smp_file'], s['ins_file'], s['pcf_file'],
+                      s['rthresh'], hdiff, start_date, latest, verbose))
+
+    if len(tasks) == 0:
+        if verbose: print('\n  Nothing to do, exiting')
+        return {}
+
+    # == process the hydrograph types --------------------------------------------------
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        import multiprocessing as mp
+
+        with mp.Pool(processes=min(workers, len(tasks))) as pool:
+            results = pool.map(calib.iwfm2obs_hyds, tasks)
+    else:
+        results = [calib.iwfm2obs_hyds(task) for task in tasks]
+
+    # -- simulation sites without observations, in hydrograph type order
+    with open(settings['missing_file'], 'w') as fmiss:                          # erase old version
+        fmiss.write('')
+    for task, (sim_miss, count) in zip(tasks, results):
+        calib.write_missing(list(sim_miss), task[3], fname=settings['missing_file'])
+
+    return {task[0]: count for task, (sim_miss, count) in zip(tasks, results)}
+
+
+if __name__ == "__main__":
+    ''' Run iwfm2obs_batch() from command line '''
+    import sys
+    import iwfm.debug as idb
+
+    if len(sys.argv) > 1:  # arguments are listed on the command line
+        config_file = sys.argv[1]
+        workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    else:  # ask for file names from terminal
+        config_file = input('iwfm2obs configuration file name: ')
+        workers = None
+
+    idb.exe_time()  # initialize timer
+    counts = iwfm2obs_batch(config_file, workers=workers, verbose=True)
+
+    print(' ') # clean screen
+    idb.exe_time()  # print elapsed time
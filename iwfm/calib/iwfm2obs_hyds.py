@@ -0,0 +1,115 @@
+# iwfm2obs_hyds.py
+# Interpolate one type of IWFM simulated hydrographs to observation times
+# Copyright (C) 2020-2024 University of California
+#-----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#-----------------------------------------------------------------------------
+
+
+def iwfm2obs_hyds(task):
+    ''' iwfm2obs_hyds() - Interpolate the simulated hydrographs of one
+        hydrograph type to the observation sites and times, and write the
+        smp, ins and pcf files. Takes a single task tuple so it can be
+        mapped over a multiprocessing pool.
+
+    Parameters
+    ----------
+    task : tuple
+        (nt, hyd_file, sim_sites, obs_file, smp_file, ins_file, pcf_file,
+        rthresh, hdiff, start_date, latest, verbose) where nt is the
+        hydrograph type, ins_file is 'none' to skip the ins and pcf files,
+        hdiff is None or (hdiff_sites, hdiff_pairs) for groundwater head
+        differences, start_date is a datetime object and latest is the
+        number of days from start_date to the simulation end date
+
+    Returns
+    -------
+    missing : list of str
+        simulated sites without observations
+
+    count : int
+        number of simulated values written to smp_file
+
+    '''
+    import os
+    import numpy as np
+    from scipy.interpolate import interp1d
+    import iwfm as iwfm
+    import iwfm.calib as calib
+
+    (nt, hyd_file, sim_sites, obs_file, smp_file, ins_file, pcf_file,
+     rthresh, hdiff, start_date, latest, verbose) = task
+
+    if verbose: print(f'\n  Processing {nt.lower()} hydrographs')
+    sim_days, sim_hyd = calib.sim_hyd_array(hyd_file, start_date)      # read simulated hydrograph values into an array
+    if verbose: print(f'    Read {sim_hyd.shape[1]} simulated {nt.lower()} hydrographs')
+
+    # -- interpolation plan from the observation file, reused while the observation
+    # -- file and the simulated dates and sites are unchanged
+    plan_file = obs_file + '.plan.npz'
+    obs_stat = os.stat(obs_file)
+    stamp = [obs_stat.st_size, obs_stat.st_mtime_ns, latest]
+    plan = calib.obs_plan.load(plan_file, stamp)
+    if plan is None or not plan.matches(sim_days, sim_sites):
+        obs_sites, obs_data = calib.get_obs_hyd(obs_file, start_date)   # get the observation sites and dates
+        plan = calib.obs_plan(sim_days, sim_sites, obs_data, latest)
+        try:
+            plan.save(plan_file, stamp)
+        except OSError:
+            pass
+        if verbose: print(f'    Built interpolation plan for {plan.n_obs:,} observations')
+    elif verbose: print(f'    Read interpolation plan for {plan.n_obs:,} observations from {plan_file}')
+
+    # -- interpolate simulated values to observation dates and put into smp-, ins- and pcf-format strings
+    group = nt.lower().replace(' ', '_')
+    sim_vals = plan.values(sim_hyd)
+    smp_out = plan.smp_lines(sim_vals)
+    ins_out = plan.ins.tolist()
+    pcf_out = plan.pcf_lines(group)
+
+    if hdiff is not None:                                              # process headdiffs
+        hdiff_sites, hdiff_pairs = hdiff
+        ts_func = interp1d(sim_days, np.arange(1, len(sim_days) + 1), kind='linear')   # interpolate time step from date
+        hdiff_rows = [i for i, site in enumerate(plan.sites.tolist()) if site in hdiff_sites]
+        if len(hdiff_rows) > 0:
+            dates = [iwfm.str2datetime(d) for d in plan.dates[hdiff_rows].tolist()]
+            sites, ts = plan.sites[hdiff_rows].tolist(), plan.ts[hdiff_rows].tolist()
+
+            hdiff_data = [list(item) for item in zip(sites, dates, sim_vals[hdiff_rows].tolist(), ts)]
+            smp, ins = calib.headdiff_hyds(hdiff_pairs, hdiff_data, rthresh, ts_func, start_date, verbose)
+            smp_out.extend(smp)                                        # add smp string list to smp_out list
+            ins_out.extend(ins)                                        # add ins string list to ins_out list
+
+            # -- observed head differences for the pcf file
+            hdiff_data = [list(item) for item in zip(sites, dates, plan.observed[hdiff_rows].tolist(), ts)]
+            smp, ins = calib.headdiff_hyds(hdiff_pairs, hdiff_data, rthresh, ts_func, start_date)
+            pcf_out.extend(f'{ins_line[5:ins_line.index("]")]:<24} {smp_line.split()[-1]:>16} 1.0  headdiffs'
+                           for smp_line, ins_line in zip(smp, ins))
+
+    # -- write smp file ----------------------------------------------------------------
+    with open(smp_file, 'w') as f:
+        f.write(''.join(f'{item}\n' for item in smp_out))
+    if verbose: print(f'    Wrote {len(smp_out):,} simulated {nt.lower()} values to {smp_file}')
+
+    # -- write ins and pcf files -------------------------------------------------------
+    if ins_file.lower()[0] != 'n':
+        with open(ins_file, 'w') as f:
+            f.write('pif #\n' + ''.join(f'{item}\n' for item in ins_out))
+        if verbose: print(f'    Wrote instrutions to {ins_file}')
+
+        with open(pcf_file, 'w') as f:
+            f.write('* observation data\n' + ''.join(f'{item}\n' for item in pcf_out))
+        if verbose: print(f'    Wrote observation data to {pcf_file}')
+
+    return plan.missing, len(smp_out)
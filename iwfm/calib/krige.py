@@ -1,6 +1,6 @@
 # krige.py 
-# Perform spatial interpolation from grid A to grid B using kriging factors.
-# Copyright (C) 2020-2023 University of California
+# Ordinary and simple kriging factors from grid B (pilot points) to grid A (nodes)
+# Copyright (C) 2020-2024 University of California
 # -----------------------------------------------------------------------------
 # This information is free; you can redistribute it and/or modify it
 # under the terms of the GNU General Public License as published by
@@ -16,71 +16,218 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 # -----------------------------------------------------------------------------
 
-def krige(A, B):
-    """ krige() - Perform spatial interpolation using kriging factors from grid A to grid B.
+def krige(A, B, vtype='spherical', a=None, sill=1.0, nugget=0.0, ang=0.0, anis=1.0,
+          max_pts=10, radius=None, kind='ordinary', mean=0.0, batch=5000, verbose=False):
+    """ krige() - Calculate kriging factors for spatial interpolation from grid B to grid A.
+        Anisotropy is applied with the GSLIB rotation matrix from setrot(), the
+        max_pts nearest points of B within radius are found with a KD-tree, and
+        the kriging systems are solved batch points at a time with numpy.
 
     Parameters
     ----------
     A : list
-        List of tuples representing grid A points. Each tuple contains (id, x, y) coordinates.
+        List of tuples representing grid A points. Each tuple contains (id, x, y) coordinates,
+        or an array of (x, y) coordinates.
     
     B : list
-        List of tuples representing grid B points. Each tuple contains (id, x, y, value) coordinates.
+        List of tuples representing grid B points. Each tuple contains (id, x, y, value) coordinates,
+        or an array of (x, y) coordinates.
+
+    vtype : str, default='spherical'
+        Variogram model, 'spherical', 'exponential' or 'gaussian'
+
+    a : float, default=None
+        Variogram range in the major direction, None for the size of grid B
+
+    sill : float, default=1.0
+        Variogram sill, not including the nugget
+
+    nugget : float, default=0.0
+        Variogram nugget
+
+    ang : float, default=0.0
+        Azimuth of the major direction, degrees clockwise from north
+
+    anis : float, default=1.0
+        Anisotropy ratio, range in the minor direction / range in the major direction
+
+    max_pts : int, default=10
+        Maximum number of B points for each A point
+
+    radius : float, default=None
+        Search radius in the major direction, None for no limit
+
+    kind : str, default='ordinary'
+        'ordinary' = weights sum to one, or 'simple' = weights with a known mean
+
+    mean : float, default=0.0
+        Mean value for simple kriging
+
+    batch : int, default=5000
+        Number of A points in each batch of kriging systems
+
+    verbose : bool, default=False
+        Turn command-line output on or off
     
     Returns
     -------
-    kriging_factors : list
-        List of lists containing kriging factor floats for spatial interpolation.
+    ppoints : numpy array
+        B points (0-indexed) for each A point, nearest first, -1 where fewer
+        than max_pts are within radius, shape (n_A, max_pts)
+
+    weights : numpy array
+        Kriging factors for each A point, 0 where ppoints is -1
+
+    offsets : numpy array
+        Value to add to the weighted sum for each A point, (1 - sum of weights) * mean
+        for simple kriging, 0 for ordinary kriging
+    """
+    import numpy as np
+    import iwfm.calib as calib
+    from scipy.spatial import cKDTree
+
+    if kind not in ('ordinary', 'simple'):
+        raise ValueError(f"kind must be 'ordinary' or 'simple', not '{kind}'")
+
+    # rotate and scale the coordinates so the variogram is isotropic
+    rotmat = np.array(calib.setrot(ang, 0.0, 0.0, anis, 1.0))[:2, :2]
+    a_xy = krige_coords(A) @ rotmat.T
+    b_xy = krige_coords(B) @ rotmat.T
+    if a is None:
+        a = float(np.hypot(*np.ptp(b_xy, axis=0))) or 1.0
+
+    k = min(max_pts, len(b_xy))
+    dist, near = cKDTree(b_xy).query(a_xy, k=k, distance_upper_bound=np.inf if radius is None else radius)
+    dist, near = dist.reshape(len(a_xy), k), near.reshape(len(a_xy), k)
+    valid = near < len(b_xy)
+
+    ordinary = kind == 'ordinary'
+    n = k + 1 if ordinary else k
+    weights = np.zeros((len(a_xy), k))
+    for start in range(0, len(a_xy), batch):
+        ok = valid[start:start + batch]
+        m = len(ok)
+        pts = b_xy[np.where(ok, near[start:start + batch], 0)]
+        pair = ok[:, :, None] & ok[:, None, :]
+
+        # covariances between the B points and from the B points to the A point,
+        # with unused B points replaced by identity rows
+        lhs = np.zeros((m, n, n))
+        lhs[:, :k, :k] = np.where(pair, krige_cov(np.linalg.norm(pts[:, :, None, :] - pts[:, None, :, :], axis=-1),
+                                                  vtype, a, sill, nugget), np.eye(k))
+        rhs = np.zeros((m, n))
+        rhs[:, :k] = np.where(ok, krige_cov(np.where(ok, dist[start:start + batch], 0.0), vtype, a, sill, nugget), 0.0)
+        if ordinary:
+            lhs[:, :k, k] = lhs[:, k, :k] = ok
+            lhs[:, k, k] = ~ok.any(axis=1)                  # no B points within radius
+            rhs[:, k] = ok.any(axis=1)
+
+        weights[start:start + m] = np.linalg.solve(lhs, rhs[:, :, None])[:, :k, 0]
+
+    weights = np.where(valid, weights, 0.0)
+    offsets = np.zeros(len(a_xy)) if ordinary else (1.0 - weights.sum(axis=1)) * mean
+
+    if verbose: print(f' Kriged {len(a_xy):,} points from up to {k} of {len(b_xy):,} points each')
+
+    return np.where(valid, near, -1), weights, offsets
+
+
+def krige_cov(h, vtype, a, sill, nugget):
+    """ krige_cov() - Covariance at (isotropic) lag distance h for a variogram model.
+
+    Parameters
+    ----------
+    h : numpy array
+        Lag distances
+
+    vtype : str
+        Variogram model, 'spherical', 'exponential' or 'gaussian'
+
+    a : float
+        Variogram range, the practical range for 'exponential' and 'gaussian'
+
+    sill : float
+        Variogram sill, not including the nugget
+
+    nugget : float
+        Variogram nugget
+
+    Returns
+    -------
+    cov : numpy array
+        Covariance, nugget + sill at h = 0
     """
     import numpy as np
-    from scipy.spatial.distance import cdist
-
-    kriging_factors = []
-
-    for a_id, ax, ay in A:
-        # Calculate the distances from each point in B to all points in A
-        distances = cdist([(ax, ay)], [(bx, by) for _, bx, by, _ in B])
-        
-        # Compute kriging factors (inverse distance weights) for each point in A
-        weights = 1 / distances
-        
-        # Normalize the weights to sum up to 1
-        normalized_weights = weights / np.sum(weights)
-        
-        # Append the kriging factors for the current point in B to the list
-        kriging_factors.append(normalized_weights.tolist()[0])
-    print(len(kriging_factors))
-    return kriging_factors
-
-
-# Sample data for grid A
-new_points = [
-    (1, 1.0, 2.0),
-    (2, 2.0, 3.0),
-    (3, 5.0, 4.0),
-    (4, 6.0, 7.0),
-    (5, 10.0, 4.0),
-    (6, 6.0, 3.0),
-    (7, 8.0, 1.0),
-]
-
-# Sample data for grid B
-base_points = [
-    (1, 2.0, 1.0, 80.0),
-    (2, 3.0, 3.0, 120.0),
-    (3, 4.0, 6.0, 85.0),
-    (4, 5.0, 10.0, 40.0),
-    (5, 7.0, 8.0, 50.0),
-    (6, 8.0, 6.0, 55.0),
-    (7, 10.0, 6.0, 80.0),
-    (8, 7.0, 3.0, 50.0),
-    (9, 5.0, 1.0, 120.0),
-    (10, 9.0, 1.0, 55.0),
-]
+
+    r = np.asarray(h, dtype=float) / a
+    if vtype == 'spherical':
+        gamma = np.where(r < 1.0, 1.5 * r - 0.5 * r ** 3, 1.0)
+    elif vtype == 'exponential':
+        gamma = 1.0 - np.exp(-3.0 * r)
+    elif vtype == 'gaussian':
+        gamma = 1.0 - np.exp(-3.0 * r ** 2)
+    else:
+        raise ValueError(f"vtype must be 'spherical', 'exponential' or 'gaussian', not '{vtype}'")
+    return sill * (1.0 - gamma) + np.where(r == 0, nugget, 0.0)
+
+
+def krige_coords(points):
+    """ krige_coords() - (x, y) coordinates from a list of (id, x, y, ...) tuples or
+        an array of (x, y) coordinates, as an (n, 2) numpy array"""
+    import numpy as np
+
+    if len(points) == 0:
+        return np.zeros((0, 2))
+    points = np.asarray([p[:3] if len(p) > 2 else p for p in points], dtype=float)
+    return points[:, -2:]
 
 
 if __name__ == '__main__':
+    ''' Run krige() from command line to write a factors file for fac2iwfm '''
+
+    import sys
+    import iwfm as iwfm
+    import iwfm.debug as idb
+    from iwfm.calib.ppk2fac import read_pp_file, write_factors
+
+    verbose = True
+
+    if len(sys.argv) > 1:  # arguments are listed on the command line
+        pp_file          = sys.argv[1]
+        node_file        = sys.argv[2]
+        factors_outfile  = sys.argv[3]
+        vtype            = sys.argv[4]
+        a                = float(sys.argv[5])
+        max_pts          = int(sys.argv[6])
+        ang              = float(sys.argv[7]) if len(sys.argv) > 7 else 0.0
+        anis             = float(sys.argv[8]) if len(sys.argv) > 8 else 1.0
+
+    else:  # ask for file names from command lline
+        pp_file          = input('Pilot points file name: ')
+        node_file        = input('IWFM Node.dat file name: ')
+        factors_outfile  = input('Factors output file name: ')
+        vtype            = input('Variogram type (spherical, exponential or gaussian): ')
+        a                = float(input('Variogram range: '))
+        max_pts          = int(input('Maximum number of pilot points for each node: '))
+        ang              = float(input('Azimuth of major direction: '))
+        anis             = float(input('Anisotropy ratio (minor / major range): '))
+
+    iwfm.file_test(pp_file)
+    iwfm.file_test(node_file)
+
+    idb.exe_time()  # initialize timer
+
+    pp_coord, pp_list = read_pp_file(pp_file, verbose=verbose)
+    if verbose: print(f'\n Read {len(pp_list):,} pilot points from {pp_file}')
+
+    node_coord, node_list = iwfm.read_nodes(node_file)
+    if verbose: print(f' Read {len(node_list):,} nodes from {node_file}')
+
+    ppoints, weights, offsets = krige(node_coord, pp_coord, vtype=vtype, a=a, ang=ang, anis=anis,
+                                      max_pts=max_pts, verbose=verbose)
+
+    count = write_factors(factors_outfile, pp_file, pp_list, node_list, ppoints, weights,
+                          verbose=verbose, offsets=offsets)
+    if verbose: print(f' Wrote {count:,} factors to {factors_outfile}\n')
 
-    # Perform kriging interpolation
-    krige_factors = krige(new_points, base_points)
-    print(krige_factors)
+    idb.exe_time()  # print elapsed time
@@ -0,0 +1,201 @@
+# obs_plan.py
+# Precomputed interpolation of simulated hydrographs to observation times
+# Copyright (C) 2020-2024 University of California
+#-----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#-----------------------------------------------------------------------------
+
+
+def sim_hyd_array(file_name, start_date):
+    ''' sim_hyd_array() - Read an IWFM hydrograph output file into a numpy
+        array with read_hyd_array()
+
+    Parameters
+    ----------
+    file_name : str
+        simulation hydrograph file name
+
+    start_date : datetime object
+        simulation start date
+
+    Returns
+    -------
+    sim_days : numpy array
+        days since start_date of each time step
+
+    sim_hyd : numpy array
+        simulated values, shape (n_times, n_hydrographs)
+
+    '''
+    import numpy as np
+    import iwfm as iwfm
+
+    sim_hyd, dates, hyd_names = iwfm.read_hyd_array(file_name)
+    sim_days = (dates - np.datetime64(start_date.date(), 'D')).astype(int)
+    return sim_days, sim_hyd
+
+
+class obs_plan:
+    ''' obs_plan - Interpolation of simulated hydrographs to observation
+        sites and times, built once from the observation smp file and the
+        simulated dates and sites. Each observation row of a sparse matrix
+        holds the linear interpolation weights of the two simulated time
+        steps that bracket the observation date, so the simulated
+        equivalents of all observations are one sparse matrix-vector
+        product with the (n_times, n_sites) simulated hydrograph array.
+        The smp line prefixes and instruction file lines are also built
+        once.
+
+    Parameters
+    ----------
+    sim_days : list or numpy array
+        days since simulation start of each simulated time step
+
+    sim_sites : list of str
+        simulated hydrograph names, in column order
+
+    obs_data : list
+        [site name, days since start, date as datetime object, observed
+        value] for each observation, as returned by get_obs_hyd()
+
+    latest : int
+        days from simulation start to simulation end, later observations
+        are skipped
+
+    '''
+
+    def __init__(self, sim_days, sim_sites, obs_data, latest=None):
+        import numpy as np
+        from scipy.sparse import csr_matrix
+        import iwfm as iwfm
+
+        if sim_days is None:  # empty plan for load()
+            return
+
+        self.sim_days = np.asarray(sim_days, dtype=float)
+        self.sim_sites = list(sim_sites)
+        n_times, n_sites = len(self.sim_days), len(self.sim_sites)
+        if latest is None:
+            latest = self.sim_days[-1]
+
+        # -- observations at simulated sites within the simulation period
+        cols = {site: i for i, site in enumerate(self.sim_sites)}
+        obs_sites = {o[0] for o in obs_data}
+        self.missing = [site for site in self.sim_sites if site not in obs_sites]   # sim sites without observations
+        obs = sorted(obs_data, key=lambda l: (l[0], l[1]))             # sort by site then by date
+        obs = [o for o in obs if o[0] in cols and self.sim_days[0] <= o[1] < latest]
+
+        self.sites = np.array([o[0] for o in obs], dtype=str)
+        self.dates = np.array([o[2].strftime('%m/%d/%Y') for o in obs], dtype=str)
+        days = np.array([o[1] for o in obs], dtype=float)
+        self.observed = np.array([o[3] if len(o) > 3 else np.nan for o in obs], dtype=float)
+        col = np.array([cols[o[0]] for o in obs], dtype=int)
+
+        # -- bracketing time steps and linear weights
+        t1 = np.clip(np.searchsorted(self.sim_days, days, side='right'), 1, n_times - 1)
+        t0 = t1 - 1
+        w1 = (days - self.sim_days[t0]) / (self.sim_days[t1] - self.sim_days[t0])
+        rows = np.arange(len(obs))
+        self.weights = csr_matrix((np.concatenate((1.0 - w1, w1)),
+                                   (np.concatenate((rows, rows)), np.concatenate((t0, t1)) * n_sites
+                                    + np.concatenate((col, col)))),
+                                  shape=(len(obs), n_times * n_sites))
+
+        # -- model time step of each observation, as ceil(interpolated step number)
+        self.ts = np.ceil(np.interp(days, self.sim_days, np.arange(1, n_times + 1))).astype(int)
+
+        self.smp_prefix = np.array([f'{iwfm.pad_back(s, 20)} {d}  0:00:00 ' for s, d in
+                                    zip(self.sites, self.dates)], dtype=str)
+        self.ins = np.array([f'L1  [{s}_{iwfm.pad_front(t, 3, "0")}]42:70' for s, t in
+                             zip(self.sites, self.ts.tolist())], dtype=str)
+
+    @property
+    def n_obs(self):
+        return self.weights.shape[0]
+
+    def matches(self, sim_days, sim_sites):
+        ''' matches() - Return True if the plan was built for these simulated
+            dates and sites'''
+        import numpy as np
+
+        return (list(sim_sites) == self.sim_sites
+                and np.array_equal(np.asarray(sim_days, dtype=float), self.sim_days))
+
+    def values(self, sim_hyd):
+        ''' values() - Return the simulated equivalent of each observation
+            from the (n_times, n_sites) simulated hydrograph array'''
+        import numpy as np
+
+        return self.weights @ np.ascontiguousarray(sim_hyd, dtype=float).ravel()
+
+    def smp_lines(self, values):
+        ''' smp_lines() - Return the smp file lines for the simulated values'''
+        import iwfm as iwfm
+
+        return [prefix + iwfm.pad_front(round(v, 3), 22)
+                for prefix, v in zip(self.smp_prefix.tolist(), values.tolist())]
+
+    def pcf_lines(self, group, weight=1.0):
+        ''' pcf_lines() - Return PEST control file observation data lines,
+            'obsnme obsval weight obgnme', for the observed values'''
+        import iwfm as iwfm
+
+        return [f'{iwfm.pad_back(ins[5:ins.index("]")], 24)} {iwfm.pad_front(round(v, 6), 16)} {weight}  {group}'
+                for ins, v in zip(self.ins.tolist(), self.observed.tolist())]
+
+    def save(self, plan_file, stamp=None):
+        ''' save() - Save the plan to a numpy .npz file, with an optional
+            stamp of the observation file to compare on load. The file is
+            written under a temporary name and then renamed, so a process
+            reading it never sees a partial file'''
+        import os
+        import numpy as np
+
+        tmp_file = f'{plan_file}.{os.getpid()}.tmp'
+        with open(tmp_file, 'wb') as f:
+            np.savez(f, data=self.weights.data, indices=self.weights.indices,
+                     indptr=self.weights.indptr, shape=self.weights.shape,
+                     sim_days=self.sim_days, sim_sites=np.array(self.sim_sites, dtype=str),
+                     missing=np.array(self.missing, dtype=str), sites=self.sites, dates=self.dates,
+                     ts=self.ts, observed=self.observed, smp_prefix=self.smp_prefix, ins=self.ins,
+                     stamp=np.array([] if stamp is None else stamp, dtype=np.int64))
+        os.replace(tmp_file, plan_file)
+
+    @classmethod
+    def load(cls, plan_file, stamp=None):
+        ''' load() - Return a plan saved by save(), or None if the file does
+            not exist, cannot be read or its stamp differs from stamp'''
+        import os
+        import zipfile
+        import numpy as np
+        from scipy.sparse import csr_matrix
+
+        if not os.path.isfile(plan_file):
+            return None
+        try:
+            with np.load(plan_file) as f:
+                if 'observed' not in f.files:                              # older plan file
+                    return None
+                if stamp is not None and not np.array_equal(f['stamp'], np.asarray(stamp, dtype=np.int64)):
+                    return None
+                plan = cls(None, None, None)
+                plan.weights = csr_matrix((f['data'], f['indices'], f['indptr']), shape=tuple(f['shape']))
+                plan.sim_days = f['sim_days']
+                plan.sim_sites = f['sim_sites'].tolist()
+                plan.missing = f['missing'].tolist()
+                for name in ['sites', 'dates', 'ts', 'observed', 'smp_prefix', 'ins']:
+                    setattr(plan, name, f[name])
+        except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
+            return None                                                    # rebuilt by the caller
+        return plan
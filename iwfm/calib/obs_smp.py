@@ -41,20 +41,20 @@ def obs_smp(obs_lines,sim_sites):
         observation sites not used in simulation
 
     '''
-    from datetime import date, datetime
-
-    missing, obs_data, obs_sites = [], [], []
-    for line in obs_lines:
-        item = line.split()
-        if item[0] in sim_sites:
-            date_text = item[1].split('/')
-            obs_data.append([item[0],date(int(date_text[2]),int(date_text[0]),int(date_text[1])),item[1]])
-            if item[0] not in obs_sites:
-                obs_sites.append(item[0])
-        else:
-            if item[0] not in missing:
-                missing.append(item[0])
-    obs_data.sort( key = lambda l: (l[0], l[1]))
+    import numpy as np
+    import iwfm.calib as calib
+
+    store = calib.smp_store.from_lines(obs_lines)
+    in_both, missing, sim_only = store.join(sim_sites)
+
+    # -- records of sites in sim_sites, already sorted by site then date
+    keep = np.isin(store.site_code, [store.lookup[site] for site in in_both])
+    obs_data = [list(item) for item in zip(store.sites[store.site_code[keep]].tolist(),
+                                           store.dates[keep].astype(object).tolist(),
+                                           store.date_text[keep].tolist())]
+
+    sim_set = set(in_both)
+    obs_sites = [site for site in store.sites_in_file_order() if site in sim_set]
     obs_sites.sort( key = lambda l: (l[0]))
     #print(f'    {len(obs_sites)} sites in both simulation and observation sets')
     return obs_data, obs_sites, missing
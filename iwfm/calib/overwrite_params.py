@@ -0,0 +1,216 @@
+# overwrite_params.py
+# Python class for IWFM-2015 parameter overwrite files as numpy arrays
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+class overwrite_params:
+    ''' overwrite_params - IWFM-2015 parameter overwrite file read once into
+        node, layer and parameter arrays, with the comment blocks of the
+        template kept to write new overwrite files, one realization at a
+        time or an ensemble from a process pool.
+
+    Parameters
+    ----------
+    overwrite_file : str, default=None
+        existing (template) overwrite file name, None for an empty object,
+        see from_lines()
+
+    '''
+
+    param_types = ['PKH', 'PS', 'PN', 'PV', 'PL', 'SCE', 'SCI']
+
+    # output format of the node, layer and parameter values of one row
+    row_format = '\t%d\t%d\t%.4f\t%.3E\t%.3f\t%.3E\t%.4f\t%.3E\t%.3E\n'
+
+    def __init__(self, overwrite_file=None):
+        import iwfm as iwfm
+
+        if overwrite_file is not None:
+            iwfm.file_test(overwrite_file)
+            self.read_lines(open(overwrite_file).read().splitlines())
+
+    @classmethod
+    def from_lines(cls, in_lines):
+        ''' from_lines() - Overwrite parameters from the lines of an overwrite file'''
+        params = cls()
+        params.read_lines(in_lines)
+        return params
+
+    def read_lines(self, in_lines):
+        ''' read_lines() - Split the lines of an overwrite file into the
+            comment blocks, header values and parameter arrays'''
+        import numpy as np
+
+        line_index, self.blocks = 0, []
+
+        line_index = self.read_block(in_lines, line_index)           # comment lines
+        self.nwrite = int(in_lines[line_index].split()[0])           # no. of parameter lines
+        line_index += 1
+
+        line_index = self.read_block(in_lines, line_index)
+        self.factors = in_lines[line_index].split()[:7]              # scaling factors
+        line_index += 1
+
+        line_index = self.read_block(in_lines, line_index)
+        self.ctime = in_lines[line_index].split()[0]                 # TUNITKH
+        self.tunit_lines = in_lines[line_index + 1:line_index + 3]   # remaining DSS time units
+        line_index += 3
+
+        line_index = self.read_block(in_lines, line_index)
+        end = line_index
+        while end < len(in_lines) and len(in_lines[end].strip()) > 0 and in_lines[end][0] != 'C':
+            end += 1
+        rows = np.zeros((0, 9))
+        if end > line_index:
+            rows = np.loadtxt(in_lines[line_index:end], usecols=range(9), ndmin=2)
+
+        self.nodes = rows[:, 0].astype(int)
+        self.layers = rows[:, 1].astype(int)
+        self.values = rows[:, 2:]
+
+    def read_block(self, in_lines, line_index):
+        ''' read_block() - Keep the comment lines starting at line_index as
+            one block of text, and return the index of the next line'''
+        start = line_index
+        while line_index < len(in_lines) and in_lines[line_index][:1] == 'C':
+            line_index += 1
+        self.blocks.append(''.join(f'{line}\n' for line in in_lines[start:line_index]))
+        return line_index
+
+    @property
+    def nlay(self):
+        return int(self.layers.max()) if len(self.layers) > 0 else 0
+
+    def write(self, overwrite_file, values=None, nodes=None, layers=None, factors=None, ctime=None,
+              chunk=10000):
+        ''' write() - Write an overwrite file with the comment blocks of the
+            template and new parameter values, values that are not positive
+            are written as -1
+
+        Parameters
+        ----------
+        overwrite_file : str
+            output overwrite file name
+
+        values : array-like, default=None
+            parameter values, shape (rows, 7), rows for each node and then
+            each layer, None for the template values
+
+        nodes : array-like, default=None
+            node number of each row, None for the template node numbers
+
+        layers : array-like, default=None
+            layer number of each row, None for the template layer numbers
+
+        factors : list, default=None
+            seven multiplication factors, None for the template factors
+
+        ctime : str, default=None
+            time step in DSS format, None for the template time step
+
+        chunk : int, default=10000
+            number of rows formatted at a time
+
+        Returns
+        -------
+        nothing
+
+        '''
+        import numpy as np
+
+        values = self.values if values is None else np.asarray(values, dtype=float).reshape(-1, 7)
+        nodes = self.nodes if nodes is None else np.asarray(nodes)
+        layers = self.layers if layers is None else np.asarray(layers)
+        factors = self.factors if factors is None else factors
+        ctime = self.ctime if ctime is None else ctime
+
+        rows = np.column_stack([nodes, layers, np.where(values > 0, values, -1)])
+
+        with open(overwrite_file, 'w') as f:
+            f.write(self.blocks[0])
+            f.write(f'    {len(rows)}                       / NWRITE\n')
+            f.write(self.blocks[1])
+            f.write(''.join(f'\t{fp}' for fp in factors) + '\n')
+            f.write(self.blocks[2])
+            f.write(f'    {ctime}               / TUNITKH\n')
+            f.write(''.join(f'{line}\n' for line in self.tunit_lines))
+            f.write(self.blocks[3])
+
+            # one format operation for each chunk of rows
+            for start in range(0, len(rows), chunk):
+                block = rows[start:start + chunk]
+                f.write((self.row_format * len(block)) % tuple(block.ravel().tolist()))
+
+    def write_ensemble(self, overwrite_files, ensemble, factors=None, ctime=None, workers=None):
+        ''' write_ensemble() - Write one overwrite file for each realization
+            of an ensemble, with the template shared by the processes of a
+            pool
+
+        Parameters
+        ----------
+        overwrite_files : list of str
+            output overwrite file names, one for each realization
+
+        ensemble : array-like
+            parameter values, shape (realizations, rows, 7)
+
+        factors : list, default=None
+            seven multiplication factors, None for the template factors
+
+        ctime : str, default=None
+            time step in DSS format, None for the template time step
+
+        workers : int, default=None
+            number of processes, None for the number of CPUs, 1 to write
+            the files in turn
+
+        Returns
+        -------
+        count : int
+            number of files written
+
+        '''
+        import multiprocessing as mp
+
+        tasks = ((out_file, values, factors, ctime) for out_file, values in zip(overwrite_files, ensemble))
+        if workers == 1:
+            for out_file, values, factors, ctime in tasks:
+                self.write(out_file, values, factors=factors, ctime=ctime)
+            return len(overwrite_files)
+
+        with mp.Pool(workers, initializer=init_worker, initargs=(self,)) as pool:
+            for _ in pool.imap_unordered(write_realization, tasks):
+                pass
+        return len(overwrite_files)
+
+
+# template of each pool process, set once by init_worker()
+worker_params = None
+
+
+def init_worker(params):
+    ''' init_worker() - Keep the overwrite_params template in a pool process'''
+    global worker_params
+    worker_params = params
+
+
+def write_realization(task):
+    ''' write_realization() - Write one realization with the template of
+        this pool process, task = (file name, values, factors, ctime)'''
+    out_file, values, factors, ctime = task
+    worker_params.write(out_file, values, factors=factors, ctime=ctime)
+    return out_file
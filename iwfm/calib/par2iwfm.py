@@ -37,18 +37,13 @@ def par2iwfm(A, B):
     import numpy as np
 
     #  get krige factors and base set values
-    krige_factors = calib.krige(A, B)
-    values = [val for _, _, _, val in B]
+    ppoints, weights, offsets = calib.krige(A, B)
+    values = np.array([val for _, _, _, val in B])
   
-    #  convert to numpy arrays for computation
-    first_array = np.array(values)
-    second_array = np.array(krige_factors)
-    
-    #  Element-wise matrix multiplication
-    a_value_array = first_array * second_array
-    a_values = [np.sum(array) for array in a_value_array]
+    #  weighted sum of the base set values for each point in A
+    a_values = (values[ppoints] * weights).sum(axis=1) + offsets
 
-    return a_values
+    return a_values.tolist()
 
 # Sample data for grid A
 new_set = [
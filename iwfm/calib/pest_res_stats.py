@@ -18,15 +18,27 @@
 
 
 
-def pest_res_stats(pest_res_file, verbose=False):
-    ''' pest_res_stats() - Read a PEST .res file, and print a text file with the 
-    RMSE and bias of each observation site
+def pest_res_stats(pest_res_file, by='site', period=None, format='txt', verbose=False):
+    ''' pest_res_stats() - Read a PEST .res file, and write a file with the 
+    number, mean, bias, RMSE, standard deviation and Nash-Sutcliffe efficiency
+    of each observation site or group, optionally for each time period
   
     Parameters
     ----------
     pest_res_file : string
         name of PEST .res file
 
+    by : str, default = 'site'
+        'site' = statistics for each observation site, 'group' = for each
+        observation group
+
+    period : str, default = None
+        None, or 'year', 'water_year', 'season' or 'month' for statistics of
+        each site or group in each time period, see res_period()
+
+    format : str, default = 'txt'
+        output file format, 'txt', 'csv' or 'json'
+
     verbose : bool, default = False
         If True, print additional information to the screen
 
@@ -35,73 +47,32 @@ def pest_res_stats(pest_res_file, verbose=False):
     nothing
 
     '''
-    import numpy as np
-    import iwfm as iwfm
+    import iwfm.calib as calib
 
-    # read pest results file
-    pest_res = open(pest_res_file).read().splitlines()
-    
-    header = pest_res.pop(0)                 # remove the first line
-
-    # use list comprehension to split each line of pest_res
-    pest_res = [line.split() for line in pest_res]
-
-    # observation names have the format 'station_MMYYYY'
-    # split first item into observation and date on '_', and append date to end
-    for i in range(0, len(pest_res)):
-        obs_name, obs_date = pest_res[i][0].split('_')
-        pest_res[i][0] = obs_name
-        pest_res[i].append(obs_date)
-
-    names = list(set([x[0] for x in pest_res]))    # list of all different values of pest_res[0]
-
-    obs = []
-    for name in names:
-        obs.append([name,0,0,0,0,0,''])  # name, n, mean, bias, rmse, stdev, group
-
-    # cycle through pest_res and accumulate values
-    for i in range(0, len(pest_res)-1):
-        for j in range(0, len(names)-1):
-            if pest_res[i][0] == names[j]:                          # name
-                obs[j][1] += 1                                      # n
-                obs[j][2] += float(pest_res[i][2])                  # mean accumulator
-                obs[j][3] += float(pest_res[i][3])                  # bias accumulator
-                obs[j][4] += (float(pest_res[i][3]))**2             # rmse accumulator
-                obs[j][6] =  pest_res[i][1]                         # group
-                
-    # calculate mean, bias, rmse
-    for i in range(0, len(obs)):
-        if obs[i][1] > 0:
-            obs[i][2] = obs[i][2]/obs[i][1]                             # mean
-            obs[i][3] = obs[i][3]/obs[i][1]                             # bias
-            obs[i][4] = np.sqrt(obs[i][4]/obs[i][1])                    # rmse
-        else:
-            obs[i][2] = -999                                            # mean
-            obs[i][3] = -999                                            # bias
-            obs[i][4] = -999                                            # rmse
-
-    # cycle through pest_res and calculate stdev
-    for i in range(0, len(pest_res)-1):
-        for j in range(0, len(names)-1):
-            if pest_res[i][0] == names[j]:                          # name
-                obs[j][5] += (float(pest_res[i][2])-obs[j][2])**2   # stdev accumulator
-    for i in range(0, len(obs)):
-        if obs[i][1] > 1:
-            obs[i][5] = np.sqrt(obs[i][5]/(obs[i][1]-1))                # stdev
-        else:
-            obs[i][5] = -999
-
-    # sort obs on [6] then [1]
-    obs.sort(key=lambda x: (x[1],x[6]))
+    # read pest results file, observation names have the format 'station_MMYYYY'
+    res = calib.read_pest_res(pest_res_file)
+    if verbose: print(f'  Read {len(res["site"]):,} residuals from {pest_res_file}')
+
+    keys, key_names = res[by], ('Name',) if by == 'site' else ('Group',)
+    if period is not None:
+        keys, key_names = (keys, calib.res_period(res['date'], period)), key_names + ('Period',)
+
+    group_keys, stats = calib.res_group_stats(keys, res['modelled'], res['measured'])
+
+    # group of each site, sort on N then group
+    site_group = dict(zip(res['site'].tolist(), res['group'].tolist()))
+    name = [k[0] if isinstance(k, tuple) else k for k in group_keys]
+    groups = [site_group[k] for k in name] if by == 'site' else name
+    order = sorted(range(len(group_keys)), key=lambda i: (stats['n'][i], groups[i]))
+    group_keys = [group_keys[i] for i in order]
+    stats = {s: v[order] for s, v in stats.items()}
+    extra = {'Group': [groups[i] for i in order]} if by == 'site' else None
 
     # write out results
-    out_file = pest_res_file.replace('.res','_stats.out')
+    ext = {'txt': '.out', 'csv': '.csv', 'json': '.json'}[format]
+    out_file = pest_res_file.replace('.res', '_stats' + ('' if period is None else '_' + period) + ext)
     print(f'  Writing {out_file}')
-    with open(out_file,"w") as of:
-        of.write(f'Name\tN\tMean\tBias\tRMSE\tStdev\tGroup\n')
-        for i in range(0, len(obs)):
-            of.write(f'{obs[i][0]}\t{obs[i][1]}\t{obs[i][2]:.2f}\t{obs[i][3]:.2f}\t{obs[i][4]:.2f}\t{obs[i][5]:.2f}\t{obs[i][6]}\n')
-
+    calib.write_res_stats(out_file, group_keys, stats, key_names=key_names, extra=extra, format=format)
 
 if __name__ == "__main__":
     import sys
@@ -110,14 +81,17 @@ if __name__ == "__main__":
 
     if len(sys.argv) > 1:  # arguments are listed on the command line
         pest_res_file = sys.argv[1]
+        by = sys.argv[2] if len(sys.argv) > 2 else 'site'
+        period = sys.argv[3] if len(sys.argv) > 3 else None
     else:                  # ask for file names from terminal
         pest_res_file   = input("  PEST results file name (*.res): ")
+        by, period = 'site', None
 
     iwfm.file_test(pest_res_file)    # test that the input files exist
 
     idb.exe_time()                   # initialize timer
 
-    pest_res_stats(pest_res_file)
+    pest_res_stats(pest_res_file, by=by, period=period)
 
     idb.exe_time()                   # print elapsed time
 
@@ -1,7 +1,7 @@
 # ppk2fac.py
 # Use inverse-distance weighting to calculate factors to translate parameter values 
 # from pilot points to model nodes, and write to a file for use by PEST.
-# Copyright (C) 2020-2023 University of California
+# Copyright (C) 2020-2024 University of California
 # -----------------------------------------------------------------------------
 # This information is free; you can redistribute it and/or modify it
 # under the terms of the GNU General Public License as published by
@@ -55,9 +55,12 @@ def read_pp_file(pp_file, verbose=False):
     return pp_coord, pp_list
 
 
-def par2fac_idw2(pp_coord, node_coord, n_ppoints=3, min_ppoints=3, max_ppoints=10, verbose=False):
+def par2fac_idw2(pp_coord, node_coord, n_ppoints=3, min_ppoints=3, max_ppoints=10,
+                 pp_zones=None, node_zones=None, workers=None, verbose=False):
     ''' par2fac() - Calculate inverse-distance-squared weighting factors between nodes and
-                    n_ppoints pilot points.
+                    n_ppoints pilot points. A KD-tree of the pilot points is built once
+                    and the n_ppoints nearest pilot points of all nodes are found in one
+                    query, so the cost is O(nodes * log(pilot points)).
     
     Parameters
     ----------
@@ -76,16 +79,25 @@ def par2fac_idw2(pp_coord, node_coord, n_ppoints=3, min_ppoints=3, max_ppoints=1
     max_ppoints : int; default = 10
         Maximum number of pilot points for interpolation.
 
+    pp_zones : list; default = None
+        Parameter zone of each pilot point, None for one zone
+
+    node_zones : list; default = None
+        Parameter zone of each node, nodes use pilot points in the same zone only
+
+    workers : int; default = None
+        Number of processes for the zones, None or 1 to process them in turn
+
     verbose : bool, default=False
         Turn command-line output on or off
 
     Returns
     -------
-    ppoints : list
-        List of pilot points for each node (0-indexed).
+    ppoints : numpy array
+        Pilot points for each node (0-indexed), shape (n_nodes, n_ppoints)
 
-    weights : list
-        List of normalized pilot point weights for each node.
+    weights : numpy array
+        Normalized pilot point weights for each node, shape (n_nodes, n_ppoints)
     '''
 
     import numpy as np
@@ -97,31 +109,96 @@ def par2fac_idw2(pp_coord, node_coord, n_ppoints=3, min_ppoints=3, max_ppoints=1
         print(f'  Exiting...')
         sys.exit()
 
-    ppoints, weights = [], []
-    for node in node_coord:
-        #  calculate distance from node to each pilot point
-        dist = np.sqrt((pp_coord[:, 0] - node[0]) ** 2 + (pp_coord[:, 1] - node[1]) ** 2)
+    pp_coord = np.asarray(pp_coord, dtype=float).reshape(-1, 2)
+    node_coord = np.asarray(node_coord, dtype=float).reshape(-1, 2)
+
+    if pp_zones is None or node_zones is None:
+        tasks = [(pp_coord, np.arange(len(pp_coord)), node_coord, n_ppoints)]
+        node_index = [np.arange(len(node_coord))]
+    else:
+        pp_zones, node_zones = np.asarray(pp_zones), np.asarray(node_zones)
+        tasks, node_index = [], []
+        for zone in np.unique(node_zones):
+            pp_index = np.flatnonzero(pp_zones == zone)
+            nodes = np.flatnonzero(node_zones == zone)
+            tasks.append((pp_coord[pp_index], pp_index, node_coord[nodes], n_ppoints))
+            node_index.append(nodes)
+
+    for task in tasks:
+        if len(task[0]) < n_ppoints:
+            print(f'  Error: n_ppoints = {n_ppoints} but a zone has only {len(task[0])} pilot points')
+            print(f'  Exiting...')
+            sys.exit()
+
+    if workers is not None and workers > 1 and len(tasks) > 1:
+        import multiprocessing as mp
+        with mp.Pool(min(workers, len(tasks))) as pool:
+            results = pool.map(idw2_factors, tasks)
+    else:
+        results = [idw2_factors(task) for task in tasks]
+
+    ppoints = np.zeros((len(node_coord), n_ppoints), dtype=int)
+    weights = np.zeros((len(node_coord), n_ppoints))
+    for nodes, (pp, wgt) in zip(node_index, results):
+        ppoints[nodes], weights[nodes] = pp, wgt
+
+    if verbose: print(f' Calculated factors for {len(node_coord):,} nodes from {n_ppoints} pilot points each')
 
-        dist_sort = np.sort(dist)                           # sort by distance
-        dist_sort_index = np.argsort(dist)                  # get indices of sorted distances
+    return ppoints, weights
 
-        pp, wgt, wgt_sum = [], [], 0
-        for n in range(n_ppoints):
-            pp.append(dist_sort_index[n])                   # pilot point
-            wgt.append(1 / dist_sort[n] ** 2)               # inverse distance squared weighting factor
-            wgt_sum += wgt[n]                               # sum of weighting factors
 
-        for n in range(n_ppoints):
-            wgt[n] /= wgt_sum                               # normalize weighting factors
+def idw2_factors(task):
+    ''' idw2_factors() - Find the nearest pilot points and inverse-distance-squared
+                    weights for a set of nodes, as a top-level function for
+                    multiprocessing.
+    
+    Parameters
+    ----------
+    task : tuple
+        (pilot point coordinates, pilot point numbers (0-indexed), nodal
+        coordinates, number of pilot points for interpolation)
 
-        ppoints.append(pp)                                  # assemble pilot points
-        weights.append(wgt)                                 # assemble weights
+    Returns
+    -------
+    ppoints : numpy array
+        Pilot point numbers for each node, nearest first
 
-    return ppoints, weights
+    weights : numpy array
+        Normalized pilot point weights for each node
+    '''
+    import numpy as np
+    from scipy.spatial import cKDTree
+
+    pp_coord, pp_index, node_coord, n_ppoints = task
+
+    tree = cKDTree(pp_coord)
+    near = tree.query(node_coord, k=n_ppoints)[1].reshape(len(node_coord), n_ppoints)
+
+    #  distance from node to each of its pilot points
+    dist = np.sqrt((pp_coord[near, 0] - node_coord[:, [0]]) ** 2 + (pp_coord[near, 1] - node_coord[:, [1]]) ** 2)
+
+    with np.errstate(divide='ignore'):
+        wgt = 1 / dist ** 2                                 # inverse distance squared weighting factor
+    wgt_sum = np.zeros(len(node_coord))
+    for n in range(n_ppoints):
+        wgt_sum += wgt[:, n]                                # sum of weighting factors
+
+    with np.errstate(invalid='ignore'):
+        wgt = wgt / wgt_sum[:, None]                        # normalize weighting factors
 
+    #  a node on a pilot point takes the pilot point value
+    on_pp = (dist == 0).any(axis=1)
+    if on_pp.any():
+        same = dist[on_pp] == 0
+        wgt[on_pp] = same / same.sum(axis=1, keepdims=True)
 
-def write_factors(factors_outfile, pp_file, pp_list, node_list, ppoints, weights, verbose):
-    """ write_factors() - Write pilot point factors to output file (hard-wired for 3 ppoints).
+    return pp_index[near], wgt
+
+
+def write_factors(factors_outfile, pp_file, pp_list, node_list, ppoints, weights, verbose, zones=None,
+                  offsets=None):
+    """ write_factors() - Write pilot point factors to output file, with up to
+                    ppoints.shape[1] pilot points for each node.
     
     Parameters
     ----------
@@ -138,45 +215,63 @@ def write_factors(factors_outfile, pp_file, pp_list, node_list, ppoints, weights
         List of node IDs.
         
     ppoints : list
-        List of pilot points for each node.
+        List of pilot points for each node, -1 for no pilot point.
         
     weights : list
         List of pilot point weights for each node.
         
     verbose : bool, default=False
         Turn command-line output on or off
+
+    zones : list, default=None
+        Parameter zone of each node, None for zone 1
+
+    offsets : list, default=None
+        Value added to the weighted sum for each node, None for 0.0
         
     Returns
     -------
     count : int
         Number of factors written to output file.
         """
-    import iwfm as iwfm
+    import numpy as np
 
-    count = 0
+    ppoints = np.asarray(ppoints, dtype=int)
+    weights = np.asarray(weights, dtype=float)
+    if zones is None:
+        zones = np.ones(len(node_list), dtype=int)
+    if offsets is None:
+        offsets = np.zeros(len(node_list))
+    used = ppoints >= 0
+    n_used = used.sum(axis=1)
+    formats = {n: factor_format(n) for n in np.unique(n_used).tolist()}
 
     with open(factors_outfile, 'w') as f:
         f.write(f'{pp_file}\n')
-        f.write(f'{iwfm.pad_front(len(node_list),n=12)}\n')
-        f.write(f'{iwfm.pad_front(len(pp_list),n=12)}\n')
-        for i in range(len(pp_list)):
-            f.write(f'{pp_list[i]}\n')
+        f.write(f'{len(node_list):>12}\n')
+        f.write(f'{len(pp_list):>12}\n')
+        f.write(''.join(f'{pp}\n' for pp in pp_list))
 
-        for i in range(len(node_list)):
-            node = f'{iwfm.pad_front(node_list[i],n=12)}'
+        f.write(''.join(formats[n].format(node, zone, offset,
+                                          *[x for p, w, u in zip(pp, wgt, use) if u for x in (p + 1, w)])
+                        for node, zone, offset, n, pp, wgt, use in zip(
+                            list(node_list), np.asarray(zones).tolist(), np.asarray(offsets, dtype=float).tolist(),
+                            n_used.tolist(), ppoints.tolist(), weights.tolist(), used.tolist())))
 
-            pp1  = f'{iwfm.pad_front(ppoints[i][0]+1,n=11)}'
-            pp2  = f'{iwfm.pad_front(ppoints[i][1]+1,n=11)}'
-            pp3  = f'{iwfm.pad_front(ppoints[i][2]+1,n=11)}'
+    return len(node_list)
 
-            w1   = f'{iwfm.pad_front(weights[i][0],n=11)}'
-            w2   = f'{iwfm.pad_front(weights[i][1],n=11)}'
-            w3   = f'{iwfm.pad_front(weights[i][2],n=11)}'
 
-            f.write(f'{node}           1           3  0.0000000E+00{pp1} {w1}\n{pp2} {w2} {pp3} {w3}\n')
-            
-            count += 1
-    return count
+def factor_format(n_ppoints):
+    """ factor_format() - Format string for the factors of one node with n_ppoints pilot
+                    points: node line with the first pilot point and weight, and the
+                    rest on the next line"""
+    fmt = '{:>12}{:>12}' + f'{n_ppoints:>12}' + '{:15.7E}'
+    if n_ppoints > 0:
+        fmt += '{:>11} {:>11}'
+    fmt += '\n'
+    if n_ppoints > 1:
+        fmt += ' '.join(['{:>11} {:>11}'] * (n_ppoints - 1)) + '\n'
+    return fmt
 
 
 
@@ -193,11 +288,13 @@ if __name__ == '__main__':
         pp_file          = sys.argv[1]
         node_file        = sys.argv[2]
         factors_outfile  = sys.argv[3]
+        n_ppoints        = int(sys.argv[4]) if len(sys.argv) > 4 else 3
 
     else:  # ask for file names from command lline
         pp_file          = input('Pilot points file name: ')
         node_file        = input('IWFM Node.dat file name: ')
         factors_outfile  = input('Factors output file name: ')
+        n_ppoints        = int(input('Number of pilot points for each node: '))
 
     iwfm.file_test(pp_file)
     iwfm.file_test(node_file)
@@ -215,7 +312,7 @@ if __name__ == '__main__':
     if verbose: print(f' Read {len(node_list):,} nodes from {node_file}')
 
     #  determine pilot points and weights for each node
-    ppoints, weights = par2fac_idw2(pp_coord, node_coord, verbose=verbose)
+    ppoints, weights = par2fac_idw2(pp_coord, node_coord, n_ppoints=n_ppoints, verbose=verbose)
 
     #  write pilot points and factors to output file
     count = write_factors(factors_outfile, pp_file, pp_list, node_list, ppoints, weights, verbose=verbose)
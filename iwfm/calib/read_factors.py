@@ -0,0 +1,78 @@
+# read_factors.py
+# Read a pilot point factors file into a sparse matrix
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def read_factors(factors_file):
+    ''' read_factors() - Read a pilot point factors file, as written by
+        ppk2fac or krige, into a scipy CSR matrix of nodes x pilot points,
+        so nodal values for any number of pilot point value sets are one
+        sparse matrix product, see apply_factors()
+
+    Parameters
+    ----------
+    factors_file : str
+        pilot point factors file name
+
+    Returns
+    -------
+    factors : scipy.sparse.csr_matrix
+        factor of each pilot point for each node, shape (no_nodes, no_ppts)
+
+    nodes : numpy array
+        node numbers
+
+    offsets : numpy array
+        value added to the weighted sum for each node
+
+    n_used : numpy array
+        number of pilot points for each node, 0 for nodes without a value
+
+    '''
+    import numpy as np
+    from scipy.sparse import csr_matrix
+    import iwfm as iwfm
+
+    iwfm.file_test(factors_file)
+    lines = open(factors_file).read().splitlines()
+
+    no_nodes = int(lines[1])                                    # number of model nodes
+    no_ppts  = int(lines[2])                                    # number of pilot points
+
+    # the factors of a node may be on more than one line
+    tokens = ' '.join(lines[(no_ppts + 3):]).split()
+
+    # position of each node record from the pilot point count of the one before
+    start = np.zeros(no_nodes, dtype=int)
+    j = 0
+    for n in range(0, no_nodes):
+        start[n] = j
+        j += 4 + int(tokens[j + 2]) * 2
+
+    nodes = np.array([tokens[i] for i in start.tolist()], dtype=int)
+    n_used = np.array([tokens[i + 2] for i in start.tolist()], dtype=int)
+    offsets = np.array([tokens[i + 3] for i in start.tolist()], dtype=float)
+
+    # pilot point and factor positions, in file order for each node
+    indptr = np.zeros(no_nodes + 1, dtype=int)
+    np.cumsum(n_used, out=indptr[1:])
+    first = np.repeat(start + 4, n_used) + 2 * (np.arange(indptr[-1]) - np.repeat(indptr[:-1], n_used))
+    pp = np.array([tokens[i] for i in first.tolist()], dtype=int) - 1
+    weights = np.array([tokens[i + 1] for i in first.tolist()], dtype=float)
+
+    factors = csr_matrix((weights, pp, indptr), shape=(no_nodes, no_ppts))
+    return factors, nodes, offsets, n_used
@@ -0,0 +1,118 @@
+# read_obs_config.py
+# Read an iwfm2obs configuration file
+# Copyright (C) 2020-2024 University of California
+#-----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#-----------------------------------------------------------------------------
+
+
+def read_obs_config(in_file='iwfm2obs.ini'):
+    ''' read_obs_config() - Read the iwfm2obs settings from a JSON (.json),
+        YAML (.yaml or .yml) or INI-style key = value file. In an INI file
+        the general settings come before the first [section], or in an
+        [iwfm2obs] section, followed by one section for each hydrograph
+        type to process. If the file does not exist, a template is written
+        and the program stops.
+
+        sim_file = Simulation.in
+        missing_file = sim_miss.out
+        workers = 4
+
+        [groundwater]
+        obs_file = gw_obs.smp
+        smp_file = gw_temp.smp
+        ins_file = gw_temp.ins
+        rthresh = 0
+        headdiff_file = none
+
+    Parameters
+    ----------
+    in_file : str
+        configuration file name
+
+    Returns
+    -------
+    settings : dictionary
+        'sim_file', 'missing_file' and 'workers', and for each hydrograph
+        type in the file a dictionary with 'obs_file', 'smp_file',
+        'ins_file', 'pcf_file', 'rthresh' and 'headdiff_file', with keys
+        'Streams', 'Groundwater', 'Subsidence' and 'Tile drains'
+
+    '''
+    import os, sys
+    import json
+    import configparser
+
+    nametypes = {'streams': ['Streams', 'st'], 'groundwater': ['Groundwater', 'gw'],
+                 'subsidence': ['Subsidence', 'sb'], 'tile_drains': ['Tile drains', 'td']}
+
+    if not os.path.isfile(in_file):                                   # test for input file
+        print(f' Settings file \'{in_file}\' was not found in the current directory.')
+        with open(in_file, 'w') as output_file:
+            output_file.write('sim_file = Simulation.in\nmissing_file = sim_miss.out\nworkers = 0\n')
+            for name, (nt, prefix) in nametypes.items():
+                output_file.write(f'\n[{name}]\nobs_file = {prefix}_obs.smp\nsmp_file = {prefix}_temp.smp\n'
+                                  f'ins_file = {prefix}_temp.ins\nrthresh = 0\n')
+                if name == 'groundwater':
+                    output_file.write('headdiff_file = none\n')
+        print(f' Created a template \'{in_file}\' file, edit it and run again')
+        sys.exit()
+
+    ext = os.path.splitext(in_file)[1].lower()
+    if ext == '.json':
+        with open(in_file) as f:
+            config = json.load(f)
+    elif ext in ('.yaml', '.yml'):
+        import yaml
+
+        with open(in_file) as f:
+            config = yaml.safe_load(f)
+    else:
+        text = open(in_file).read()
+        first = [line.strip() for line in text.splitlines()
+                 if line.strip() and line.strip()[0] not in '#;']
+        if len(first) == 0 or first[0][0] != '[':
+            text = '[iwfm2obs]\n' + text                              # settings before the first section
+        parser = configparser.ConfigParser(inline_comment_prefixes=('#', ';'))
+        parser.read_string(text)
+        config = dict(parser['iwfm2obs']) if parser.has_section('iwfm2obs') else {}
+        for section in parser.sections():
+            if section != 'iwfm2obs':
+                config[section] = dict(parser[section])
+
+    # -- general settings and one dictionary per hydrograph type, empty
+    # -- values, such as 'ins_file =', take the default
+    config = {key.lower().replace(' ', '_').replace('-', '_'): value for key, value in config.items()
+              if value is not None and str(value).strip()}
+    settings = {'sim_file': config.get('sim_file', 'none'),
+                'missing_file': config.get('missing_file', 'sim_miss.out'),
+                'workers': int(config.get('workers', 0))}
+
+    for name, (nt, prefix) in nametypes.items():
+        if name not in config:
+            continue
+        items = {key.lower(): str(value).strip() for key, value in config[name].items()
+                 if value is not None and str(value).strip()}
+        ins_file = items.get('ins_file', 'none')
+        if ins_file.lower().startswith('n'):
+            pcf_file = ins_file
+        else:
+            pcf_file = items.get('pcf_file', ins_file[0:ins_file.find('.')] + '.pcf')   # replace 'ins' with '.pcf'
+        settings[nt] = {'obs_file': items.get('obs_file', f'{prefix}_obs.smp'),
+                        'smp_file': items.get('smp_file', f'{prefix}_temp.smp'),
+                        'ins_file': ins_file,
+                        'pcf_file': pcf_file,
+                        'rthresh': float(items.get('rthresh', 0)),
+                        'headdiff_file': items.get('headdiff_file', 'none')}
+    return settings
@@ -0,0 +1,58 @@
+# read_pest_res.py
+# Read PEST residuals into numpy arrays
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def read_pest_res(pest_res_file):
+    ''' read_pest_res() - Read a PEST .res residuals file into numpy arrays.
+        Observation names have the format 'station_MMYYYY', the station
+        is the site name and the suffix gives the date when it is six
+        digits.
+
+    Parameters
+    ----------
+    pest_res_file : str
+        name of PEST .res file
+
+    Returns
+    -------
+    res : dictionary
+        numpy arrays 'site', 'group', 'date' (datetime64[D], first of
+        the month, NaT when the name has no MMYYYY suffix), 'measured',
+        'modelled' and 'weight', one item for each observation
+
+    '''
+    import pandas as pd
+
+    df = pd.read_csv(pest_res_file, sep=r'\s+', header=0, usecols=range(6),
+                     names=['name', 'group', 'measured', 'modelled', 'residual', 'weight'],
+                     dtype={'name': str, 'group': str})
+
+    # -- split observation names into site and date on the last '_'
+    parts = df['name'].str.rsplit('_', n=1, expand=True).reindex(columns=[0, 1])
+    suffix = parts[1].fillna('')
+    has_date = suffix.str.fullmatch(r'\d{6}')
+    date_text = (suffix.str[2:6] + '-' + suffix.str[0:2] + '-01').where(has_date)
+    site = parts[0].where(parts[1].notna(), df['name'])
+
+    return {'site': site.to_numpy(dtype=str),
+            'group': df['group'].to_numpy(dtype=str),
+            'date': pd.to_datetime(date_text, format='%Y-%m-%d').to_numpy().astype('datetime64[D]'),
+            'measured': df['measured'].to_numpy(dtype=float),
+            'modelled': df['modelled'].to_numpy(dtype=float),
+            'weight': df['weight'].to_numpy(dtype=float)}
+
@@ -0,0 +1,58 @@
+# read_smp_res.py
+# Read observed and simulated smp files into residual arrays
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def read_smp_res(obs_file, sim_file, group='none'):
+    ''' read_smp_res() - Read observed and simulated values from two smp
+        files, such as an observation file and the iwfm2obs output, into
+        the arrays returned by read_pest_res(), matched on site and date
+
+    Parameters
+    ----------
+    obs_file : str
+        observed values smp file name
+
+    sim_file : str
+        simulated values smp file name
+
+    group : str, default='none'
+        observation group of all values
+
+    Returns
+    -------
+    res : dictionary
+        numpy arrays 'site', 'group', 'date', 'measured', 'modelled' and
+        'weight', for the site and dates in both files
+
+    '''
+    import numpy as np
+    import pandas as pd
+
+    cols = ['site', 'date', 'time', 'value']
+    obs = pd.read_csv(obs_file, sep=r'\s+', header=None, usecols=range(4), names=cols, dtype={'site': str})
+    sim = pd.read_csv(sim_file, sep=r'\s+', header=None, usecols=range(4), names=cols, dtype={'site': str})
+    obs['k'] = obs.groupby(['site', 'date']).cumcount()                # match repeated site and date in order
+    sim['k'] = sim.groupby(['site', 'date']).cumcount()
+    df = obs.merge(sim, on=['site', 'date', 'k'], suffixes=('_obs', '_sim'))
+
+    return {'site': df['site'].to_numpy(dtype=str),
+            'group': np.full(len(df), group),
+            'date': pd.to_datetime(df['date'], format='%m/%d/%Y').to_numpy().astype('datetime64[D]'),
+            'measured': df['value_obs'].to_numpy(dtype=float),
+            'modelled': df['value_sim'].to_numpy(dtype=float),
+            'weight': np.ones(len(df))}
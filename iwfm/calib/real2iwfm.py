@@ -1,7 +1,7 @@
 # real2iwfm.py
 # Read parameter values for model nodes and combine into an IWFM
 # overwrite file
-# Copyright (C) 2020-2023 University of California
+# Copyright (C) 2020-2024 University of California
 # Based on a PEST utility written by Matt Tonkin
 # -----------------------------------------------------------------------------
 # This information is free; you can redistribute it and/or modify it
@@ -30,8 +30,9 @@ def write_overwrite_file(overwrite_file, in_lines, parnodes, nlay, parvals, fp,
     overwrite_file : str
         Overwrite file name
 
-    in_lines : list
-        each item is one line from the existing (template) overwrite file
+    in_lines : list or calib.overwrite_params
+        each item is one line from the existing (template) overwrite file,
+        or the template as an overwrite_params object
 
     parnodes : list
         Node numbers corresponding to parvals items
@@ -53,51 +54,21 @@ def write_overwrite_file(overwrite_file, in_lines, parnodes, nlay, parvals, fp,
 
     '''
 
-    line_index = 0
-    with open(overwrite_file, 'w') as f:
-
-        while in_lines[line_index][0] == 'C':           # write comment lines
-            f.write(f'{in_lines[line_index]}\n')
-            line_index += 1 
-
-        # write number of parameter lines
-        f.write(f'    {len(parnodes[0][0] * nlay)}                       / NWRITE\n')
-        line_index += 1
-
-        while in_lines[line_index][0] == 'C':           # write comment lines
-            f.write(f'{in_lines[line_index]}\n')
-            line_index += 1 
-
-        # write factors
-        f.write(f'\t{fp[0]}\t{fp[1]}\t{fp[2]}\t{fp[3]}\t{fp[4]}\t{fp[5]}\t{fp[6]}\n')
-        line_index += 1
-
-        while in_lines[line_index][0] == 'C':           # write comment lines
-            f.write(f'{in_lines[line_index]}\n')
-            line_index += 1 
+    import numpy as np
+    import iwfm.calib as calib
 
-        # write time units
-        f.write(f'    {ctime}               / TUNITKH\n')
-        line_index += 1
-        for i in range(0,2):                            # write remaining DSS time units
-            f.write(f'{in_lines[line_index]}\n')
-            line_index += 1 
+    nnodes = len(parvals[0][0])
 
-        while in_lines[line_index][0] == 'C':           # write comment lines
-            f.write(f'{in_lines[line_index]}\n')
-            line_index += 1 
+    # (node, layer, parameter) values and (node, layer) node numbers, one row for each node and layer
+    values = np.array(parvals, dtype=float).transpose(2, 1, 0).reshape(-1, 7)
+    nodes = np.array([layer_nodes[:nnodes] for layer_nodes in parnodes[0][:nlay]]).T.ravel()
+    layers = np.tile(np.arange(1, nlay + 1), nnodes)
 
-        for n in range(0, len(parnodes[0][1])):         # cycle through nodes
-            for l in range(0, nlay):                    # cycle through layers
-                pkh = parvals[0][l][n] if parvals[0][l][n] > 0 else -1
-                ps  = parvals[1][l][n] if parvals[1][l][n] > 0 else -1
-                pn  = parvals[2][l][n] if parvals[2][l][n] > 0 else -1
-                pv  = parvals[3][l][n] if parvals[3][l][n] > 0 else -1
-                pl  = parvals[4][l][n] if parvals[4][l][n] > 0 else -1
-                sce = parvals[5][l][n] if parvals[5][l][n] > 0 else -1
-                sci = parvals[6][l][n] if parvals[6][l][n] > 0 else -1
-
-                f.write(f'\t{parnodes[0][l][n]}\t{l+1}\t{pkh:.4f}\t{ps:.3E}\t{pn:.3f}\t{pv:.3E}\t{pl:.4f}\t{sce:.3E}\t{sci:.3E}\n')
+    if isinstance(in_lines, calib.overwrite_params):
+        params = in_lines
+    else:
+        params = calib.overwrite_params.from_lines(in_lines)
+    params.write(overwrite_file, values, nodes, layers, fp, ctime)
 
     return
 # --------------------------------------------------------------------------------
@@ -145,32 +116,18 @@ def read_overwrite_file(overwrite_file, nnodes, nlay, param_types, verbose=False
         each item is one line from the overwrite file
     
     '''
-    import iwfm as iwfm
+    import iwfm.calib as calib
 
     in_lines = open(overwrite_file).read().splitlines()               # open and read input file
-
-    line_index = 0
-    line_index = iwfm.skip_ahead(line_index,in_lines,0)               # skip comments 
-    nwrite = int(in_lines[line_index].split()[0])                     # no. of parameter lines
-
-    line_index = iwfm.skip_ahead(line_index,in_lines,1)               # skip comments
-    factors = [in_lines[line_index].split()[0] for i in range(0,7)]   # scaling factors
-
-    line_index = iwfm.skip_ahead(line_index,in_lines,4)
-
-    line_index = iwfm.skip_ahead(line_index,in_lines,0)
+    params = calib.overwrite_params.from_lines(in_lines)
 
     parvals_d = {}
-    for line in in_lines[line_index:]:                                # skip comments
-        if line[0] == 'C':
-            break
-        line = line.split()
-        key = f'{line[0]}_{line[1]}'
+    for node, layer, row in zip(params.nodes.tolist(), params.layers.tolist(), params.values.tolist()):
+        temp = {"node": node, "layer": layer}
+        temp.update(zip([ptype.lower() for ptype in params.param_types], row))
+        parvals_d[f'{node}_{layer}'] = temp
 
-        temp = {"node": int(line[0]), "layer": int(line[1]), "pkh": float(line[2]), 
-                "ps": float(line[3]), "pn": float(line[4]), "pv": float(line[5]), 
-                "pl": float(line[6]), "sce": float(line[7]), "sci": float(line[8])}
-        parvals_d[key] = temp
+    nwrite, factors = params.nwrite, params.factors
 
     return nwrite, factors, parvals_d, in_lines
 # --------------------------------------------------------------------------------
@@ -202,6 +159,7 @@ def real2iwfm(verbose=False):
 
     import sys
     import iwfm as iwfm
+    import iwfm.calib as calib
 
     param_types = ['PKH', 'PS', 'PN', 'PV', 'PL', 'SCE', 'SCI']
     
@@ -223,8 +181,8 @@ def real2iwfm(verbose=False):
 
     ctime = input(' Parameter time-step units: ')
 
-    nwrite, factors, oldparvals_d, in_lines = read_overwrite_file(
-            overwrite_file, nnodes, nlay, param_types, verbose)
+    params = calib.overwrite_params(overwrite_file)             # template read once
+    factors = params.factors
 
     # read new parameter values
     parvals, parnodes = [], []
@@ -242,7 +200,7 @@ def real2iwfm(verbose=False):
                 layer_vals, layer_nodes = [], []
                 if param_file == 'none':
                     layer_vals = [-1.0] * nnodes
-                    pnodes.append(list(range(1,nnodes+1)))
+                    layer_nodes = list(range(1,nnodes+1))
 
                 else:
                     iwfm.file_test(param_file)
@@ -265,7 +223,7 @@ def real2iwfm(verbose=False):
         parvals.append(pvals)
         parnodes.append(pnodes)
 
-    write_overwrite_file(output_file, in_lines, parnodes, nlay, parvals, factors, ctime, verbose)
+    write_overwrite_file(output_file, params, parnodes, nlay, parvals, factors, ctime, verbose)
 
     if verbose:
         print(f'\n\n Created overwrite file {output_file}. ')
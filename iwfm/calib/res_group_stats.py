@@ -0,0 +1,91 @@
+# res_group_stats.py
+# Residual statistics for groups of observations in one grouped pass
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def res_group_stats(keys, sim, meas):
+    ''' res_group_stats() - Calculate residual statistics for each group of
+        observations with the same key. All groups are summed together
+        with np.bincount, so the cost is O(n_obs) for any number of groups.
+
+    Parameters
+    ----------
+    keys : array-like
+        group key of each observation, such as site name, observation
+        group or site and period; a tuple of arrays groups on all of them
+
+    sim : array-like
+        simulated values
+
+    meas : array-like
+        measured values
+
+    Returns
+    -------
+    group_keys : list
+        key of each group, in order of first appearance; tuples when keys
+        is a tuple of arrays
+
+    stats : dictionary
+        numpy arrays 'n', 'mean' (of measured values), 'bias' (mean of
+        simulated - measured), 'rmse', 'stdev' (sample standard deviation
+        of measured values, nan for n < 2) and 'nse' (Nash-Sutcliffe
+        efficiency, nan when the measured values do not vary), one item
+        for each group
+
+    '''
+    import numpy as np
+
+    sim = np.asarray(sim, dtype=float)
+    meas = np.asarray(meas, dtype=float)
+
+    # -- group number of each observation, groups in order of first appearance
+    if isinstance(keys, tuple):
+        columns = [np.unique(np.asarray(k), return_inverse=True) for k in keys]
+        codes = np.zeros(len(sim), dtype=np.int64)
+        for values, inverse in columns:
+            codes = codes * len(values) + inverse.ravel()
+    else:
+        codes = np.asarray(keys)
+    uniq, first, inverse = np.unique(codes, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind='stable')
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    group = rank[inverse.ravel()]
+    ng = len(order)
+
+    if isinstance(keys, tuple):
+        group_keys = list(zip(*[np.asarray(k)[first[order]].tolist() for k in keys]))
+    else:
+        group_keys = np.asarray(keys)[first[order]].tolist()
+
+    # -- one pass of sums per statistic
+    resid = sim - meas
+    n = np.bincount(group, minlength=ng)
+    mean = np.bincount(group, weights=meas, minlength=ng) / n
+    bias = np.bincount(group, weights=resid, minlength=ng) / n
+    sse = np.bincount(group, weights=resid ** 2, minlength=ng)
+    ssm = np.bincount(group, weights=(meas - mean[group]) ** 2, minlength=ng)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stats = {'n': n,
+                 'mean': mean,
+                 'bias': bias,
+                 'rmse': np.sqrt(sse / n),
+                 'stdev': np.where(n > 1, np.sqrt(ssm / np.maximum(n - 1, 1)), np.nan),
+                 'nse': np.where(ssm > 0, 1.0 - sse / ssm, np.nan)}
+    return group_keys, stats
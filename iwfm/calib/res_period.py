@@ -0,0 +1,58 @@
+# res_period.py
+# Time period labels for grouping observation residuals
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def res_period(dates, period='year'):
+    ''' res_period() - Return the time period label of each date, to group
+        residual statistics by time with res_group_stats()
+
+    Parameters
+    ----------
+    dates : array-like
+        observation dates, datetime64 or anything numpy converts to it
+
+    period : str, default='year'
+        'year' = calendar year, 'water_year' = October to September, named
+        for the year it ends, 'season' = 'winter' (Dec-Feb), 'spring'
+        (Mar-May), 'summer' (Jun-Aug) or 'fall' (Sep-Nov), or 'month' =
+        'YYYY-MM'
+
+    Returns
+    -------
+    labels : numpy array
+        period label of each date, 'none' where the date is NaT
+
+    '''
+    import numpy as np
+
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    year = dates.astype('datetime64[Y]').astype(int) + 1970
+    month = dates.astype('datetime64[M]').astype(int) % 12 + 1           # 1 to 12
+
+    if period == 'year':
+        labels = year.astype(str)
+    elif period == 'water_year':
+        labels = (year + (month >= 10)).astype(str)
+    elif period == 'season':
+        labels = np.array(['winter', 'spring', 'summer', 'fall'])[(month % 12) // 3]
+    elif period == 'month':
+        labels = dates.astype('datetime64[M]').astype(str)
+    else:
+        raise ValueError(f"period must be 'year', 'water_year', 'season' or 'month', not '{period}'")
+
+    return np.where(np.isnat(dates), 'none', labels)
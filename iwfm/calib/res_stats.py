@@ -19,10 +19,11 @@
 # -----------------------------------------------------------------------------
 
 
-def res_stats(pest_smp_file, gwhyd_info_file, gwhyd_file, verbose=False):
+def res_stats(pest_smp_file, gwhyd_info_file, gwhyd_file, period=None, format='txt', verbose=False):
     ''' res_stats() - Read a PEST .smp file, IWFM groundwater hydrograph 
         file, and IWFM groundwater.dat file, and print a text file with the 
-        RMSE and bias of each well and of all observations
+        RMSE and bias of each well and of all observations, and optionally
+        a file with the statistics of each well in each time period
     
     Parameters
     ----------
@@ -35,6 +36,13 @@ def res_stats(pest_smp_file, gwhyd_info_file, gwhyd_file, verbose=False):
     gwhyd_file : str
         IWFM groundwater.dat file name
     
+    period : str, default=None
+        None, or 'year', 'water_year', 'season' or 'month' to also write
+        the statistics of each well in each time period, see res_period()
+    
+    format : str, default='txt'
+        format of the time period statistics file, 'txt', 'csv' or 'json'
+    
     verbose : bool, default=False
         True = command line updates on
     
@@ -48,6 +56,7 @@ def res_stats(pest_smp_file, gwhyd_info_file, gwhyd_file, verbose=False):
     import numpy as np
     import scipy as sci
     import iwfm as iwfm
+    import iwfm.calib as calib
     
     # == read pest observation file into array obs
     head_obs = open(pest_smp_file).read().splitlines()
@@ -71,84 +80,47 @@ def res_stats(pest_smp_file, gwhyd_info_file, gwhyd_file, verbose=False):
         print(f'  Read {len(simhyd.sim_vals):,} simulated values from {gwhyd_file}')
         print(f'  simhyd.sim_vals[0][0:3]: {simhyd.sim_vals[0][0:3]}\n')
 
-    # == cycle through the list of wells in pest_obs to calculate rmse & bias
-    # -- initialize
-    i = 1
-    dates, meas, sim = [], [], []
-    well_names, rmse_values, bias_values, sim_all = [], [], [], []
-    meas_all, count, dates, meas = [], [], [], []
-
-    name, date = head_obs[0][0], head_obs[0][1]
-    print(f' => name: {name},\tdate: {date}\tmeas: {head_obs[0][3]}')
-    dates.append(date)
-    meas.append(head_obs[0][3])
-
-    # use hyd_dict to find the column no for this obs well in simhyd_obs
-    simhyd_col = int(hyd_dict.get(name)[0])
-    print(f' => simhyd_col: {simhyd_col}')
-
-    # calculate the simulated value for this observation
-    print(f'  simhyd.sim_head({date},{simhyd_col}): {simhyd.sim_head(date,simhyd_col)}')
-    sim.append(simhyd.sim_head(date,simhyd_col))    
-
-    # move through the file
-    j = 1
-    while j < len(head_obs):
-        new_name = head_obs[j][0]
-        if new_name != name:  # new well name, finalize info for the last well
-            # calculate rmse and bias
-            well_names.append(name)
-            rmse = iwfm.rmse_calc(sim,meas)
-            bias = iwfm.bias_calc(sim,meas)
-            rmse_values.append(rmse)
-            bias_values.append(bias)
-            count.append(len(meas))
-
-            dates, meas, sim = [], [], [] # re-initialize for next observation well
-
-            # find next well from head_obs that is in hyd_dict
-            while new_name not in hyd_dict:
-                j += 1
-                new_name = head_obs[j][0]
-            name = new_name
-            simhyd_col = (hyd_dict.get(name)[0])
-
-        date = head_obs[j][1]
-        dates.append(date)
-
-        simulated = simhyd_obs.sim_head(date,simhyd_col)
-        sim.append(simulated)
-        sim_all.append(simulated)
-
-        measured = head_obs[j][3]
-        meas.append(measured)
-        meas_all.append(measured)
-
-        j += 1
-
-    # calculate final one
-    rmse_values.append(iwfm.rmse_calc(sim,meas))
-    well_names.append(name)
-    bias_values.append(iwfm.bias_calc(sim,meas))
-    count.append(len(meas))
+    # == simulated values for all observations of wells in hyd_dict, in one pass
+    head_obs = [obs for obs in head_obs if obs[0] in hyd_dict]
+    cols = [int(hyd_dict[obs[0]][0]) for obs in head_obs]             # column no for each obs well in simhyd
+    sim_all = simhyd.sim_values_at([obs[1] for obs in head_obs], cols)
+    meas_all = np.array([obs[3] for obs in head_obs])
+
+    inside = ~np.isnan(sim_all)                                        # skip observations outside the simulation period
+    names = np.array([obs[0] for obs in head_obs])[inside]
+    dates = np.array([obs[1] for obs in head_obs])[inside]
+    sim_all, meas_all = sim_all[inside], meas_all[inside]
+
+    # == rmse & bias of each well in one grouped pass
+    well_names, stats = calib.res_group_stats(names, sim_all, meas_all)
+    rmse_values, bias_values, count = stats['rmse'], stats['bias'], stats['n'].tolist()
 
     # write out results
     out_file = gwhyd_file.replace('.out','_rmse.txt')
 
-    iwfm.write_rmse_bias(out_file,hyd_dict,well_names,rmse_values,bias_values,count)
+    calib.write_rmse_bias(out_file,hyd_dict,well_names,rmse_values,bias_values,count)
     if verbose:
         print(f'  Wrote {out_file}')
 
     out_file = gwhyd_file.replace('.out','_rmse_all.txt')
     with open(out_file,'w') as of:
-        of.write('{}\t{}\t{}\n'.format(out_file,iwfm.rmse_calc(sim_all,meas_all),iwfm.bias_calc(sim_all,meas_all)))
+        of.write('{}\t{}\t{}\n'.format(out_file,calib.rmse_calc(sim_all,meas_all),calib.bias_calc(sim_all,meas_all)))
     if verbose:
         print(f'  Wrote {out_file}')
+
+    if period is not None:
+        dates = np.array([f'{d[6:10]}-{d[0:2]}-{d[3:5]}' for d in dates.tolist()], dtype='datetime64[D]')
+        group_keys, stats = calib.res_group_stats((names, calib.res_period(dates, period)), sim_all, meas_all)
+
+        out_file = gwhyd_file.replace('.out', f'_stats_{period}.' + format)
+        calib.write_res_stats(out_file, group_keys, stats, key_names=('Name', 'Period'), format=format)
+        if verbose:
+            print(f'  Wrote {out_file}')
     return
 
 
 if __name__ == '__main__':
-    ' Run pest_res_stats() from command line '
+    ' Run res_stats() from command line '
     import sys
     import iwfm.debug as idb
     import iwfm as iwfm
@@ -168,6 +140,6 @@ if __name__ == '__main__':
     iwfm.file_test(gwhyd_file)
 
     idb.exe_time()  # initialize timer
-    pest_res_stats(pest_smp_file, gwhyd_info_file, gwhyd_file,verbose=True)
+    res_stats(pest_smp_file, gwhyd_info_file, gwhyd_file,verbose=True)
 
     idb.exe_time()  # print elapsed time
@@ -39,48 +39,21 @@ def smp_avg( smp_file, verbose=False):
 
     '''
 
+    import numpy as np
     import iwfm as iwfm
+    import iwfm.calib as calib
 
     iwfm.file_test(smp_file)
 
-    smp_lines = open(smp_file).read().splitlines()
-    if verbose: print(f'\n  Read {len(smp_lines):,} lines from {smp_file}')
+    store = calib.smp_store(smp_file)
+    if verbose: print(f'\n  Read {store.n_records:,} lines from {smp_file}')
 
-    sites = []
-    # [site_name, value_sum, value_count]
-    for line in smp_lines:
-        items = line.split()
-        site_name, value = items[0], float(items[3])
-
-        index = name_index(sites, site_name)
-
-        if len(index) == 0:
-            sites.append([site_name,items[1],value,1])
-        else:
-            sites[index[0]][2] += value
-            sites[index[0]][3] += 1
-
-    averages = []
-    for line in smp_lines:
-        items = line.split()
-        site_name = items[0]
-        index = name_index(sites, site_name)
-
-        # get average for this site
-        average = sites[index[0]][2]/sites[index[0]][3]
-
-        smp_out = str(f'{iwfm.pad_back(items[0],20)} {items[1]}  0:00:00 {iwfm.pad_front(round(average,4),22)}')
-        averages.append(smp_out)
+    # average of the site of each record, lines back in file order
+    averages = store.lines(store.mean()[store.site_code], decimals=4)
+    averages = store.in_file_order(np.array(averages, dtype=object)).tolist()
 
     return averages
 
-def name_index(names_list, name):
-    index = []
-    for i, item in enumerate(names_list):
-        if name in item:
-            index.append(i)
-    return index
-
 if __name__ == "__main__":
     ''' Run smp_avg() from command line '''
     import sys
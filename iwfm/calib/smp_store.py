@@ -0,0 +1,206 @@
+# smp_store.py
+# Python class for PEST sample bore (smp) file data as indexed numpy arrays
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+class smp_store:
+    ''' smp_store - Records of a PEST sample bore (smp) file as numpy arrays
+        sorted by site and then by date, with the records of each site in
+        one slice found through a dictionary, so site lookups are O(1),
+        per-site counts, means and first and last dates are one array
+        operation, and site lists are matched with set operations.
+
+    Parameters
+    ----------
+    smp_file : str, default=None
+        smp file name, each line 'site MM/DD/YYYY HH:MM:SS value'; None
+        for an empty store, see from_lines() and from_records()
+
+    '''
+
+    def __init__(self, smp_file=None):
+        import numpy as np
+
+        if smp_file is None:
+            self.build(np.array([], dtype=str), np.array([], dtype=str), np.array([], dtype=str),
+                       np.array([], dtype=float))
+            return
+        self.read(smp_file)
+
+    @classmethod
+    def from_lines(cls, smp_lines):
+        ''' from_lines() - Store from a list of smp-format lines'''
+        import io
+
+        store = cls()
+        store.read(io.StringIO('\n'.join(line for line in smp_lines if line.strip())))
+        return store
+
+    @classmethod
+    def from_records(cls, records):
+        ''' from_records() - Store from a list of [site, date as MM/DD/YYYY,
+            time, value] items, as returned by read_obs_smp()'''
+        import numpy as np
+
+        store = cls()
+        if len(records) > 0:
+            sites, dates, times, values = zip(*[r[:4] for r in records])
+            store.build(np.array(sites, dtype=str), np.array(dates, dtype=str),
+                        np.array(times, dtype=str), np.array(values, dtype=float))
+        return store
+
+    def read(self, smp_file):
+        ''' read() - Read an smp file or file-like object with the pandas C parser'''
+        import pandas as pd
+
+        df = pd.read_csv(smp_file, sep=r'\s+', header=None, usecols=range(4),
+                         names=['site', 'date', 'time', 'value'],
+                         dtype={'site': str, 'date': str, 'time': str}, float_precision='round_trip')
+        self.build(df['site'].to_numpy(dtype=str), df['date'].to_numpy(dtype=str),
+                   df['time'].to_numpy(dtype=str), df['value'].to_numpy(dtype=float))
+
+    def build(self, sites, date_text, time_text, values):
+        ''' build() - Sort the records by site and date and index the sites'''
+        import numpy as np
+
+        self.sites, code = np.unique(sites, return_inverse=True)
+        code = code.ravel()
+        dates = np.array([], dtype='datetime64[D]')
+        if len(date_text) > 0:
+            mdy = [d.split('/') for d in date_text.tolist()]                # month and day may be unpadded
+            dates = np.array([f'{y:0>4}-{m:0>2}-{d:0>2}' for m, d, y in mdy], dtype='datetime64[D]')
+
+        order = np.lexsort((dates, code))                               # stable, by site then date
+        self.site_code = code[order]
+        self.dates = dates[order]
+        self.values = values[order]
+        self.date_text = date_text[order]
+        self.time_text = time_text[order]
+        self.line = order                                               # line number in the file
+
+        self.site_start = np.zeros(len(self.sites) + 1, dtype=int)
+        np.cumsum(np.bincount(self.site_code, minlength=len(self.sites)), out=self.site_start[1:])
+        self.lookup = {site: i for i, site in enumerate(self.sites.tolist())}
+
+    @property
+    def n_records(self):
+        return len(self.values)
+
+    @property
+    def n_sites(self):
+        return len(self.sites)
+
+    def index(self, site):
+        ''' index() - Slice of the records of site, empty if not in the store'''
+        i = self.lookup.get(site)
+        if i is None:
+            return slice(0, 0)
+        return slice(self.site_start[i], self.site_start[i + 1])
+
+    def site_data(self, site):
+        ''' site_data() - Dates and values of site, in date order'''
+        s = self.index(site)
+        return self.dates[s], self.values[s]
+
+    def contains(self, names):
+        ''' contains() - Boolean array, True for each name that is a site
+            in the store'''
+        import numpy as np
+
+        return np.isin(np.asarray(names, dtype=str), self.sites)
+
+    def join(self, sim_sites):
+        ''' join() - Match the stored sites against a simulated site list
+
+        Returns
+        -------
+        in_both : list
+            simulated sites with observations, in sim_sites order
+
+        obs_only : list
+            stored sites that are not in sim_sites, in file order
+
+        sim_only : list
+            simulated sites without observations, in sim_sites order
+
+        '''
+        sim_set = set(sim_sites)
+        in_both = [site for site in sim_sites if site in self.lookup]
+        sim_only = [site for site in sim_sites if site not in self.lookup]
+        obs_only = [site for site in self.sites_in_file_order() if site not in sim_set]
+        return in_both, obs_only, sim_only
+
+    def subset(self, sites):
+        ''' subset() - New store with the records of sites only'''
+        import numpy as np
+
+        keep = np.isin(self.site_code, [self.lookup[s] for s in sites if s in self.lookup])
+        order = np.argsort(self.line[keep], kind='stable')              # back to file order
+        store = smp_store()
+        store.build(self.sites[self.site_code[keep]][order], self.date_text[keep][order],
+                    self.time_text[keep][order], self.values[keep][order])
+        return store
+
+    def sites_in_file_order(self):
+        ''' sites_in_file_order() - Site names in order of first appearance'''
+        import numpy as np
+
+        if self.n_sites == 0:
+            return []
+        first = np.minimum.reduceat(self.line, self.site_start[:-1])
+        return self.sites[np.argsort(first, kind='stable')].tolist()
+
+    def count(self):
+        ''' count() - Number of records of each site'''
+        import numpy as np
+
+        return np.diff(self.site_start)
+
+    def mean(self):
+        ''' mean() - Mean value of each site, summed in file order'''
+        import numpy as np
+
+        return (np.bincount(self.in_file_order(self.site_code), weights=self.in_file_order(self.values),
+                            minlength=self.n_sites) / self.count())
+
+    def first_date(self):
+        ''' first_date() - Earliest date of each site'''
+        return self.dates[self.site_start[:-1]]
+
+    def last_date(self):
+        ''' last_date() - Latest date of each site'''
+        return self.dates[self.site_start[1:] - 1]
+
+    def in_file_order(self, values):
+        ''' in_file_order() - Per-record values, such as self.values or
+            self.mean()[self.site_code], reordered to the file line order'''
+        import numpy as np
+
+        out = np.empty_like(values)
+        out[self.line] = values
+        return out
+
+    def lines(self, values=None, decimals=4):
+        ''' lines() - smp-format lines of the records, with values or the
+            stored values, in store order'''
+        import iwfm as iwfm
+
+        if values is None:
+            values = self.values
+        return [f'{iwfm.pad_back(s, 20)} {d}  0:00:00 {iwfm.pad_front(round(v, decimals), 22)}'
+                for s, d, v in zip(self.sites[self.site_code].tolist(), self.date_text.tolist(),
+                                   values.tolist())]
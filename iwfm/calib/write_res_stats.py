@@ -0,0 +1,81 @@
+# write_res_stats.py
+# Write grouped residual statistics to a text, csv or json file
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def write_res_stats(out_file, group_keys, stats, key_names=('Name',), extra=None, format='txt'):
+    ''' write_res_stats() - Write the residual statistics from
+        res_group_stats() to a file
+
+    Parameters
+    ----------
+    out_file : str
+        output file name
+
+    group_keys : list
+        key of each group, tuples for more than one key column
+
+    stats : dictionary
+        'n', 'mean', 'bias', 'rmse', 'stdev' and 'nse' arrays
+
+    key_names : tuple of str, default=('Name',)
+        column name of each part of the group keys
+
+    extra : dictionary, default=None
+        more columns after the statistics, key = column name, value = list
+        with one item per group
+
+    format : str, default='txt'
+        'txt' = tab-separated with two decimals, 'csv' = comma-separated
+        with full precision, 'json' = list of records
+
+    Returns
+    -------
+    nothing
+
+    '''
+    import json
+    import numpy as np
+
+    extra = extra or {}
+    keys = [k if isinstance(k, tuple) else (k,) for k in group_keys]
+    names = list(key_names) + ['N', 'Mean', 'Bias', 'RMSE', 'Stdev', 'NSE'] + list(extra.keys())
+    values = [stats[s].tolist() for s in ['mean', 'bias', 'rmse', 'stdev', 'nse']]
+    rows = [list(k) + [int(n)] + list(v) + [e[i] for e in extra.values()]
+            for i, (k, n, *v) in enumerate(zip(keys, stats['n'].tolist(), *values))]
+
+    if format == 'json':
+        records = [{name: (None if isinstance(x, float) and np.isnan(x) else x)
+                    for name, x in zip(names, row)} for row in rows]
+        with open(out_file, 'w') as f:
+            json.dump(records, f, indent=1)
+        return
+
+    nk = len(key_names)
+    if format == 'csv':
+        sep, fmt = ',', lambda x: repr(x)
+    elif format == 'txt':
+        sep, fmt = '\t', lambda x: f'{x:.2f}'
+    else:
+        raise ValueError(f"format must be 'txt', 'csv' or 'json', not '{format}'")
+
+    lines = [sep.join(names)]
+    for row in rows:
+        lines.append(sep.join([str(x) for x in row[:nk + 1]] + [fmt(x) for x in row[nk + 1:nk + 6]]
+                              + [str(x) for x in row[nk + 6:]]))
+    with open(out_file, 'w') as f:
+        f.write(''.join(f'{line}\n' for line in lines))
@@ -18,7 +18,7 @@
 # -----------------------------------------------------------------------------
 
 
-def closest_list(A, B, verbose=False):
+def closest_list(A, B, verbose=False, index=None):
     ''' closest_list() - Given two lists A[] and B[] of form (ID, X, Y), 
             returns a list of len(A) with the item of B closest to each item in A
 
@@ -38,6 +38,9 @@ def closest_list(A, B, verbose=False):
     verbose : bool, default=False
         True = command-line output on
 
+    index : node_index, default=None
+        KD-tree of the points in B. None = build one
+
     Returns
     -------
     C : list
@@ -47,48 +50,18 @@ def closest_list(A, B, verbose=False):
             ...: items [3:] of B from point closest to A point
 
     '''
-    C = []
-    for a in A:
-        C.append(nearest(a, B))
-    return C
-
+    import iwfm as iwfm
 
-def nearest(a, B):
-    ''' nearest() - item of B[points] nearest to point a 
-    
-    Parameters
-    ----------
-        a: [id, x,y] where id: int, x, y: float
+    A = [a.split(',') for a in A]
+    B_items = [b.split(',') for b in B]
 
-        B: list of [id, x, y] where id: int, x,y: float 
+    # -- nearest point of B to every point of A at once
+    if index is None:
+        index = iwfm.node_index(B_items)
+    nearest, _ = index.query([[float(a[1]), float(a[2])] for a in A])
 
-    Returns
-    -------
-        index of point in B closest to a
-    '''
-    import math
-    close_dist = float('inf')
-    close_index = -1
-
-    a = a.split(',')
-
-    ax = float(a[1])
-    ay = float(a[2])
-    for i in range(len(B)):
-        b = B[i].split(',')
-        x, y = float(b[1]), float(b[2])
-        dist = math.sqrt( (x - ax)**2 + (y - ay)**2 )
-        if dist < close_dist:
-            close_dist = dist
-            close_index = i
-
-    c = []
-    for item in a:
-        c.append(item)
-    for item in B[close_index].split(','):
-        c.append(item)
-
-    return c
+    C = [a + B_items[i] for a, i in zip(A, nearest)]
+    return C
 
 
 
@@ -0,0 +1,139 @@
+# elem_locator.py
+# Python class to find the elements containing a set of points
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+class elem_locator:
+    """elem_locator - Spatial index of the model elements.  The element
+    bounding boxes are bucketed into a uniform grid of about one cell per
+    element, so each point is tested only against the few elements whose
+    bounding boxes overlap its grid cell.  The exact test checks that the
+    point is on the inner side of every edge of the (convex) triangle or
+    quadrilateral.
+
+    Parameters
+    ----------
+    e_nos : list
+        element numbers
+
+    e_nodes : list
+        nodes of each element, 3 for triangles or 4 for quadrilaterals,
+        in the order of e_nos
+
+    d_nodexy : dictionary
+        key = node number, values = (x, y) coordinates
+
+    """
+
+    def __init__(self, e_nos, e_nodes, d_nodexy):
+        import numpy as np
+
+        self.e_nos = np.asarray(e_nos, dtype=int)
+
+        # -- element vertex coordinates, triangles close on the first node
+        nodes = np.array([list(n) + [n[0]] * (4 - len(n)) for n in e_nodes], dtype=int)
+        ids = np.array(list(d_nodexy.keys()), dtype=int)
+        xy = np.array([d_nodexy[i][:2] for i in ids], dtype=float)
+        lookup = np.zeros(ids.max() + 1, dtype=int)
+        lookup[ids] = np.arange(len(ids))
+        self.vx = xy[lookup[nodes], 0]  # shape (n_elements, 4)
+        self.vy = xy[lookup[nodes], 1]
+
+        # -- uniform grid over the mesh, about one cell per element
+        xmin, xmax = self.vx.min(axis=1), self.vx.max(axis=1)
+        ymin, ymax = self.vy.min(axis=1), self.vy.max(axis=1)
+        self.x0, self.y0 = xmin.min(), ymin.min()
+        width, height = xmax.max() - self.x0, ymax.max() - self.y0
+        self.cell = max(np.sqrt(width * height / len(self.e_nos)), np.finfo(float).eps)
+        self.nx = int(width / self.cell) + 1
+        self.ny = int(height / self.cell) + 1
+
+        # -- cells covered by each element bounding box
+        ix0, ix1 = self.grid_col(xmin), self.grid_col(xmax)
+        iy0, iy1 = self.grid_row(ymin), self.grid_row(ymax)
+        ncx, ncy = ix1 - ix0 + 1, iy1 - iy0 + 1
+        ncells = ncx * ncy
+        elem = np.repeat(np.arange(len(self.e_nos)), ncells)
+        k = np.arange(ncells.sum()) - np.repeat(np.cumsum(ncells) - ncells, ncells)
+        cells = (iy0[elem] + k // ncx[elem]) * self.nx + ix0[elem] + k % ncx[elem]
+
+        # -- element lists of the cells, in compressed sparse row form
+        order = np.argsort(cells, kind='stable')
+        self.cell_elems = elem[order]
+        self.cell_start = np.zeros(self.nx * self.ny + 1, dtype=int)
+        np.cumsum(np.bincount(cells, minlength=self.nx * self.ny), out=self.cell_start[1:])
+
+    def grid_col(self, x):
+        """ grid_col() - Grid column of each x coordinate"""
+        import numpy as np
+
+        return np.clip(((x - self.x0) / self.cell).astype(int), 0, self.nx - 1)
+
+    def grid_row(self, y):
+        """ grid_row() - Grid row of each y coordinate"""
+        import numpy as np
+
+        return np.clip(((y - self.y0) / self.cell).astype(int), 0, self.ny - 1)
+
+    def locate_points(self, xy, chunk=100000):
+        """ locate_points() - Return the number of the element containing
+        each (x, y) point, or 0 for points outside the mesh.  Points on an
+        edge shared by two elements are assigned to the first element.
+
+        Parameters
+        ----------
+        xy : array-like
+            point coordinates, shape (n_points, 2)
+
+        chunk : int, default=100000
+            number of points tested at a time, to limit memory use
+
+        Returns
+        -------
+        elements : numpy array
+            element numbers, shape (n_points,)
+
+        """
+        import numpy as np
+
+        xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+        elements = np.zeros(len(xy), dtype=int)
+
+        for start in range(0, len(xy), chunk):
+            px, py = xy[start:start + chunk, 0], xy[start:start + chunk, 1]
+            inside = ((px >= self.x0) & (px <= self.x0 + self.nx * self.cell)
+                      & (py >= self.y0) & (py <= self.y0 + self.ny * self.cell))
+            points = np.flatnonzero(inside)
+            cells = self.grid_row(py[points]) * self.nx + self.grid_col(px[points])
+
+            # -- candidate (point, element) pairs from the grid cell of each point
+            first, count = self.cell_start[cells], self.cell_start[cells + 1] - self.cell_start[cells]
+            pair_point = np.repeat(points, count)
+            k = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+            pair_elem = self.cell_elems[np.repeat(first, count) + k]
+
+            # -- the point is inside if it is on the same side of every edge
+            ex, ey = self.vx[pair_elem], self.vy[pair_elem]
+            dx, dy = np.roll(ex, -1, axis=1) - ex, np.roll(ey, -1, axis=1) - ey
+            cross = dx * (py[pair_point, None] - ey) - dy * (px[pair_point, None] - ex)
+            hit = np.all(cross >= 0, axis=1) | np.all(cross <= 0, axis=1)
+
+            # -- keep the first element found for each point
+            hit_point, index = np.unique(pair_point[hit], return_index=True)
+            elements[start + hit_point] = self.e_nos[pair_elem[hit][index]]
+
+        return elements
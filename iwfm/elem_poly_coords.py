@@ -26,8 +26,9 @@ def elem_poly_coords(elem_nodes, node_coord_dict):
     elem_nodes : list
         list of elements and associated nodes
     
-    node_coord_dict : dictionary
-        key = node_id, values = associated X and Y coordinates
+    node_coord_dict : dictionary or list
+        key = node_id, values = associated X and Y coordinates, or list
+        of [node_id, X, Y] items
 
     Returns
     -------
@@ -35,15 +36,7 @@ def elem_poly_coords(elem_nodes, node_coord_dict):
         list of polygon coordinates
     
     '''
+    import iwfm as iwfm
 
-    polygons = []
-
-    for i in range(0, len(elem_nodes)):  # for each element ...
-        coords = []
-        for j in elem_nodes[i]:  # for each node in the element ...
-            coords.append((node_coord_dict[j][0],node_coord_dict[j][1]))
-        coords.append(
-            (node_coord_dict[elem_nodes[i][0]][0], node_coord_dict[elem_nodes[i][0]][1])
-        )  # close the polygon with the first node
-        polygons.append(coords)
+    polygons = iwfm.mesh(node_coord_dict, elem_nodes).poly_coords()
     return polygons
@@ -18,15 +18,8 @@
 
 
 def elem_poly_coords_wkt(elem_nodes, node_coords):
-    ''' elem_poly_coords_wkt() - Return a list ofelement coordinates 
-        in WKT form: ['POLYGON ((X0 Y0, X1 Y1, X2 Y2, X3 Y3, X0 Y0)),'<,...>]
-
-    TODO:
-      - change i from range to enumerate
-      - change polys to WKT format:
-      ['POLYGON ((X0 Y0, X1 Y1, X2 Y2, X3 Y3, X0 Y0))',
-       'POLYGON ((X0 Y0, X1 Y1, X2 Y2, X3 Y3, X0 Y0))',
-        etc...  
+    ''' elem_poly_coords_wkt() - Return a list of element coordinates 
+        in WKT form: ['POLYGON ((X0 Y0, X1 Y1, X2 Y2, X3 Y3, X0 Y0))'<,...>]
 
     Parameters
     ----------
@@ -34,27 +27,18 @@ def elem_poly_coords_wkt(elem_nodes, node_coords):
         list of elements and associated nodes
     
     node_coords : list
-        list of nodes and associated X and Y coordinates
+        list of nodes and associated X and Y coordinates, [x, y] for
+        node n in item n-1
 
     Returns
     -------
     polys : list
-        list of polygon coordinates
+        list of WKT polygons
 
     '''
-    polys = []
+    import iwfm as iwfm
 
-    for i in range(0, len(elem_nodes)):  # for each element ...
-        coords = []
-        for j in range(0, len(elem_nodes[i])):  # for each node in the element ...
-            coords.append(
-                (
-                    node_coords[elem_nodes[i][j] - 1][0],
-                    node_coords[elem_nodes[i][j] - 1][1],
-                )
-            )
-        coords.append(
-            (node_coords[elem_nodes[i][0] - 1][0], node_coords[elem_nodes[i][0] - 1][1])
-        )  # close the polygon
-        polys.append(coords)
+    # -- mesh() takes [id, x, y] items, node n is item n-1
+    node_coords = [[i + 1] + list(xy[:2]) for i, xy in enumerate(node_coords)]
+    polys = iwfm.mesh(node_coords, elem_nodes).wkt()
     return polys
@@ -36,12 +36,9 @@ def get_elem_centroids(elem_ids, elem_nodes, node_coords):
         list of element centroids
 
     '''
-    import sys
+    import iwfm as iwfm
 
-    elem_centroids = []
-    for elem_id, nodes in zip(elem_ids, elem_nodes):
-        x = [node_coords[node-1][1] for node in nodes]
-        y = [node_coords[node-1][2] for node in nodes]
-        elem_centroids.append([elem_id, sum(x)/len(x), sum(y)/len(y)])
+    centroids = iwfm.mesh(node_coords, elem_nodes, elem_ids).centroids()
+    elem_centroids = [[elem_id, x, y] for elem_id, (x, y) in zip(elem_ids, centroids.tolist())]
 
     return elem_centroids
@@ -17,7 +17,7 @@
 # -----------------------------------------------------------------------------
 
 
-def get_heads_4_date(heads_file, out_date, start=5):
+def get_heads_4_date(heads_file, out_date, start=5, cache=False):
     ''' get_heads_4_date() - Read headall.out file and return heads for a
         specific date 
 
@@ -32,55 +32,32 @@ def get_heads_4_date(heads_file, out_date, start=5):
     start : int, default=5
         number of header lines to skip
 
+    cache : bool, default=False
+        True = read heads from a binary cache of heads_file (see headall_cache)
+
     Returns
     -------
-    nothing
+    out_table : numpy array
+        heads for out_date, one row for each layer
+    
+    nodes : list
+        model node numbers
+    
+    header : list
+        column headers, 'Node' followed by one for each layer
     
     '''
     import iwfm as iwfm
 
-    out_mon = iwfm.month(out_date)
-    out_day = iwfm.day(out_date)
-    out_year = iwfm.year(out_date)
-
-    file_lines = open(heads_file).read().splitlines()  # open and read input file
-
-    line_index = start
-    nodes = file_lines[line_index].split()  # read line w/node nos
-    nodes.pop(0)  # remove text
-    nodes.pop(0)  # remove text
-
-    data = []
-
-    line_index += 1
-    item = file_lines[line_index].split()  # read line w/date
-    data.append(item)
-    end_date = item.pop(0)  # remove the date
-
-    while line_index < len(file_lines) - 1:
-        line_index += 1
-        layer = 1
-        header = []
-        header.append('Node')
-        header.append('Layer ' + str(layer))
-        while file_lines[line_index][0].isspace():  # get all the lines for this time step
-            item = file_lines[line_index].split()
-            data.append(item)
-            layer += 1
-            header.append('Layer ' + str(layer))
-            line_index += 1
-        # now check the date
-        m = iwfm.month(end_date[0:10])
-        d = iwfm.day(end_date[0:10])
-        y = iwfm.year(end_date[0:10])
-        if m == out_mon and d == out_day and y == out_year:
-            out_table = np.asarray(data)
-            return out_table, nodes, header
+    try:
+        if cache:
+            hd = iwfm.headall_cache(heads_file, skip=start)
+            out_table, nodes = hd.heads_for_date(out_date), hd.nodes
         else:
-            data = []
-            data.append(nodes)
-            item = file_lines[line_index].split()  # read line w/date
-            data.append(item)
-            end_date = item.pop(0)  # remove the date
+            _, _, nodes, _ = iwfm.headall_index(heads_file, skip=start)
+            out_table = iwfm.seek_heads(heads_file, out_date, skip=start)
+    except ValueError:  # out_date is not in heads_file
+        return
 
-    return
+    header = ['Node'] + ['Layer ' + str(layer + 1) for layer in range(len(out_table))]
+    return out_table, [str(n) for n in nodes], header
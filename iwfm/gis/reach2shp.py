@@ -71,14 +71,12 @@ def reach2shp(reach_list, stnodes_dict, node_coords, shape_name, epsg=26910,
             schema=schema,
         ) as out:
         for i in range(len(reach_list)):
-            upper, lower = reach_list[i][1], reach_list[i][2]
-            points, n = [], 0
-            for snode in range(upper, lower + 1):
-                gw_node, reach, elev = stnodes_dict[snode]
-                if gw_node != 0:
-                    x, y = node_coords_dict[gw_node][0],node_coords_dict[gw_node][1]
-                    points.append((x, y))
-                    n += 1
+            # -- geometry needs only the node range of the reach, not the
+            # -- network topology, so odd outflow nodes are still exported
+            reach, upper, lower = reach_list[i][0], reach_list[i][1], reach_list[i][2]
+            gw_nodes = [stnodes_dict[snode][0] for snode in range(upper, lower + 1)]
+            points = [(node_coords_dict[gw_node][0], node_coords_dict[gw_node][1])
+                      for gw_node in gw_nodes if gw_node != 0]
             if points:
                 line = LineString(points)
                 properties = {
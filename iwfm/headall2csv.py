@@ -17,26 +17,77 @@
 # -----------------------------------------------------------------------------
 
 
-def headall2csv(data, layers, dates, nodes, output_file, verbose=False):
+def write_layer(args):
+    ''' write_layer() - Write one layer of heads to a csv, parquet or
+        feather file. heads is the (n_times, n_nodes) array of the layer,
+        or the name of a .npy file of all layers, memory-mapped here so a
+        pool process reads the layer without it being copied to it. '''
+    import numpy as np
+    import pandas as pd
+
+    heads, layer, nodes, dates, out_file, precision, format = args
+    if isinstance(heads, str):
+        heads = np.load(heads, mmap_mode='r')[:, layer, :]
+    values = heads.T                                    # strided (n_nodes, n_times) view
+
+    if format == 'csv' and precision is not None:
+        # -- format one node per line with a single printf-style operation
+        row_format = '%s,' + ','.join([f'%.{precision}f'] * len(dates)) + '\n'
+        with open(out_file, 'w') as f:
+            f.write(',' + ','.join(dates) + '\n')
+            for node, row in zip(nodes, values):
+                f.write(row_format % (node, *row))
+        return out_file
+
+    out_df = pd.DataFrame(values, index=nodes, columns=dates)
+    if precision is not None:
+        out_df = out_df.round(precision)
+    if format == 'csv':
+        out_df.to_csv(out_file)
+    else:
+        out_df.index.name = 'Node'
+        out_df = out_df.reset_index()
+        if format == 'parquet':
+            out_df.to_parquet(out_file)
+        else:
+            out_df.to_feather(out_file)
+    return out_file
+
+
+def headall2csv(data, layers=None, dates=None, nodes=None, output_file='', precision=None,
+                format='csv', workers=1, verbose=False):
     ''' headall2csv() - Write out IWFM Headall.out data as one csv file
         for each layer
 
     Parameters
     ----------
-    data : list
-        numpy array of floats, size nodes x layers
+    data : list or headall_data
+        numpy array of floats, size nodes x layers, or heads, dates
+        and nodes from headall_read_array()
     
-    layers : int
-        number of layers
+    layers : int, default=None
+        number of layers, not used if data is headall_data
     
-    dates : list
-        list of dates
+    dates : list, default=None
+        list of dates, not used if data is headall_data
     
-    nodes : int
-        number of nodes
+    nodes : int, default=None
+        number of nodes, not used if data is headall_data
     
     output_file : str
         output csv file base name
+
+    precision : int, default=None
+        number of decimal places written, None = full precision
+
+    format : str, default='csv'
+        output file format: 'csv', 'parquet' or 'feather' (parquet and
+        feather need pyarrow)
+
+    workers : int, default=1
+        number of processes writing layers at the same time; heads from
+        headall_cache() are memory-mapped by each process, each layer of
+        other arrays is copied to the process writing it
     
     verbose : bool, default=False
         True = command-line output on
@@ -46,16 +97,35 @@ def headall2csv(data, layers, dates, nodes, output_file, verbose=False):
     nothing
     
     '''
-    import pandas as pd
+    import numpy as np
+    import iwfm as iwfm
+
+    if isinstance(data, iwfm.headall_data):
+        heads = data.heads
+        dates, nodes = data.date_strings(), [str(n) for n in data.nodes]
+    else:
+        heads = np.asarray(data, dtype=float).reshape(len(dates), layers, -1)
+    layers = heads.shape[1]
+
+    ext = {'csv': '.csv', 'parquet': '.parquet', 'feather': '.feather'}[format]
+
+    # -- each task carries one layer of heads, a view when written here
+    tasks = [(heads[:, i, :], i, nodes, dates, output_file + '_' + str(i + 1) + ext, precision, format)
+             for i in range(0, layers)]
+
+    if workers > 1:
+        import multiprocessing as mp
+
+        # -- pass a memory-mapped cache by file name instead of pickling the layer
+        if isinstance(heads, np.memmap) and heads.filename is not None and heads.filename.endswith('.npy'):
+            tasks = [(heads.filename,) + task[1:] for task in tasks]
+
+        with mp.Pool(processes=min(workers, layers)) as pool:
+            out_files = pool.map(write_layer, tasks)
+    else:
+        out_files = [write_layer(task) for task in tasks]
 
-    for i in range(0, layers): 
-        out_list, index = [], i
-        while index < len(data):
-            out_list.append(data[index])
-            index += layers
-        out_df = pd.DataFrame(out_list, columns=nodes, index=dates).T
-        of = output_file + '_' + str(i + 1) + '.csv'
-        out_df.to_csv(of)
-        if verbose:
+    if verbose:
+        for i, of in enumerate(out_files):
             print(f'  Wrote layer {i + 1} to {of}')
     return
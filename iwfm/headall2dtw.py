@@ -18,15 +18,88 @@
 # -----------------------------------------------------------------------------
 
 
-def headall2dtw(heads_file, pre_file, output_root, verbose=False):
+def dtw_chunks(heads_file, lse, chunk_steps, cache=False):
+    ''' dtw_chunks() - Generator that yields the dates and depth to water
+        (lse - heads) for chunk_steps time steps at a time '''
+    import iwfm as iwfm
+
+    if isinstance(heads_file, iwfm.headall_data) or cache:
+        if isinstance(heads_file, iwfm.headall_data):
+            hd = heads_file
+        else:
+            hd = iwfm.headall_cache(heads_file)
+        for step in range(0, hd.n_times, chunk_steps):
+            yield hd.dates[step:step + chunk_steps], lse - hd.heads[step:step + chunk_steps]
+    else:
+        _, layers, _ = iwfm.headall_header(heads_file)
+        for dates, heads in iwfm.headall_chunks(heads_file, layers, chunk_steps=chunk_steps):
+            yield dates, lse - heads
+
+
+def dtw_summary(heads_file, lse, chunk_steps, cache=False, percentiles=(10, 50, 90), bins=100,
+                exact_bytes=2**28):
+    ''' dtw_summary() - Return the minimum, maximum, mean and percentiles of
+        depth to water at each node, accumulated one chunk of time steps at
+        a time. If all depths fit in exact_bytes of memory the percentiles
+        are exact (np.percentile). Otherwise they are an approximation
+        interpolated from a histogram with bins bins between the minimum
+        and maximum at each node, which can be far from np.percentile when
+        there are few time steps; besides one chunk, the histogram holds
+        4 * bins bytes for each node and layer. '''
+    import numpy as np
+
+    # -- first pass: minimum, maximum and mean
+    dmin = dmax = total = None
+    count = 0
+    for _, dtw in dtw_chunks(heads_file, lse, chunk_steps, cache=cache):
+        if dmin is None:
+            dmin, dmax, total = dtw.min(axis=0), dtw.max(axis=0), dtw.sum(axis=0, dtype=np.float64)
+        else:
+            np.minimum(dmin, dtw.min(axis=0), out=dmin)
+            np.maximum(dmax, dtw.max(axis=0), out=dmax)
+            total += dtw.sum(axis=0, dtype=np.float64)
+        count += len(dtw)
+    stats = {'Min': dmin, 'Max': dmax, 'Mean': total / count}
+    if len(percentiles) == 0:
+        return stats
+
+    # -- second pass: exact percentiles if all time steps fit in memory
+    if count * dmin.size * 8 <= exact_bytes:
+        dtw = np.concatenate([chunk for _, chunk in dtw_chunks(heads_file, lse, chunk_steps, cache=cache)])
+        for p in percentiles:
+            stats[f'P{p}'] = np.percentile(dtw, p, axis=0)
+        return stats
+
+    # -- second pass: histogram of each layer and node
+    width = np.where(dmax > dmin, (dmax - dmin) / bins, 1.0)
+    cells = np.arange(dmin.size).reshape(dmin.shape) * bins
+    hist = np.zeros(dmin.size * bins, dtype=np.int32)
+    for _, dtw in dtw_chunks(heads_file, lse, chunk_steps, cache=cache):
+        b = np.clip(((dtw - dmin) / width).astype(np.int64), 0, bins - 1)
+        np.add.at(hist, (cells + b).ravel(), 1)                         # in place, no second histogram
+    cum = hist.reshape(dmin.shape + (bins,))
+    np.cumsum(cum, axis=-1, out=cum)                                    # cumulative counts, in place
+
+    for p in percentiles:
+        target = p / 100.0 * count
+        k = np.minimum((cum < target).sum(axis=-1), bins - 1)
+        before = np.where(k > 0, np.take_along_axis(cum, np.maximum(k - 1, 0)[..., None], -1)[..., 0], 0)
+        in_bin = np.maximum(np.take_along_axis(cum, k[..., None], -1)[..., 0] - before, 1)
+        value = dmin + (k + (target - before) / in_bin) * width
+        stats[f'P{p}'] = np.clip(value, dmin, dmax)
+    return stats
+
+
+def headall2dtw(heads_file, pre_file, output_root, cache=False, chunk_steps=None,
+                summary=False, percentiles=(10, 50, 90), verbose=False):
     ''' headall2dtw() - Reads IWFM HeadAll.out file, subtracts heads from
         land surface elevation, and writes out as a time series with
         one csv file for each layer
 
     Parameters
     ----------
-    heads_file : str
-        name of headall.out file 
+    heads_file : str or headall_data
+        name of headall.out file, or heads from headall_read_array()
     
     pre_file : str
         name of IWFM Preprocessor main input file
@@ -34,6 +107,23 @@ def headall2dtw(heads_file, pre_file, output_root, verbose=False):
     output_root : str
         basename of output file
     
+    cache : bool, default=False
+        True = read heads from a binary cache of heads_file (see headall_cache)
+
+    chunk_steps : int, default=None
+        None = read all heads then write one row for each node, otherwise
+        read and write chunk_steps time steps at a time, one row for each
+        time step, to output_root + '_<layer>_bystep.csv', so memory use
+        does not grow with the simulation length
+
+    summary : bool, default=False
+        True = write only the minimum, maximum, mean and percentiles of
+        depth to water at each node, one csv file for each layer, reading
+        chunk_steps (default 100) time steps at a time
+
+    percentiles : tuple, default=(10, 50, 90)
+        percentiles included in the summary
+
     verbose : bool, default=False
         True = command-line output on
 
@@ -43,6 +133,7 @@ def headall2dtw(heads_file, pre_file, output_root, verbose=False):
     
     '''
     import numpy as np
+    import pandas as pd
     import os
     import iwfm as iwfm
 
@@ -58,25 +149,59 @@ def headall2dtw(heads_file, pre_file, output_root, verbose=False):
     elevations = iwfm.iwfm_lse(strat)
     lse = np.asarray([i[1] for i in elevations])
 
+    if summary or chunk_steps is not None:
+        if isinstance(heads_file, iwfm.headall_data):
+            nodes, layers = heads_file.nodes, heads_file.layers
+        elif cache:
+            hd = iwfm.headall_cache(heads_file)
+            nodes, layers = hd.nodes, hd.layers
+        else:
+            nodes, layers, _ = iwfm.headall_header(heads_file)
+        if chunk_steps is None:
+            chunk_steps = 100
+
+    # -- summary statistics only
+    if summary:
+        stats = dtw_summary(heads_file, lse, chunk_steps, cache=cache, percentiles=percentiles)
+        for i in range(0, layers):
+            out_df = pd.DataFrame({key: np.around(value[i], 3) for key, value in stats.items()},
+                                  index=pd.Index(nodes, name='Node'))
+            of = output_root + '_summary_' + str(i + 1) + '.csv'
+            out_df.to_csv(of)
+            if verbose:
+                print(f'  Wrote layer {i + 1} summary to {of}')
+        return
+
+    # -- write one chunk of time steps at a time
+    if chunk_steps is not None:
+        out_files = [open(output_root + '_' + str(i + 1) + '_bystep.csv', 'w') for i in range(0, layers)]
+        row_format = '%s,' + ','.join(['%.3f'] * len(nodes)) + '\n'
+        for f in out_files:
+            f.write('Date,' + ','.join(str(n) for n in nodes) + '\n')
+        for dates, dtw in dtw_chunks(heads_file, lse, chunk_steps, cache=cache):
+            dates = [f'{d[5:7]}/{d[8:10]}/{d[0:4]}' for d in dates.astype(str)]
+            for i, f in enumerate(out_files):
+                for date, row in zip(dates, dtw[:, i, :]):
+                    f.write(row_format % (date, *row))
+        for i, f in enumerate(out_files):
+            f.close()
+            if verbose:
+                print(f'  Wrote layer {i + 1} to {f.name}')
+        return
+
     # -- get heads
-    data, layers, dates, nodes = iwfm.headall_read(heads_file)
-    heads = np.asarray(data)
+    if isinstance(heads_file, iwfm.headall_data):
+        hd = heads_file
+    else:
+        hd = iwfm.headall_read_array(heads_file, cache=cache)
 
     # -- calculate depth from land surface
-    dtw = lse - heads
+    dtw = iwfm.headall_data(np.around(lse - hd.heads, 3), hd.dates, hd.nodes)
 
     # -- write to csv files
-    iwfm.headall2csv(
-        np.around(dtw, 3),
-        layers,
-        dates,
-        nodes,
-        output_root,
-        verbose=verbose,
-    )
+    iwfm.headall2csv(dtw, output_file=output_root, verbose=verbose)
     return
 
-
 if __name__ == '__main__':
     ' Run headall2dtw() from command line '
     import sys
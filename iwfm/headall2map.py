@@ -17,14 +17,51 @@
 # -----------------------------------------------------------------------------
 
 
-def headall2map(heads_file, pre_file, bnds_file, out_date, basename, label='Heads', units='ft', verbose=False):
+def render_layer(args):
+    ''' render_layer() - Draw the node, contour line and filled contour maps
+        of heads for one date and layer '''
+    import iwfm.plot as iplot
+
+    plot_data, bounding_poly, image_root, title, label, units, interp, verbose = args
+
+    #  Produce point map
+    image_name = f'{image_root}_nodes.tiff'        #  Set image file name
+    iplot.map_to_nodes(plot_data, bounding_poly, image_name, title=title,
+                       marker_size = 20, label=label, units=units, verbose=verbose )
+
+    #  Produce coutrour lines map
+    image_name = f'{image_root}_contour.tiff'        #  Set image file name
+    iplot.map_to_nodes_contour(plot_data, bounding_poly, image_name, title=title,
+                       label=label, units=units, interp=interp, verbose=verbose )
+
+    #  Produce filled coutrour map
+    image_name = f'{image_root}_contourf.tiff'        #  Set image file name
+    iplot.map_to_nodes_contour(plot_data, bounding_poly, image_name, title=title,
+                       label=label, units=units, contour='filled', interp=interp, verbose=verbose )
+    return
+
+
+def map_dates(out_date):
+    ''' map_dates() - Return the list of dates to map and the tag added to
+        the image names of each, from a date, a comma-separated string of
+        dates or a list of dates, with spaces around each date removed '''
+    if isinstance(out_date, str):
+        if ',' not in out_date:
+            return [out_date.strip()], ['']
+        out_date = out_date.split(',')
+    out_dates = [d.strip() for d in out_date]
+    return out_dates, ['_' + d.replace('/', '_') for d in out_dates]
+
+
+def headall2map(heads_file, pre_file, bnds_file, out_date, basename, label='Heads', units='ft', cache=False, 
+                workers=1, verbose=False):
     ''' headall2map() - Read headall.out file and stratigraphy file and 
             produce head maps
 
     Parameters
     ----------
-    heads_file : str
-        name of headall.out file 
+    heads_file : str or headall_data
+        name of headall.out file, or heads from headall_read_array()
     
     pre_file : str
         name of IWFM Preprocessor main input file
@@ -32,8 +69,11 @@ def headall2map(heads_file, pre_file, bnds_file, out_date, basename, label='Head
     bnds_file : str
         name of boundary file
 
-    out_date : str
-        date to putput (MM/DD?YYYY format)
+    out_date : str or list
+        date to putput (MM/DD?YYYY format), a comma-separated string of
+        dates, or a list of dates such as a slice of
+        headall_data.date_strings(); with more than one date the date is
+        added to each image name
 
     basename : str
         basename of output file
@@ -44,6 +84,12 @@ def headall2map(heads_file, pre_file, bnds_file, out_date, basename, label='Head
     units : str, default='ft'
         units for colorbar
     
+    cache : bool, default=False
+        True = read heads from a binary cache of heads_file (see headall_cache)
+
+    workers : int, default=1
+        number of processes drawing maps at the same time
+
     verbose : bool, default=False
         True = command-line output on
 
@@ -53,52 +99,52 @@ def headall2map(heads_file, pre_file, bnds_file, out_date, basename, label='Head
     
     '''
     import os
+    import iwfm as iwfm
     import numpy as np
     import iwfm.plot as iplot
 
+    # -- read model geometry and boundary once for all dates
     pre_path, pre_proc = os.path.split(pre_file)
     pre_dict, _ = iwfm.iwfm_read_preproc(pre_file)
 
     node_file = os.path.join(pre_path, pre_dict['node_file'])
     node_coords, node_list, factor = iwfm.iwfm_read_nodes(node_file)
-
-    strat, nlayers = iwfm.iwfm_read_strat(pre_dict['strat_file'], node_coords)
-    strat = np.array([np.array(i) for i in strat])    # strat to numpy array
+    xy = np.array([[c[1], c[2]] for c in node_coords])
 
     bnds_d = iwfm.file2dict_int(bnds_file)
     bounding_poly = iwfm.bnds2mask(bnds_d, node_coords)
 
-    # -- get heads
-    data, layers, dates, nodes = iwfm.headall_read(heads_file)
-
-    # find index of out_date in dates
-    index = dates.index(out_date) * layers
-
-    # map heads for each layer for out_date
-    for layer in range(layers):
-        heads = data[index + layer]
+    # -- grid, triangulation and boundary mask once for all contour maps
+    interp = iplot.nodal_grid_interpolator(xy[:, 0], xy[:, 1], bounding_poly)
 
-        plot_data = []
-        for i in range(len(node_coords)):
-            plot_data.append([node_coords[i][1], node_coords[i][2], heads[i]]) 
+    out_dates, date_tags = map_dates(out_date)
 
-        #  Produce point map
-        image_name = f'{basename}_Layer_{layer+1}_nodes.tiff'        #  Set image file name
-        iplot.map_to_nodes(plot_data, bounding_poly, image_name, title=f'Heads for {out_date}, layer {layer+1}',
-                           marker_size = 20, label=label, units=units, verbose=verbose )
+    # -- get heads for out_dates only
+    if isinstance(heads_file, iwfm.headall_data):
+        hd = heads_file
+    elif cache:
+        hd = iwfm.headall_cache(heads_file)
+    else:
+        hd = iwfm.heads_for_dates(heads_file, out_dates)  
 
-        #  Produce coutrour lines map
-        image_name = f'{basename}_Layer_{layer+1}_contour.tiff'        #  Set image file name
-        iplot.map_to_nodes_contour(plot_data, bounding_poly, image_name, title=f'Heads for {out_date}, layer {layer+1}',
-                           label=label, units=units, verbose=verbose )
-        
-        #  Produce filled coutrour map
-        image_name = f'{basename}_Layer_{layer+1}_contourf.tiff'        #  Set image file name
-        iplot.map_to_nodes_contour(plot_data, bounding_poly, image_name, title=f'Heads for {out_date}, layer {layer+1}',
-                           label=label, units=units, contour='filled', verbose=verbose )
-        
+    # map heads for each layer for each date
+    tasks = []
+    for out_date, date_tag in zip(out_dates, date_tags):
+        date_heads = hd.heads_for_date(out_date)
+        for layer in range(len(date_heads)):
+            plot_data = np.column_stack((xy, date_heads[layer]))
+            tasks.append((plot_data, bounding_poly, f'{basename}{date_tag}_Layer_{layer+1}',
+                          f'Heads for {out_date}, layer {layer+1}', label, units, interp, verbose))
 
+    if workers > 1:
+        import multiprocessing as mp
 
+        with mp.Pool(processes=workers) as pool:
+            pool.map(render_layer, tasks)
+    else:
+        for task in tasks:
+            render_layer(task)
+    return
 
 
 if __name__ == '__main__':
@@ -117,7 +163,7 @@ if __name__ == '__main__':
         heads_file = input('IWFM Headall file name: ')
         pre_file   = input('IWFM Preprocessor main file name: ')
         bnds_file  = input('Model boundary CSV file name: ')
-        out_date   = input('Output date: ')
+        out_date   = input('Output date(s), comma-separated: ')
         basename   = input('Output file rootname: ')
 
     iwfm.file_test(heads_file)
@@ -17,14 +17,14 @@
 # -----------------------------------------------------------------------------
 
 
-def headall2shp(heads_file, pre_file, out_date, basename, label='Heads', units='ft', epsg=26910, verbose=True):
+def headall2shp(heads_file, pre_file, out_date, basename, label='Heads', units='ft', epsg=26910, cache=False, verbose=True):
     ''' headall2shp() - Read headall.out file and stratigraphy file and 
             produce head maps
 
     Parameters
     ----------
-    heads_file : str
-        name of headall.out file 
+    heads_file : str or headall_data
+        name of headall.out file, or heads from headall_read_array()
     
     pre_file : str
         name of IWFM Preprocessor main input file
@@ -44,6 +44,9 @@ def headall2shp(heads_file, pre_file, out_date, basename, label='Heads', units='
     epsg : int, default=26910 (NAD 83 UTM 10, CA)
         EPSG projection
     
+    cache : bool, default=False
+        True = read heads from a binary cache of heads_file (see headall_cache)
+
     verbose : bool, default=False
         True = command-line output on
 
@@ -53,6 +56,7 @@ def headall2shp(heads_file, pre_file, out_date, basename, label='Heads', units='
     
     '''
     import os
+    import iwfm as iwfm
     import iwfm.gis as igis
 
 
@@ -63,10 +67,13 @@ def headall2shp(heads_file, pre_file, out_date, basename, label='Heads', units='
     node_coords, node_list, factor = iwfm.iwfm_read_nodes(node_file)
 
     # -- get heads
-    data, layers, dates, nodes = iwfm.headall_read(heads_file)
-
-    # find index of out_date in dates
-    index = dates.index(out_date) * layers
+    if isinstance(heads_file, iwfm.headall_data):
+        date_heads = heads_file.heads_for_date(out_date)
+    elif cache:
+        date_heads = iwfm.headall_cache(heads_file).heads_for_date(out_date)
+    else:
+        date_heads = iwfm.seek_heads(heads_file, out_date)  # read out_date only
+    layers = len(date_heads)
 
     # -- coordinates
     coords = []
@@ -74,9 +81,7 @@ def headall2shp(heads_file, pre_file, out_date, basename, label='Heads', units='
         coords.append([node_coords[i][1], node_coords[i][2]]) 
 
     # get head values for all layers
-    heads = []
-    for layer in range(layers):
-        heads.append(data[index + layer])
+    heads = [date_heads[layer].tolist() for layer in range(layers)]
 
     # -- write shapefiles
     out_date_text = out_date.replace('/', '_')
@@ -17,7 +17,7 @@
 # -----------------------------------------------------------------------------
 
 
-def headall2table(heads_file, output_file, out_date):
+def headall2table(heads_file, output_file, out_date, cache=False):
     ''' headall2table() - Read IWFM headall.out file and write results
         for one date to a table
 
@@ -32,63 +32,31 @@ def headall2table(heads_file, output_file, out_date):
     out_date : str
         date to process, mm/dd/yyyy format
 
+    cache : bool, default=False
+        True = read heads from a binary cache of heads_file (see headall_cache)
+
     Returns
     -------
     nothing
 
     '''
-    import numpy as np
     import pandas as pd
     import iwfm as iwfm
 
-    out_mon = iwfm.month(out_date)
-    out_day = iwfm.day(out_date)
-    out_year = iwfm.year(out_date)
-
-    file_lines = open(heads_file).read().splitlines()  # open and read input file
-
-    start = 5  # skip the first 5 lines
-    line = start
-    nodes = file_lines[line].split()  # read line w/node nos
-    nodes.pop(0)  # remove text
-    nodes.pop(0)  # remove text
-
-    data = []
-    data.append(nodes)
-
-    line += 1
-    item = file_lines[line].split()  # read line w/date
-    data.append(item)
-    end_date = item.pop(0)  # remove the date
-    
-    while line < len(file_lines) - 1:
-        line += 1
-        layer = 1
-        header = []
-        header.append('Node')
-        header.append('Layer ' + str(layer))
-        while file_lines[line][0].isspace():  # get all the lines for this time step
-            item = file_lines[line].split()
-            data.append(item)
-            layer += 1
-            header.append('Layer ' + str(layer))
-            line += 1
-        # now check the date
-        m = iwfm.month(end_date[0:10])
-        d = iwfm.day(end_date[0:10])
-        y = iwfm.year(end_date[0:10])
-        if m == out_mon and d == out_day and y == out_year:
-            out_table = np.asarray(data)
-            df = pd.DataFrame(np.transpose(out_table))
-            df.to_csv(output_file, header=header, index=False)
-            return
+    try:
+        if cache:
+            hd = iwfm.headall_cache(heads_file)
+            date_heads, nodes = hd.heads_for_date(out_date), hd.nodes
         else:
-            data = []
-            data.append(nodes)
-            item = file_lines[line].split()  # read line w/date
-            data.append(item)
-            end_date = item.pop(0)  # remove the date
-
+            _, _, nodes, _ = iwfm.headall_index(heads_file)
+            date_heads = iwfm.seek_heads(heads_file, out_date)
+    except ValueError:  # out_date is not in heads_file
+        return
+
+    header = ['Layer ' + str(layer + 1) for layer in range(len(date_heads))]
+    df = pd.DataFrame(date_heads.T, columns=header)
+    df.insert(0, 'Node', nodes)
+    df.to_csv(output_file, index=False)
     return
 
 
@@ -17,18 +17,21 @@
 # -----------------------------------------------------------------------------
 
 
-def headall2ts(input_file, output_file, verbose=False):
+def headall2ts(input_file, output_file, cache=False, verbose=False):
     ''' headall2ts() - Read an IWFM HeadAll.out file and write out as a time
         series with one csv file for each layer
 
     Parameters
     ----------
-    input_file : str
-        IWFM headall.out file name
+    input_file : str or headall_data
+        IWFM headall.out file name, or heads from headall_read_array()
     
     output_file : str
         output csv file base name
     
+    cache : bool, default=False
+        True = read heads from a binary cache of input_file (see headall_cache)
+
     verbose : bool, default=False
         True = command-line output on
     
@@ -40,9 +43,12 @@ def headall2ts(input_file, output_file, verbose=False):
     '''
     import iwfm as iwfm
 
-    data, layers, dates, nodes = iwfm.headall_read(input_file)
-    iwfm.headall2csv(data, layers, dates, nodes, output_file, verbose=verbose)
-    return layers
+    if isinstance(input_file, iwfm.headall_data):
+        hd = input_file
+    else:
+        hd = iwfm.headall_read_array(input_file, cache=cache)
+    iwfm.headall2csv(hd, output_file=output_file, verbose=verbose)
+    return hd.layers
 
 
 if __name__ == '__main__':
@@ -0,0 +1,126 @@
+# headall_cache.py
+# Convert headall.out file to a memory-mapped binary cache and read it
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def headall_cache(heads_file, skip=5, dtype='float64', chunk_steps=100, rebuild=False, verbose=False):
+    ''' headall_cache() - Returns the heads from an IWFM HeadAll.out file
+        as a memory-mapped numpy array. The first call converts the text file
+        to two binary cache files next to it, heads_file + '.heads.npy' and
+        heads_file + '.meta.npz'. Later calls memory-map the cache, so only
+        the pages that are used are read from disk. The cache is rebuilt when
+        the size, modification time or a hash of the first and last blocks of
+        heads_file have changed.
+
+    Parameters
+    ----------
+    heads_file : str
+        IWFM HeadAll.out file name
+
+    skip : int, default=5
+        number of header lines
+
+    dtype : str, default='float64'
+        numpy data type of the cached heads
+
+    chunk_steps : int, default=100
+        number of time steps parsed at a time when building the cache
+
+    rebuild : bool, default=False
+        True = rebuild the cache even if it is up to date
+
+    verbose : bool, default=False
+        True = command-line output on
+
+    Returns
+    -------
+    hd : headall_data
+        heads, dates and nodes, with heads a read-only numpy memmap
+
+    '''
+    import hashlib
+    import os
+    import numpy as np
+    import iwfm as iwfm
+
+    heads_cache = heads_file + '.heads.npy'
+    meta_cache = heads_file + '.meta.npz'
+
+    # -- stamp of the source file
+    stat = os.stat(heads_file)
+    h = hashlib.sha1()
+    with open(heads_file, 'rb') as f:
+        h.update(f.read(1 << 20))
+        f.seek(max(0, stat.st_size - (1 << 20)))
+        h.update(f.read())
+    stamp = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+    digest = h.hexdigest()
+
+    if not rebuild and os.path.isfile(heads_cache) and os.path.isfile(meta_cache):
+        with np.load(meta_cache) as meta:
+            if (np.array_equal(meta['stamp'], stamp) and str(meta['digest']) == digest
+                    and str(meta['dtype']) == np.dtype(dtype).name and int(meta['skip']) == skip):
+                heads = np.load(heads_cache, mmap_mode='r')
+                if verbose:
+                    print(f'  Read cached heads from {heads_cache}')
+                return iwfm.headall_data(heads, meta['dates'], meta['nodes'])
+
+    # -- build the cache one chunk at a time
+    nodes, layers, ntimes = iwfm.headall_header(heads_file, skip=skip)
+
+    tmp_file = heads_cache + '.tmp.npy'
+    heads = np.lib.format.open_memmap(tmp_file, mode='w+', dtype=dtype,
+                                      shape=(ntimes, layers, len(nodes)))
+    dates = np.empty(ntimes, dtype='datetime64[D]')
+
+    step = 0
+    for chunk_dates, chunk in iwfm.headall_chunks(heads_file, layers, skip=skip,
+                                                  dtype=dtype, chunk_steps=chunk_steps):
+        heads[step:step + len(chunk)] = chunk
+        dates[step:step + len(chunk)] = chunk_dates
+        step += len(chunk)
+    heads.flush()
+    del heads
+    os.replace(tmp_file, heads_cache)
+
+    np.savez(meta_cache, dates=dates, nodes=nodes, stamp=stamp, digest=digest,
+             dtype=np.dtype(dtype).name, skip=skip)
+    if verbose:
+        print(f'  Wrote heads cache to {heads_cache}')
+
+    heads = np.load(heads_cache, mmap_mode='r')
+    return iwfm.headall_data(heads, dates, nodes)
+
+
+if __name__ == '__main__':
+    ' Run headall_cache() from command line '
+    import sys
+    import iwfm.debug as idb
+    import iwfm as iwfm
+
+    if len(sys.argv) > 1:  # arguments are listed on the command line
+        heads_file = sys.argv[1]
+    else:  # ask for file names from terminal
+        heads_file = input('IWFM Headall file name: ')
+
+    iwfm.file_test(heads_file)
+
+    idb.exe_time()  # initialize timer
+    hd = headall_cache(heads_file, rebuild=True, verbose=True)
+
+    print(f'  Cached {hd.n_times} time steps, {hd.layers} layers and {hd.n_nodes} nodes.')
+    idb.exe_time()  # print elapsed time
@@ -0,0 +1,71 @@
+# headall_chunks.py
+# Read headall.out file as a series of numpy arrays of time steps
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def headall_chunks(input_file, layers, skip=5, dtype='float64', chunk_steps=100):
+    ''' headall_chunks() - Generator that reads an IWFM HeadAll.out file
+        and yields the dates and heads for chunk_steps time steps at a time,
+        so only one chunk is held in memory
+
+    Parameters
+    ----------
+    input_file : str
+        IWFM HeadAll.out file name
+
+    layers : int
+        number of model layers, from headall_header()
+
+    skip : int, default=5
+        number of header lines
+
+    dtype : str, default='float64'
+        numpy data type of the heads
+
+    chunk_steps : int, default=100
+        number of time steps in each chunk
+
+    Yields
+    ------
+    dates : numpy array
+        time step dates of this chunk, dtype datetime64[D]
+
+    heads : numpy array
+        heads of this chunk, shape (nsteps, layers, n_nodes)
+
+    '''
+    import itertools
+    import numpy as np
+
+    with open(input_file) as f:
+        for _ in range(skip + 1):
+            f.readline()
+
+        while True:
+            chunk = [l for l in itertools.islice(f, chunk_steps * layers) if l.strip()]
+            nsteps = len(chunk) // layers
+            if nsteps == 0:
+                return
+            chunk = chunk[:nsteps * layers]
+
+            dates = []
+            for i in range(0, len(chunk), layers):
+                date, chunk[i] = chunk[i].split(maxsplit=1)
+                dates.append(f'{date[6:10]}-{date[0:2]}-{date[3:5]}')
+
+            heads = np.fromstring(' '.join(chunk), dtype=dtype, sep=' ')
+            yield np.array(dates, dtype='datetime64[D]'), heads.reshape(nsteps, layers, -1)
@@ -0,0 +1,86 @@
+# headall_data.py
+# Python class for IWFM HeadAll.out heads held in a numpy array
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+class headall_data:
+    ''' headall_data - Heads from an IWFM HeadAll.out file as a numpy array
+        of shape (n_times, n_layers, n_nodes), with simulation dates as
+        numpy datetime64 values and model node numbers as integers
+
+    Parameters
+    ----------
+    heads : numpy array
+        heads, shape (n_times, n_layers, n_nodes)
+
+    dates : numpy array
+        simulation time step dates, dtype datetime64[D]
+
+    nodes : numpy array
+        model node numbers corresponding to the last axis of heads
+
+    '''
+
+    def __init__(self, heads, dates, nodes):
+        self.heads = heads
+        self.dates = dates
+        self.nodes = nodes
+
+    @property
+    def n_times(self):
+        return self.heads.shape[0]
+
+    @property
+    def layers(self):
+        return self.heads.shape[1]
+
+    @property
+    def n_nodes(self):
+        return self.heads.shape[2]
+
+    def date_strings(self):
+        ''' date_strings() - Return the dates as a list of MM/DD/YYYY strings'''
+        return [f'{d[5:7]}/{d[8:10]}/{d[0:4]}' for d in self.dates.astype(str)]
+
+    def date_index(self, date):
+        ''' date_index() - Return the time step index of date, either a
+            MM/DD/YYYY string or a numpy datetime64, like list.index()'''
+        import numpy as np
+        import iwfm as iwfm
+
+        if isinstance(date, str):
+            date = np.datetime64(f'{iwfm.year(date):04d}-{iwfm.month(date):02d}-{iwfm.day(date):02d}')
+        index = np.searchsorted(self.dates, date)
+        if index == len(self.dates) or self.dates[index] != date:
+            raise ValueError(f'{date} is not in the HeadAll dates')
+        return int(index)
+
+    def layer(self, layer):
+        ''' layer() - Return a (n_times, n_nodes) view of the heads in
+            model layer, zero-based'''
+        return self.heads[:, layer, :]
+
+    def heads_for_date(self, date):
+        ''' heads_for_date() - Return a (n_layers, n_nodes) view of the heads
+            for date'''
+        return self.heads[self.date_index(date)]
+
+    def as_lists(self):
+        ''' as_lists() - Return data, layers, dates, nodes in the form
+            returned by headall_read()'''
+        data = self.heads.reshape(-1, self.n_nodes).tolist()
+        return data, self.layers, self.date_strings(), [str(n) for n in self.nodes]
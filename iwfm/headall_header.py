@@ -0,0 +1,68 @@
+# headall_header.py
+# Read the node numbers, layers and time steps of a headall.out file
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def headall_header(input_file, skip=5):
+    ''' headall_header() - Reads the header of an IWFM HeadAll.out file and
+        counts the lines to return the model nodes, number of layers and
+        number of time steps, without parsing the heads
+
+    Parameters
+    ----------
+    input_file : str
+        IWFM HeadAll.out file name
+
+    skip : int, default=5
+        number of header lines
+
+    Returns
+    -------
+    nodes : numpy array
+        model node numbers
+
+    layers : int
+        number of model layers
+
+    ntimes : int
+        number of time steps
+
+    '''
+    import os
+    import numpy as np
+
+    with open(input_file) as f:
+        for _ in range(skip):
+            f.readline()
+        nodes = np.array(f.readline().split()[2:], dtype=int)
+
+        layers = 1
+        f.readline()  # first date line
+        while f.readline()[:1].isspace():
+            layers += 1
+
+    # -- count lines up to the last non-blank line
+    nlines = 0
+    with open(input_file, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 24), b''):
+            nlines += block.count(b'\n')
+        f.seek(max(0, os.path.getsize(input_file) - 65536))
+        tail = f.read()
+    nlines = nlines - tail[len(tail.rstrip()):].count(b'\n') + 1
+
+    ntimes = (nlines - skip - 1) // layers
+    return nodes, layers, ntimes
@@ -0,0 +1,94 @@
+# headall_index.py
+# Build an index of the byte offset of each time step in a headall.out file
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def headall_index(heads_file, skip=5, save=True, rebuild=False):
+    ''' headall_index() - Returns the byte offset and date of each time step
+        in an IWFM HeadAll.out file. The index is saved next to the file as
+        heads_file + '.index.npz' and reused until the size or modification
+        time of heads_file changes.
+
+    Parameters
+    ----------
+    heads_file : str
+        IWFM HeadAll.out file name
+
+    skip : int, default=5
+        number of header lines
+
+    save : bool, default=True
+        True = save the index to heads_file + '.index.npz'
+
+    rebuild : bool, default=False
+        True = rebuild the index even if it is up to date
+
+    Returns
+    -------
+    offsets : numpy array
+        byte offset of the first line of each time step
+
+    dates : numpy array
+        date of each time step, dtype datetime64[D]
+
+    nodes : numpy array
+        model node numbers
+
+    layers : int
+        number of model layers
+
+    '''
+    import os
+    import numpy as np
+
+    index_file = heads_file + '.index.npz'
+
+    stat = os.stat(heads_file)
+    stamp = np.array([stat.st_size, stat.st_mtime_ns, skip], dtype=np.int64)
+
+    if not rebuild and os.path.isfile(index_file):
+        with np.load(index_file) as index:
+            if np.array_equal(index['stamp'], stamp):
+                return index['offsets'], index['dates'], index['nodes'], int(index['layers'])
+
+    offsets, dates = [], []
+    with open(heads_file, 'rb') as f:
+        for _ in range(skip):
+            f.readline()
+        nodes = np.array(f.readline().split()[2:], dtype=int)
+
+        offset = f.tell()
+        nlines = 0
+        for line in f:
+            if not line[:1].isspace():  # date line starts a time step
+                offsets.append(offset)
+                dates.append(f'{line[6:10].decode()}-{line[0:2].decode()}-{line[3:5].decode()}')
+            if line.strip():
+                nlines += 1
+            offset += len(line)
+
+    offsets = np.array(offsets, dtype=np.int64)
+    dates = np.array(dates, dtype='datetime64[D]')
+    layers = nlines // max(len(offsets), 1)
+
+    if save:
+        try:
+            np.savez(index_file, offsets=offsets, dates=dates, nodes=nodes,
+                     layers=layers, stamp=stamp)
+        except OSError:  # read-only directory, keep the index in memory
+            pass
+    return offsets, dates, nodes, layers
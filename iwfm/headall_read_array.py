@@ -0,0 +1,87 @@
+# headall_read_array.py
+# Read headall.out file in chunks into a numpy array
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def headall_read_array(input_file, skip=5, dtype='float64', chunk_steps=100, cache=False):
+    ''' headall_read_array() - Reads an IWFM HeadAll.out file in chunks of
+        time steps into a preallocated numpy array of shape
+        (n_times, n_layers, n_nodes)
+
+    Parameters
+    ----------
+    input_file : str
+        IWFM HeadAll.out file name
+
+    skip : int, default=5
+        number of header lines
+
+    dtype : str, default='float64'
+        numpy data type of the heads array, 'float32' halves memory use
+
+    chunk_steps : int, default=100
+        number of time steps parsed at a time
+
+    cache : bool, default=False
+        True = read the heads from a binary cache file next to input_file,
+        building it first if it is missing or out of date (see headall_cache)
+
+    Returns
+    -------
+    hd : headall_data
+        heads, dates and nodes from the headall file
+
+    '''
+    import numpy as np
+    import iwfm as iwfm
+
+    if cache:
+        return iwfm.headall_cache(input_file, skip=skip, dtype=dtype, chunk_steps=chunk_steps)
+
+    nodes, layers, ntimes = iwfm.headall_header(input_file, skip=skip)
+
+    heads = np.empty((ntimes, layers, len(nodes)), dtype=dtype)
+    dates = np.empty(ntimes, dtype='datetime64[D]')
+
+    step = 0
+    for chunk_dates, chunk in iwfm.headall_chunks(input_file, layers, skip=skip,
+                                                  dtype=dtype, chunk_steps=chunk_steps):
+        heads[step:step + len(chunk)] = chunk
+        dates[step:step + len(chunk)] = chunk_dates
+        step += len(chunk)
+
+    return iwfm.headall_data(heads, dates, nodes)
+
+
+if __name__ == '__main__':
+    ' Run headall_read_array() from command line '
+    import sys
+    import iwfm.debug as idb
+    import iwfm as iwfm
+
+    if len(sys.argv) > 1:  # arguments are listed on the command line
+        heads_file = sys.argv[1]
+    else:  # ask for file names from terminal
+        heads_file = input('IWFM Headall file name: ')
+
+    iwfm.file_test(heads_file)
+
+    idb.exe_time()  # initialize timer
+    hd = headall_read_array(heads_file)
+
+    print(f'  Read {hd.n_times} time steps, {hd.layers} layers and {hd.n_nodes} nodes from {heads_file}.')
+    idb.exe_time()  # print elapsed time
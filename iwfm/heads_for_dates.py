@@ -0,0 +1,64 @@
+# heads_for_dates.py
+# Read the heads for a list of dates from a headall.out file
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def heads_for_dates(heads_file, out_dates, skip=5, dtype='float64'):
+    ''' heads_for_dates() - Read the heads for a list of dates from an IWFM
+        HeadAll.out file, seeking to each time step with headall_index()
+        so only the requested time steps are read
+
+    Parameters
+    ----------
+    heads_file : str
+        IWFM HeadAll.out file name
+
+    out_dates : list
+        dates, as MM/DD/YYYY strings or numpy datetime64
+
+    skip : int, default=5
+        number of header lines
+
+    dtype : str, default='float64'
+        numpy data type of the heads
+
+    Returns
+    -------
+    hd : headall_data
+        heads for out_dates, in date order with repeated dates once, so
+        hd.date_index() works for every requested date
+
+    '''
+    import numpy as np
+    import iwfm as iwfm
+
+    offsets, dates, nodes, layers = iwfm.headall_index(heads_file, skip=skip)
+    index = iwfm.headall_data(None, dates, nodes)
+
+    # sorted and unique, headall_data.date_index() needs sorted dates
+    steps = sorted(set(index.date_index(d) for d in out_dates))
+
+    heads = np.empty((len(steps), layers, len(nodes)), dtype=dtype)
+    with open(heads_file, 'rb') as f:
+        for i, step in enumerate(steps):
+            f.seek(offsets[step])
+            lines = [f.readline() for _ in range(layers)]
+            lines[0] = lines[0].split(maxsplit=1)[1]  # remove the date
+            heads[i] = np.fromstring(b' '.join(lines).decode(), dtype=dtype,
+                                     sep=' ').reshape(layers, -1)
+
+    return iwfm.headall_data(heads, dates[steps], nodes)
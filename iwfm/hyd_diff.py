@@ -37,24 +37,23 @@ def hyd_diff(gwhyd_file_1, gwhyd_file_2, outname):
 
     '''
 
-    import iwfm.pad_back as pad
+    import itertools
+    import iwfm as iwfm
 
-    gwhyd_lines_1 = (open(gwhyd_file_1).read().splitlines())
-    gwhyd_lines_2 = (open(gwhyd_file_2).read().splitlines())
+    values_1, dates, hyd_names = iwfm.read_hyd_array(gwhyd_file_1)
+    values_2 = iwfm.read_hyd_array(gwhyd_file_2)[0]
 
-    gwhyd_lines_out = gwhyd_lines_1[0:9]
+    with open(gwhyd_file_1) as f:
+      gwhyd_lines_out = [line.rstrip('\n') for line in itertools.takewhile(lambda l: not l[:1].isdigit(), f)]
 
-    for i in range(9, len(gwhyd_lines_1)):
-      temp1 = gwhyd_lines_1[i].split()
-      temp2 = gwhyd_lines_2[i].split()
-      as_str = temp1[0] + '           '
-      for j in range(1,len(temp1)):
-        as_str += pad(round(float(temp1[j]) - float(temp2[j]),4),16)
+    diff = (values_1 - values_2[:len(values_1)]).tolist()
+    for date, row in zip(dates.astype(str).tolist(), diff):
+      as_str = f'{date[5:7]}/{date[8:10]}/{date[0:4]}_24:00' + '           '
+      as_str += ''.join(str(round(value, 4)).ljust(16) for value in row)
       gwhyd_lines_out.append(as_str)
 
     with open(outname, 'w') as f:
-      for line in gwhyd_lines_out:
-        f.write("%s\n" % line )
+      f.write(''.join(f'{line}\n' for line in gwhyd_lines_out))
 
     return
 
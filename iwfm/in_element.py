@@ -20,7 +20,8 @@
 
 def in_element(e_nodes, e_nos, d_nodexy, x, y):
     ''' in_element() - Returns the element containing the point (x,y), 
-        or 0 if not in any element
+        or 0 if not in any element. To locate many points, build one
+        elem_locator and call its locate_points() method.
 
     Parameters
     ----------
@@ -44,21 +45,7 @@ def in_element(e_nodes, e_nos, d_nodexy, x, y):
     Integer element number of element containing point, or 0 if none
     
     '''
-    from shapely.geometry import Polygon, Points
+    import iwfm as iwfm
 
-    point = Point(x, y)
-
-    # brute force - cycle through all elements until contains() is true
-    for i in range(0, len(e_nodes)):  
-        points = []
-        points.append(d_nodexy[e_nodes[i][0]])
-        points.append(d_nodexy[e_nodes[i][1]])
-        points.append(d_nodexy[e_nodes[i][2]])
-        if len(e_nodes[i]) > 3:
-            points.append(d_nodexy[e_nodes[i][3]])
-
-        polygon = Polygon(points)
-
-        if polygon.contains(point):
-            return e_nos[i]  # if contains() is true, end and return element number
-    return 0  # point is not inside any element
+    locator = iwfm.elem_locator(e_nos, e_nodes, d_nodexy)
+    return int(locator.locate_points([(x, y)])[0])
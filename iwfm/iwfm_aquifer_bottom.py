@@ -33,12 +33,4 @@ def iwfm_aquifer_bottom(strat):
     '''
     import iwfm as iwfm
 
-    (
-        aquitard_thick,
-        aquifer_thick,
-        aquitard_top,
-        aquitard_bot,
-        aquifer_top,
-        aquifer_bot,
-    ) = iwfm.iwfm_strat_arrays(strat)
-    return aquifer_bot
+    return iwfm.stratigraphy(strat).aquifer_bottom.tolist()
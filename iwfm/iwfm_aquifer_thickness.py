@@ -33,5 +33,4 @@ def iwfm_aquifer_thickness(strat):
     '''
     import iwfm as iwfm
 
-    _, aquifer_thick, _ = iwfm.iwfm_strat_arrays(strat)
-    return aquifer_thick
+    return iwfm.stratigraphy(strat).aquifer_thick.tolist()
@@ -33,5 +33,4 @@ def iwfm_aquitard_thickness(strat):
     '''
     import iwfm as iwfm
 
-    aquitard_thick, _ = iwfm.iwfm_strat_arrays(strat)
-    return aquitard_thick
+    return iwfm.stratigraphy(strat).aquitard_thick.tolist()
@@ -18,11 +18,34 @@
 
 import iwfm as iwfm
 import re
-from shapely.geometry import Point, Polygon
+from pathlib import Path
 
 
 class iwfm_model:
-    def __init__(self, pre_fpath, sim_file, verbose=False):
+    ''' iwfm_model - IWFM model information.  With lazy=True only the file
+        names are stored, and each component is read from its input file
+        the first time one of its attributes is used.  preload() reads
+        components ahead of time and release() frees them.'''
+
+    # -- model components and the attributes each one sets
+    components = {
+        'preproc':  ['pre_files_dict'],
+        'nodes':    ['inodes', 'd_nodes', 'd_nodexy'],
+        'elements': ['elements', 'e_nos', 'd_elem_nodes', 'd_elem_sub'],
+        'polygons': ['d_elem_polys'],
+        'locator':  ['locator'],
+        'mesh':     ['mesh'],
+        'strat':    ['strat', 'stratigraphy', 'elevation', 'd_nodeelev'],
+        'streams':  ['nreach', 'n_rating', 'sreach_list', 'stnodes_dict'],
+        'network':  ['stream_net'],
+        'lakes':    ['nlakes', 'lakes', 'lake_elems'],
+        'sim':      ['sim_files_dict'],
+    }
+
+    # -- components read by the constructor when lazy=False
+    eager = ['preproc', 'nodes', 'elements', 'polygons', 'strat', 'sim']
+
+    def __init__(self, pre_fpath, sim_file, verbose=False, lazy=False):
         self.mtype = 'IWFM'
         fpath_line = pre_fpath.split('\\')  # Preprocessor file path to list
         self.pre_file = fpath_line.pop(
@@ -32,66 +55,350 @@ class iwfm_model:
             '/'.join(fpath_line)
         )  # put back together as Path object for all OSs
         self.sim_file = sim_file  # simulation file name
+        self.verbose = verbose
 
-        if verbose:
-            print('\n  Reading IWFM Files')
+        if not lazy:
+            if verbose:
+                print('\n  Reading IWFM Files')
+            self.preload(self.eager)
+        return
 
-        # -- read preprocessor main file
-        currfile = self.pre_folder / self.pre_file
-        if verbose:
-            print(f'    IWFM pre-processor file: \t{currfile}')
-        self.read_preproc(currfile)
 
-        # -- read preprocessor node file
-        currfile = self.pre_folder / self.pre_files_dict['node_file']
-        if verbose:
-            print(f'    IWFM node file:          \t{currfile}')
-        self.read_nodes(currfile)
+    def __getattr__(self, name):
+        ''' __getattr__() - Read the component that sets attribute name on 
+            first access'''
+        for component, names in iwfm_model.components.items():
+            if name in names:
+                self.load(component)
+                if name in self.__dict__:
+                    return self.__dict__[name]
+                break
+        raise AttributeError(f"'iwfm_model' object has no attribute '{name}'")
+
+
+    def preload(self, components=None):
+        ''' preload() - Read the listed components now instead of on first
+            access. components = None reads all components.'''
+        if components is None:
+            components = list(iwfm_model.components)
+        elif isinstance(components, str):
+            components = [components]
+        for component in components:
+            if not self.loaded(component):
+                self.load(component)
+        return
 
-        # -- read preprocessor element file
-        currfile = self.pre_folder / self.pre_files_dict['elem_file']
-        if verbose:
-            print(f'    IWFM elements file:      \t{currfile}')
-        self.read_elements(currfile)
 
-        # -- read preprocessor stratigraphy file
-        currfile = self.pre_folder / self.pre_files_dict['strat_file']
-        if verbose:
-            print(f'    IWFM stratigraphy file:  \t{currfile}')
-        self.read_strat(currfile)
+    def release(self, components=None):
+        ''' release() - Free the memory used by the listed components. They
+            are read again on next access. components = None releases all
+            components.'''
+        if components is None:
+            components = list(iwfm_model.components)
+        elif isinstance(components, str):
+            components = [components]
+        for component in components:
+            for name in iwfm_model.components[component]:
+                self.__dict__.pop(name, None)
+        return
+
+
+    def loaded(self, component):
+        ''' loaded() - Return True if component has been read'''
+        return all(name in self.__dict__ for name in iwfm_model.components[component])
+
+
+    def load(self, component):
+        ''' load() - Read one component from the snapshot file if it holds
+            the component, otherwise from its input file'''
+        verbose = self.__dict__.get('verbose', False)
+        if component in self.__dict__.get('snapshot_header', {}).get('components', []):
+            self.read_snapshot(component)
+        elif component == 'preproc':
+            currfile = self.pre_folder / self.pre_file
+            if verbose:
+                print(f'    IWFM pre-processor file: \t{currfile}')
+            self.read_preproc(currfile)
+        elif component == 'nodes':
+            currfile = self.pre_folder / self.pre_files_dict['node_file']
+            if verbose:
+                print(f'    IWFM node file:          \t{currfile}')
+            self.read_nodes(currfile)
+        elif component == 'elements':
+            currfile = self.pre_folder / self.pre_files_dict['elem_file']
+            if verbose:
+                print(f'    IWFM elements file:      \t{currfile}')
+            self.read_elements(currfile)
+        elif component == 'polygons':
+            self.elems2poly()
+        elif component == 'mesh':
+            self.mesh = iwfm.mesh(self.d_nodexy, [self.d_elem_nodes[e] for e in self.e_nos], self.e_nos)
+        elif component == 'locator':
+            self.locator = iwfm.elem_locator(self.e_nos, [self.d_elem_nodes[e] for e in self.e_nos],
+                                             self.d_nodexy)
+        elif component == 'strat':
+            currfile = self.pre_folder / self.pre_files_dict['strat_file']
+            if verbose:
+                print(f'    IWFM stratigraphy file:  \t{currfile}')
+            self.read_strat(currfile)
+        elif component == 'streams':
+            currfile = self.pre_folder / self.pre_files_dict['stream_file']
+            if verbose:
+                print(f'    IWFM stream file:        \t{currfile}')
+            self.read_streams_pre(currfile)
+        elif component == 'network':
+            self.stream_net = iwfm.stream_network(self.sreach_list, self.stnodes_dict)
+        elif component == 'lakes':
+            if self.pre_files_dict['lake_file'] == '':  # no lakes
+                self.nlakes, self.lakes, self.lake_elems = 0, [], []
+            else:
+                currfile = self.pre_folder / self.pre_files_dict['lake_file']
+                if verbose:
+                    print(f'    IWFM lake file:          \t{currfile}')
+                self.read_lake_pre(currfile)
+        elif component == 'sim':
+            currfile = self.sim_file
+            if verbose:
+                print(f'    IWFM simulation main file:\t{currfile}')
+            self.read_sim(currfile)
+        else:
+            raise ValueError(f'Unknown iwfm_model component: {component}')
+        return
 
-        # -- read simulation main file 
-        currfile = self.sim_file
+
+    # -- binary snapshot of the model
+    snapshot_version = 1
+
+    def source_files(self):
+        ''' source_files() - Return a dictionary of the input file read for
+            each component'''
+        files = {'preproc': self.pre_folder / self.pre_file, 'sim': Path(self.sim_file)}
+        for component, key in [('nodes', 'node_file'), ('elements', 'elem_file'),
+                               ('strat', 'strat_file'), ('streams', 'stream_file'),
+                               ('lakes', 'lake_file')]:
+            if self.pre_files_dict[key] != '':
+                files[component] = self.pre_folder / self.pre_files_dict[key]
+        return files
+
+
+    @staticmethod
+    def file_hash(filename):
+        ''' file_hash() - Return the sha1 hash of a file'''
+        import hashlib
+
+        h = hashlib.sha1()
+        with open(filename, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        return h.hexdigest()
+
+
+    def save_snapshot(self, snapshot_file, components=None):
+        ''' save_snapshot() - Save the model components to one binary file
+            for load_snapshot(). The file holds a JSON header with the file
+            dictionaries and the sha1 hash of each input file, followed by
+            the node, element, stratigraphy, stream and lake arrays.
+            components = None saves all components except the element
+            polygons, element locator, mesh and stream network, which are
+            rebuilt from the nodes, elements and streams.'''
+        import json
+        import os
+        import numpy as np
+
+        if components is None:
+            components = list(iwfm_model.components)
+        components = [c for c in components if c not in ('polygons', 'locator', 'mesh', 'network')]
+        self.preload(components)
+
+        header = {'version': iwfm_model.snapshot_version, 'components': components,
+                  'pre_folder': os.path.abspath(self.pre_folder), 'pre_file': self.pre_file,
+                  'sim_file': os.path.abspath(self.sim_file), 'scalars': {}}
+        sources = self.source_files()
+        header['sources'] = {c: [os.path.abspath(sources[c]), iwfm_model.file_hash(sources[c])]
+                             for c in components if c in sources}
+
+        arrays = {}
+        if 'preproc' in components:
+            header['pre_files_dict'] = self.pre_files_dict
+        if 'sim' in components:
+            header['sim_files_dict'] = {k: str(v) for k, v in self.sim_files_dict.items()}
+            header['sim_paths'] = [k for k, v in self.sim_files_dict.items() if isinstance(v, Path)]
+        if 'nodes' in components:
+            arrays['node_ids'] = np.array(list(self.d_nodes.values()), dtype=np.int64)
+            arrays['node_xy'] = np.array([self.d_nodexy[n] for n in self.d_nodes.values()],
+                                         dtype=np.float64).reshape(-1, 2)
+        if 'elements' in components:
+            arrays['elem_ids'] = np.array(self.e_nos, dtype=np.int64)
+            arrays['elem_nodes'] = np.array([self.d_elem_nodes[e] + [0] * (4 - len(self.d_elem_nodes[e]))
+                                             for e in self.e_nos], dtype=np.int64).reshape(-1, 4)
+            arrays['elem_sub'] = np.array([self.d_elem_sub[e] for e in self.e_nos], dtype=np.int64)
+        if 'strat' in components:
+            arrays['strat'] = np.array(self.strat, dtype=np.float64)
+        if 'streams' in components:
+            header['scalars'].update(nreach=self.nreach, n_rating=self.n_rating)
+            snodes = list(self.stnodes_dict)
+            arrays['sreach'] = np.array(self.sreach_list, dtype=np.int64).reshape(-1, 4)
+            arrays['stnode_ids'] = np.array(snodes, dtype=np.int64)
+            arrays['stnode_info'] = np.array([self.stnodes_dict[s][:2] for s in snodes],
+                                             dtype=np.int64).reshape(-1, 2)
+            arrays['stnode_bottom'] = np.array([self.stnodes_dict[s][2] for s in snodes], dtype=np.float64)
+        if 'lakes' in components:
+            header['scalars'].update(nlakes=self.nlakes)
+            arrays['lakes'] = np.array(self.lakes, dtype=np.float64).reshape(-1, 4)
+            arrays['lake_elems'] = np.array(self.lake_elems, dtype=np.int64).reshape(-1, 2)
+
+        # -- array offsets from the start of the data, 64-byte aligned
+        layout, offset = {}, 0
+        for name, a in arrays.items():
+            layout[name] = [a.dtype.str, list(a.shape), offset]
+            offset += -(-a.nbytes // 64) * 64
+        header['arrays'] = layout
+
+        text = json.dumps(header).encode()
+        start = -(-(16 + len(text)) // 64) * 64
+
+        tmp_file = str(snapshot_file) + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(b'IWFMSNAP')
+            f.write(np.uint64(len(text)).tobytes())
+            f.write(text)
+            for name, a in arrays.items():
+                f.seek(start + layout[name][2])
+                f.write(np.ascontiguousarray(a).tobytes())
+        os.replace(tmp_file, snapshot_file)
+        return
+
+
+    @staticmethod
+    def read_snapshot_header(snapshot_file):
+        ''' read_snapshot_header() - Return the header of a snapshot file and
+            the byte offset of its data'''
+        import json
+        import numpy as np
+
+        with open(snapshot_file, 'rb') as f:
+            if f.read(8) != b'IWFMSNAP':
+                raise ValueError(f'{snapshot_file} is not an iwfm_model snapshot file')
+            length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+            header = json.loads(f.read(length).decode())
+        if header['version'] != iwfm_model.snapshot_version:
+            raise ValueError(f'{snapshot_file} is snapshot version {header["version"]}, '
+                             f'expected version {iwfm_model.snapshot_version}')
+        return header, -(-(16 + length) // 64) * 64
+
+
+    @staticmethod
+    def snapshot_stale(snapshot_file):
+        ''' snapshot_stale() - Return a list of the input files that have 
+            changed or no longer exist since the snapshot was saved. Input
+            file names are absolute, so the check does not depend on the
+            working directory.'''
+        import os
+
+        header, _ = iwfm_model.read_snapshot_header(snapshot_file)
+        return [source for source, digest in header['sources'].values()
+                if not os.path.isfile(source) or iwfm_model.file_hash(source) != digest]
+
+
+    @classmethod
+    def load_snapshot(cls, snapshot_file, check=True, verbose=False):
+        ''' load_snapshot() - Return a model from a snapshot file saved by
+            save_snapshot(). The arrays are memory-mapped and each component
+            is built from them on first access. If check is True and an
+            input file has changed since the snapshot was saved, the model
+            reads its components from the input files instead.'''
+        import numpy as np
+
+        header, start = cls.read_snapshot_header(snapshot_file)
+
+        model = cls.__new__(cls)
+        model.mtype = 'IWFM'
+        model.pre_file = header['pre_file']
+        model.pre_folder = Path(header['pre_folder'])
+        model.sim_file = header['sim_file']
+        model.verbose = verbose
+
+        stale = cls.snapshot_stale(snapshot_file) if check else []
+        if stale:
+            if verbose:
+                print(f'  Snapshot {snapshot_file} is out of date, reading input files')
+            return model
+
+        data = np.memmap(snapshot_file, dtype=np.uint8, mode='r')
+        model.snapshot = {}
+        for name, (dtype, shape, offset) in header['arrays'].items():
+            nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+            model.snapshot[name] = data[start + offset:start + offset + nbytes].view(dtype).reshape(shape)
+        model.snapshot_header = header
         if verbose:
-            print(f'    IWFM simulation main file:\t{currfile}')
-        self.read_sim(currfile)
+            print(f'  Read model snapshot {snapshot_file}')
+        return model
+
+
+    def read_snapshot(self, component):
+        ''' read_snapshot() - Build one component from the snapshot arrays'''
+        s, header = self.snapshot, self.snapshot_header
+        if component == 'preproc':
+            self.pre_files_dict = dict(header['pre_files_dict'])
+        elif component == 'sim':
+            self.sim_files_dict = dict(header['sim_files_dict'])
+            for key in header['sim_paths']:
+                self.sim_files_dict[key] = Path(self.sim_files_dict[key])
+        elif component == 'nodes':
+            node_ids = s['node_ids'].tolist()
+            self.inodes = len(node_ids)
+            self.d_nodes = dict(enumerate(node_ids))
+            self.d_nodexy = dict(zip(node_ids, s['node_xy'].tolist()))
+        elif component == 'elements':
+            self.e_nos = s['elem_ids'].tolist()
+            self.elements = len(self.e_nos)
+            self.d_elem_sub = dict(zip(self.e_nos, s['elem_sub'].tolist()))
+            self.d_elem_nodes = {e: nodes[:3] if nodes[3] == 0 else nodes
+                                 for e, nodes in zip(self.e_nos, s['elem_nodes'].tolist())}
+        elif component == 'strat':
+            self.strat = [[int(row[0])] + row[1:] for row in s['strat'].tolist()]
+            self.strat2elev()
+        elif component == 'streams':
+            self.nreach = header['scalars']['nreach']
+            self.n_rating = header['scalars']['n_rating']
+            self.sreach_list = s['sreach'].tolist()
+            self.stnodes_dict = {snode: info + [bottom] for snode, info, bottom in
+                                 zip(s['stnode_ids'].tolist(), s['stnode_info'].tolist(),
+                                     s['stnode_bottom'].tolist())}
+        elif component == 'lakes':
+            self.nlakes = header['scalars']['nlakes']
+            self.lakes = [[int(lake), max_elev, int(next), int(nelem)]
+                          for lake, max_elev, next, nelem in s['lakes'].tolist()]
+            self.lake_elems = s['lake_elems'].tolist()
         return
 
 
     # -- functions to return information
+    @property
     def nlayers(self):
-        return self.nlayers
+        ''' nlayers - Number of model layers, reads the stratigraphy if needed'''
+        return self.stratigraphy.nlayers
 
     def lse(self):
-        return self.lse
+        return self.stratigraphy.lse
 
     def aquifer_thickness(self):
-        return self.aquifer_thick
+        return self.stratigraphy.aquifer_thick
 
     def aquifer_top(self):
-        return self.aquifer_top
+        return self.stratigraphy.aquifer_top
 
     def aquifer_bottom(self):
-        return self.aquifer_bottom
+        return self.stratigraphy.aquifer_bottom
 
     def aquitard_thickness(self):
-        return self.aquitard_thick
+        return self.stratigraphy.aquitard_thick
 
     def aquitard_top(self):
-        return self.aquitard_top
+        return self.stratigraphy.aquitard_top
 
     def aquitard_bottom(self):
-        return self.aquitard_bottom
+        return self.stratigraphy.aquitard_bottom
 
     # -- the functions that do the work 
     def read_preproc(self, pre_file):
@@ -136,15 +443,15 @@ class iwfm_model:
 
         # -- read input file names and create a dictionary 
         self.sim_files_dict = {}
-        preout = iwfm.get_path(sim_lines[line_index].split()[0])  
+        preout = iwfm.file_get_path(sim_lines[line_index].split()[0])  
         self.sim_files_dict['preout'] = preout
 
         line_index = iwfm.skip_ahead(line_index + 1, sim_lines, 0)
-        gw_file = iwfm.get_path(sim_lines[line_index].split()[0]) 
+        gw_file = iwfm.file_get_path(sim_lines[line_index].split()[0]) 
         self.sim_files_dict['gw'] = gw_file
 
         line_index = iwfm.skip_ahead(line_index + 1, sim_lines, 0)
-        stream_file = iwfm.get_path(sim_lines[line_index].split()[0])  
+        stream_file = iwfm.file_get_path(sim_lines[line_index].split()[0])  
         self.sim_files_dict['stream'] = stream_file
 
         line_index = iwfm.skip_ahead(line_index + 1, sim_lines, 0)  
@@ -152,27 +459,27 @@ class iwfm_model:
         if temp[0] == '/':
             lake_file = ''
         else:
-            lake_file = iwfm.get_path(temp)  
+            lake_file = iwfm.file_get_path(temp)  
         self.sim_files_dict['lake'] = lake_file
 
         line_index = iwfm.skip_ahead(line_index + 1, sim_lines, 0)  
-        rz_file = iwfm.get_path(sim_lines[line_index].split()[0])  
+        rz_file = iwfm.file_get_path(sim_lines[line_index].split()[0])  
         self.sim_files_dict['rootzone'] = rz_file
 
         line_index = iwfm.skip_ahead(line_index + 1, sim_lines, 0) 
-        sw_file = iwfm.get_path(sim_lines[line_index].split()[0])
+        sw_file = iwfm.file_get_path(sim_lines[line_index].split()[0])
         self.sim_files_dict['smallwatershed'] = sw_file
 
         line_index = iwfm.skip_ahead(line_index + 1, sim_lines, 0)  
-        us_file = iwfm.get_path(sim_lines[line_index].split()[0])
+        us_file = iwfm.file_get_path(sim_lines[line_index].split()[0])
         self.sim_files_dict['unsat'] = us_file
 
         line_index = iwfm.skip_ahead(line_index + 1, sim_lines, 0) 
-        if_file = iwfm.get_path(sim_lines[line_index].split()[0])
+        if_file = iwfm.file_get_path(sim_lines[line_index].split()[0])
         self.sim_files_dict['irrfrac'] = if_file
 
         line_index = iwfm.skip_ahead(line_index + 1, sim_lines, 0)  
-        sa_file = iwfm.get_path(sim_lines[line_index].split()[0])
+        sa_file = iwfm.file_get_path(sim_lines[line_index].split()[0])
         self.sim_files_dict['supplyadj'] = sa_file
 
         line_index = iwfm.skip_ahead(line_index + 1, sim_lines, 0)  
@@ -180,7 +487,7 @@ class iwfm_model:
         self.sim_files_dict['precip'] = pc_file
 
         line_index = iwfm.skip_ahead(line_index + 1, sim_lines, 0)  
-        et_file = iwfm.get_path(sim_lines[line_index].split()[0]) 
+        et_file = iwfm.file_get_path(sim_lines[line_index].split()[0]) 
         self.sim_files_dict['et'] = et_file
 
         # -- starting date
@@ -218,14 +525,11 @@ class iwfm_model:
 
         line_index = iwfm.skip_ahead(line_index + 1, node_lines, 0)  # skip comments
 
-        self.d_nodes = {}  # initialize nodal info dictionary
-        self.d_nodexy = {}  # initialize elemental info dictionary
-        for i in range(0, self.inodes):  # read nodes information
-            l = node_lines[line_index + i].split()  # get next line
-            inode = int(l.pop(0))  # node number
-            self.d_nodes[i] = inode
-            coords = [float(s) * factor for s in l]
-            self.d_nodexy[inode] = coords
+        table, _ = iwfm.iwfm_read_table(node_lines, line_index, self.inodes, ncols=3)
+        node_ids = table[:, 0].astype(int).tolist()
+
+        self.d_nodes = dict(enumerate(node_ids))  # initialize nodal info dictionary
+        self.d_nodexy = dict(zip(node_ids, (table[:, 1:] * factor).tolist()))  # node coordinates
         return
 
 
@@ -247,19 +551,15 @@ class iwfm_model:
         line_index = iwfm.skip_ahead(line_index + 1, elem_lines, 0)  
         line_index = iwfm.skip_ahead(line_index + 1, elem_lines, subregions - 1)
 
-        self.e_nos = []  # initialize list of elem nos
+        table, _ = iwfm.iwfm_read_table(elem_lines, line_index, self.elements, ncols=6, dtype=int)
+
+        self.e_nos = table[:, 0].tolist()  # list of elem nos
+        self.d_elem_sub = dict(zip(self.e_nos, table[:, 5].tolist()))  # elem subregions
         self.d_elem_nodes = {}  # initialize list of elem nodes
-        self.d_elem_sub = {}  # initialize list of elem subregions
-        for i in range(0, self.elements):  # read element information
-            l = elem_lines[line_index + i].split()  # get the next line
-            this_elem = int(l.pop(0))  # element no of this element
-            self.e_nos.append(this_elem)  # add element no of this element
-            nodes = [int(s) for s in l]
-            self.d_elem_sub[this_elem] = nodes.pop(4)  # subregion of this element
+        for this_elem, nodes in zip(self.e_nos, table[:, 1:5].tolist()):
             if nodes[3] == 0:
                 nodes.pop(3)  # remove empty node on triangles
             self.d_elem_nodes[this_elem] = nodes  # nodes of this element
-        self.elems2poly()  # build polygons
         return
 
 
@@ -271,18 +571,13 @@ class iwfm_model:
 
         char_index = 0  # start at the top
         char_index = iwfm.skip_ahead(char_index, char_lines, 0)  # skip comments
-        self.elem_char = []
-        for i in range(0, len(elem_nodes)):
-            l = char_lines[char_index + i].split()
-            this_elem = int(l.pop(0))
-            chars = []
-            chars.append(int(l.pop(0)))  # rain station
-            chars.append(float(l.pop(0)))  # rain factor
-            chars.append(int(l.pop(0)))  # drainage
-            chars.append(int(l.pop(0)))  # subregion
-            temp = int(l.pop(0))  # don't use
-            chars.append(float(l.pop(0)))  # soil type
-            self.elem_char.append(chars)
+        table, _ = iwfm.iwfm_read_table(char_lines, char_index, len(elem_nodes), ncols=7)
+        self.elem_char = [[int(c[1]),   # rain station
+                           c[2],        # rain factor
+                           int(c[3]),   # drainage
+                           int(c[4]),   # subregion
+                           c[6]]        # soil type
+                          for c in table.tolist()]
         return
 
 
@@ -367,17 +662,12 @@ class iwfm_model:
                 stream_index = iwfm.skip_ahead(stream_index, stream_lines, 0)
 
         # put stream node info into a dictionary
+        snodes_by_id = {snode[0]: snode for snode in snodes_list}
         self.stnodes_dict = {}
         for i in range(0, len(snodes_list)):
-            j = 0
-            while snodes_list[j][0] != i + 1:  # find info for i in snodes list
-                j += 1
-            key, values = i + 1, [
-                snodes_list[j][1],
-                snodes_list[j][2],
-                selev[i],
-            ]  # key = snode, values = GW Node, Reach, Bottom
-            self.stnodes_dict[key] = values
+            snode = snodes_by_id[i + 1]  # info for i in snodes list
+            # key = snode, values = GW Node, Reach, Bottom
+            self.stnodes_dict[i + 1] = [snode[1], snode[2], selev[i]]
         return len(snodes_list)
 
 
@@ -393,42 +683,26 @@ class iwfm_model:
         factor = float(re.findall('\d+', strat_lines[line_index])[0])  # read factor
 
         line_index = iwfm.skip_ahead(line_index + 1, strat_lines, 0)  # skip comments
-        self.strat = []  # initialize list
-        for i in range(0, len(self.d_nodes)):
-            l = strat_lines[line_index + i].split()
-            s = []  # initialize accumulator
-            s.append(int(l.pop(0)))  # node no
-            for j in range(0, len(l)):
-                s.append(factor * float(l.pop(0)))  # lse, etc as floats
-            self.strat.append(s)
-
-        self.nlayers = int((len(self.strat[0]) - 1) / 2)
-        self.elevation = [i[0] for i in self.strat]
-
-        self.d_nodeelev = {}
-        for i in range(0, len(self.strat)):  # cycle through stratigraphy of each node
-            l = self.strat[i]
-
-            this_node = l.pop(0)
-            lse = l.pop(0)
-
-            depth = 0
-            n_strat = []
-            n_strat.append(lse)
-            for j in range(0, self.nlayers):  # cycle through layers for each node
-                t = l.pop(0)  # thickness of aquitard
-                depth += t  # add to total depth
-                n_strat.append(lse - depth)  # bottom of aquitard/top of aquifer
-                a = l.pop(0)  # thickness of aquifer
-                depth += a  # add to total depth
-                n_strat.append(lse - depth)  # bottom of aquifer/top of next aqiutard
-            self.d_nodeelev[this_node] = n_strat
+        table, _ = iwfm.iwfm_read_table(strat_lines, line_index, len(self.d_nodes), ncols=2 * layers + 2)
+        self.strat = [[node] + values for node, values in   # node no, lse, etc as floats
+                      zip(table[:, 0].astype(int).tolist(), (factor * table[:, 1:]).tolist())]
+        self.strat2elev()
+        return
+
+
+    def strat2elev(self):
+        ''' strat2elev() - Compile a dictionary of the layer top and bottom
+            elevations at each node from the stratigraphy table'''
+        self.stratigraphy = iwfm.stratigraphy(self.strat)
+        self.elevation = self.stratigraphy.lse.tolist()
+        self.d_nodeelev = self.stratigraphy.as_dict()
         return
 
 
     def elems2poly(self):
         ''' elem_poly() - Compile a dictionary of model elements as shapely 
             polygons'''
+        from shapely.geometry import Point, Polygon
 
         self.d_elem_polys = {}
         for key in self.d_elem_nodes:  # for each element ...
@@ -450,12 +724,12 @@ class iwfm_model:
     def point_in_elem(self, x, y):
         ''' point_in_elem() - Return the element number if the point (x,y) is 
             in an element, 0 otherwise'''
-        p = Point(x, y)
-        for key in self.d_elem_polys:  # for each element ...
-            elem = key
-            if p.within(self.d_elem_polys[elem]):
-                return elem
-        return 0
+        return int(self.locator.locate_points([(x, y)])[0])
+
+    def locate_points(self, xy):
+        ''' locate_points() - Return an array of the element number containing
+            each (x,y) point in xy, 0 for points outside the model'''
+        return self.locator.locate_points(xy)
 
     def elem_coords(self):
         ''' elem_coords() - Return a list of coordinates of an element 
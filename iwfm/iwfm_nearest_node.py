@@ -17,7 +17,7 @@
 # -----------------------------------------------------------------------------
 
 
-def iwfm_nearest_node(point, node_set):
+def iwfm_nearest_node(point, node_set, index=None):
     ''' iwfm_nearest_node() - Given an (x,y) location, return the nearest IWFM node
 
     Parameters
@@ -28,6 +28,9 @@ def iwfm_nearest_node(point, node_set):
     node_set : list
         node IDs and x,y locations
 
+    index : node_index, default=None
+        node_index of node_set, None = build one
+
     Returns
     -------
     nearest_node: list
@@ -37,15 +40,9 @@ def iwfm_nearest_node(point, node_set):
         distance between point and nearest node
     
     '''
-    import math
-
-    nearest_distance = 1000000000000000.0 # arbitrarily lare number
-    nearest_node = -1
-    for node in node_set:
-        dist = math.sqrt((float(point[0]) - float(node[1])) ** 2 + 
-                         (float(point[1]) - float(node[2])) ** 2)
-        if dist < nearest_distance:
-            nearest_node = node
-            nearest_distance = dist
-    return nearest_node, nearest_distance
+    import iwfm as iwfm
 
+    if index is None:
+        index = iwfm.node_index(node_set)
+    i, dist = index.query([[float(point[0]), float(point[1])]])
+    return node_set[i[0]], float(dist[0])
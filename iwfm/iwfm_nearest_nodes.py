@@ -18,7 +18,7 @@
 # -----------------------------------------------------------------------------
 
 
-def iwfm_nearest_nodes(filename, node_set):
+def iwfm_nearest_nodes(filename, node_set, index=None):
     ''' iwfm_nearest_nodes() - Read a point file, calculate the nearest node 
         and distance for each point, and write the results to the output file
 
@@ -30,6 +30,9 @@ def iwfm_nearest_nodes(filename, node_set):
     node_set : list
         node IDs and x,y locations
 
+    index : node_index, default=None
+        KD-tree of node_set. None = build one
+
     Returns
     -------
     number of points processed
@@ -37,17 +40,22 @@ def iwfm_nearest_nodes(filename, node_set):
     '''
     import iwfm as iwfm
 
+    if index is None:
+        index = iwfm.node_index(node_set)
+
+    with open(filename, 'r') as input_file:
+        lines = input_file.read().splitlines()  # open and read input file
+    header = lines[0].split(',')
+    points = [line.split(',') for line in lines[1:]]  # skip header line
+
+    # -- nearest node to all points at once
+    nearest, dist = index.query([[float(point[1]), float(point[2])] for point in points])
+
     output_filename = filename[0 : filename.find('.')] + '_nearest_nodes.out'
     with open(output_filename, 'w') as output_file:
-        with open(filename, 'r') as input_file:
-            lines = input_file.read().splitlines()  # open and read input file
-            header = lines[0].split(',')
-            output_file.write(f'{header[0]},NdNear,NdDist\n')
-            for line_index in range(1, len(lines)):  # skip header line
-                point = lines[line_index].split(',')
-                nearest, dist = iwfm.iwfm_nearest_node([float(point[1]), float(point[2])], node_set)
-                # write out
-                output_file.write(f'{point[0]},{nearest[0]},{round(dist,2)}\n')
+        output_file.write(f'{header[0]},NdNear,NdDist\n')
+        for point, i, d in zip(points, nearest, dist):
+            output_file.write(f'{point[0]},{node_set[i][0]},{round(float(d),2)}\n')
 
     return len(lines) - 1
 
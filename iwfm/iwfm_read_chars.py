@@ -40,16 +40,12 @@ def iwfm_read_chars(char_file, elem_nodes):
     char_lines = open(char_file).read().splitlines()  # open and read input file
 
     char_index = iwfm.skip_ahead(0, char_lines, 0)  # skip comments
-    elem_char = []
-    for i in range(0, len(elem_nodes)):
-        l = char_lines[char_index + i].split()
-        this_elem = int(l.pop(0))
-        chars = []
-        chars.append(int(l.pop(0)))    # rain station
-        chars.append(float(l.pop(0)))  # rain factor
-        chars.append(int(l.pop(0)))    # drainage destination
-        chars.append(int(l.pop(0)))    # subregion
-        temp = int(l.pop(0))           # don't use
-        chars.append(float(l.pop(0)))  # soil type
-        elem_char.append(chars)
+    table, _ = iwfm.iwfm_read_table(char_lines, char_index, len(elem_nodes), ncols=7)
+
+    elem_char = [[int(c[1]),   # rain station
+                  c[2],        # rain factor
+                  int(c[3]),   # drainage destination
+                  int(c[4]),   # subregion
+                  c[6]]        # soil type
+                 for c in table.tolist()]
     return elem_char
@@ -55,16 +55,12 @@ def iwfm_read_elements(elem_file, verbose=False):
     line_index = iwfm.skip_ahead(line_index + 1, elem_lines, 0)  
     line_index = iwfm.skip_ahead(line_index + 1, elem_lines, subregions - 1)
 
-    elem_ids, elem_nodes, elem_sub = [], [], []
-    for i in range(0, elements):  
-        l = elem_lines[line_index + i].split()
-        this_elem = int(l.pop(0))
-        elem_ids.append(this_elem)
-        nodes = [int(s) for s in l[0:5]]
-        elem_sub.append(nodes.pop(4))
-        if nodes[3] == 0:
-            nodes.pop(3)  # remove empty node on triangles
-        elem_nodes.append(nodes)
+    table, _ = iwfm.iwfm_read_table(elem_lines, line_index, elements, ncols=6, dtype=int)
+
+    elem_ids = table[:, 0].tolist()
+    elem_sub = table[:, 5].tolist()
+    # remove empty node on triangles
+    elem_nodes = [nodes[:3] if nodes[3] == 0 else nodes for nodes in table[:, 1:5].tolist()]
     if verbose:
         print(f'  Read {len(elem_nodes):,} elements from {elem_file}')
     return elem_ids, elem_nodes, elem_sub
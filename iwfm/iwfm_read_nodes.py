@@ -59,11 +59,9 @@ def iwfm_read_nodes(node_file, factor=0.0):
 
     line_index = iwfm.skip_ahead(line_index + 1, node_lines, 0)  
 
-    node_list, node_coord = [], []
-    for i in range(0, inodes):  
-        l = node_lines[line_index + i].split()
-        l[0], l[1], l[2] = int(l[0]), float(l[1]), float(l[2])
-        node_list.append(l[0])
-        node_coord.append(l)
+    table, _ = iwfm.iwfm_read_table(node_lines, line_index, inodes, ncols=3)
+
+    node_list = table[:, 0].astype(int).tolist()
+    node_coord = [[node, x, y] for node, (x, y) in zip(node_list, table[:, 1:].tolist())]
 
     return node_coord, node_list, factor
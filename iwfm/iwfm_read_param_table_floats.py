@@ -48,10 +48,8 @@ def iwfm_read_param_table_floats(file_lines, line_index, lines):
         params = [float(e) for e in file_lines[line_index].split()[1:]] # skip the first value which is the element number
         line_index = iwfm.skip_ahead(line_index + 1, file_lines, 0)     # skip to next value line
     else:
-        for i in range(lines):
-            t = [float(e) for e in file_lines[line_index].split()[1:]]  # skip the first value which is the element number
-            params.append(t)
-            line_index += 1                                             # skip to next line
+        table, line_index = iwfm.iwfm_read_table(file_lines, line_index, lines)
+        params = table[:, 1:]                                           # skip the first value which is the element number
     line_index -= 1
 
     params = np.array(params)
@@ -47,10 +47,8 @@ def iwfm_read_param_table_ints(file_lines, line_index, lines):
         params = [int(e) for e in file_lines[line_index].split()[1:]]
         line_index = iwfm.skip_ahead(line_index + 1, file_lines, 0)  # skip to next value line
     else:
-        for i in range(lines):
-            t = [int(e) for e in file_lines[line_index].split()[1:]]
-            params.append(t)
-            line_index += 1
+        table, line_index = iwfm.iwfm_read_table(file_lines, line_index, lines, dtype=int)
+        params = table[:, 1:]                                        # skip the element number
     line_index -= 1
 
     params = np.array(params)
@@ -53,13 +53,9 @@ def iwfm_read_strat(strat_file, node_coords):
 
     line_index = iwfm.skip_ahead(line_index + 1, strat_lines, 0) 
 
-    strat = []
-    for i in range(0, len(node_coords)):
-        l = strat_lines[line_index + i].split()
-        s = []
-        s.append(int(l.pop(0))) 
-        for j in range(0, len(l)):
-            s.append(factor * float(l.pop(0)))  
-        strat.append(s)
+    table, _ = iwfm.iwfm_read_table(strat_lines, line_index, len(node_coords), ncols=2 * layers + 2)
+
+    strat = [[node] + values for node, values in 
+             zip(table[:, 0].astype(int).tolist(), (factor * table[:, 1:]).tolist())]
     nlayers = int((len(strat[0]) - 1) / 2)
     return strat, nlayers
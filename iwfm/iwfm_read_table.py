@@ -0,0 +1,61 @@
+# iwfm_read_table.py
+# Read a block of numeric table lines from an IWFM input file
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def iwfm_read_table(file_lines, line_index, nrows, ncols=None, dtype=float):
+    ''' iwfm_read_table() - Skip comment lines (beginning with 'C', 'c', '*'
+        or '#') and read the next nrows lines as a numeric table with the
+        numpy C parser, instead of splitting and casting each line in python
+
+    Parameters
+    ----------
+    file_lines : list
+        each item is one line from a file
+
+    line_index : int
+        current line number, comment lines from here are skipped
+
+    nrows : int
+        number of table lines to read
+
+    ncols : int, default=None
+        number of columns to read from each line, extra items such as
+        trailing descriptions are ignored. None = use every item
+
+    dtype : numpy data type, default=float
+        data type of the table
+
+    Returns
+    -------
+    table : numpy array
+        table of values, shape (nrows, ncols)
+
+    line_index : int
+        index of the line after the table
+
+    '''
+    import numpy as np
+    import iwfm as iwfm
+
+    line_index = iwfm.skip_ahead(line_index, file_lines, 0)
+    block = file_lines[line_index:line_index + nrows]
+
+    usecols = None if ncols is None else range(ncols)
+    table = np.loadtxt(block, dtype=dtype, usecols=usecols, comments=None, ndmin=2)
+
+    return table, line_index + nrows
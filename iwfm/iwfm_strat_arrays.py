@@ -21,7 +21,8 @@ def iwfm_strat_arrays(strat):
     ''' iwfm_strat_arrays() - Read IWFM nodal stratigraphy information 
         into individual arrays
 
-    TODO: change to a class to hold static variables after first call
+    For repeated use build one stratigraphy object, which holds these
+    arrays as numpy views.
 
     Parameters
     ----------
@@ -50,52 +51,14 @@ def iwfm_strat_arrays(strat):
     
     '''
 
-    if not hasattr(has_run, 'yes'):
-        has_run.yes = True
-
-        nlayers = int((len(strat[0]) - 1) / 2)
-        elevation = [i[0] for i in strat]
-
-        aquitard_thick = []  # initialize arrays
-        aquifer_thick = []
-        aquitard_top = []
-        aquitard_bot = []
-        aquifer_top = []
-        aquifer_bot = []
-
-        for i in range(0, len(strat)):  # cycle through stratigraphy of each node
-            Tthick,Athick,AttElev,AtbElev,AqtElev,AqbElev  = [],[],[],[],[],[]
-
-            l, depth = strat[i], 0
-            this_node = l.pop(0)
-            lse = float(l.pop(0))
-
-            for j in range(0, nlayers): 
-                AttElev.append(lse - depth)
-
-                t = strat[i][2 * j]
-                Tthick.append(t)
-                depth += t  
-                AtbElev.append(lse - depth) 
-                AqtElev.append(lse - depth) 
-
-                a = strat[i][2 * j + 1] 
-                Athick.append(a)
-                depth += a 
-                AqbElev.append(lse - depth) 
-
-            aquitard_thick.append(Tthick)
-            aquifer_thick.append(Athick) 
-            aquitard_top.append(AttElev) 
-            aquitard_bot.append(AtbElev) 
-            aquifer_top.append(AqtElev)  
-            aquifer_bot.append(AqbElev)  
+    import iwfm as iwfm
 
+    st = iwfm.stratigraphy(strat)
     return (
-        aquitard_thick,
-        aquifer_thick,
-        aquitard_top,
-        aquitard_bot,
-        aquifer_top,
-        aquifer_bot,
+        st.aquitard_thick.tolist(),
+        st.aquifer_thick.tolist(),
+        st.aquitard_top.tolist(),
+        st.aquitard_bottom.tolist(),
+        st.aquifer_top.tolist(),
+        st.aquifer_bottom.tolist(),
     )
@@ -0,0 +1,163 @@
+# mesh.py
+# Python class for IWFM finite element mesh connectivity and geometry
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+class mesh:
+    ''' mesh - IWFM finite element mesh as numpy arrays: node ids and
+        coordinates, a padded (n_elements, 4) int32 array of element node
+        positions with a triangle mask, and the elements around each node
+        in compressed sparse row form. Element centroids, areas, bounding
+        boxes and polygon coordinates are computed for the whole mesh with
+        a few array operations.
+
+    Parameters
+    ----------
+    node_coords : list or dictionary
+        list of [node id, x, y] items, as returned by iwfm_read_nodes(), or
+        dictionary with key = node id, values = [x, y]
+
+    elem_nodes : list
+        nodes of each element, 3 for triangles or 4 for quadrilaterals
+
+    elem_ids : list, default=None
+        element numbers, None = 1 to number of elements
+
+    '''
+
+    def __init__(self, node_coords, elem_nodes, elem_ids=None):
+        import numpy as np
+
+        if isinstance(node_coords, dict):
+            node_ids = list(node_coords.keys())
+            xy = [value[:2] for value in node_coords.values()]
+        else:
+            node_ids = [node[0] for node in node_coords]
+            xy = [node[1:3] for node in node_coords]
+        self.node_ids = np.array(node_ids, dtype=int)
+        self.xy = np.array(xy, dtype=float).reshape(-1, 2)
+
+        if elem_ids is None:
+            elem_ids = range(1, len(elem_nodes) + 1)
+        self.elem_ids = np.array(list(elem_ids), dtype=int)
+
+        # -- node id <-> index maps
+        self.node_lookup = np.full(self.node_ids.max() + 1, -1, dtype=int)
+        self.node_lookup[self.node_ids] = np.arange(len(self.node_ids))
+        self.elem_lookup = np.full(self.elem_ids.max() + 1, -1, dtype=int)
+        self.elem_lookup[self.elem_ids] = np.arange(len(self.elem_ids))
+
+        # -- padded connectivity, node positions, -1 = no 4th node
+        nodes = np.array([list(n)[:4] + [0] * (4 - len(n)) for n in elem_nodes], dtype=int).reshape(-1, 4)
+        self.tri = nodes[:, 3] == 0
+        self.conn = np.where(nodes > 0, self.node_lookup[nodes], -1).astype(np.int32)
+
+        # -- vertex coordinates, triangles closed on the first node
+        closed = np.where(self.conn >= 0, self.conn, self.conn[:, :1])
+        self.vx, self.vy = self.xy[closed, 0], self.xy[closed, 1]
+
+        # -- elements around each node, compressed sparse row form
+        valid = self.conn >= 0
+        elem = np.repeat(np.arange(len(self.conn)), valid.sum(axis=1))
+        node = self.conn[valid]
+        order = np.argsort(node, kind='stable')
+        self.node_elems = elem[order]
+        self.node_elem_start = np.zeros(len(self.node_ids) + 1, dtype=int)
+        np.cumsum(np.bincount(node, minlength=len(self.node_ids)), out=self.node_elem_start[1:])
+
+    @property
+    def n_nodes(self):
+        return len(self.node_ids)
+
+    @property
+    def n_elements(self):
+        return len(self.elem_ids)
+
+    @property
+    def nverts(self):
+        ''' nverts - Number of nodes of each element, 3 or 4'''
+        return 4 - self.tri.astype(int)
+
+    def node_index(self, nodes):
+        ''' node_index() - Position of node ids in the node arrays'''
+        import numpy as np
+
+        return self.node_lookup[np.asarray(nodes, dtype=int)]
+
+    def elem_index(self, elems):
+        ''' elem_index() - Position of element ids in the element arrays'''
+        import numpy as np
+
+        return self.elem_lookup[np.asarray(elems, dtype=int)]
+
+    def elem_node_ids(self):
+        ''' elem_node_ids() - Padded (n_elements, 4) array of element node
+            ids, 0 = no 4th node'''
+        import numpy as np
+
+        return np.where(self.conn >= 0, self.node_ids[self.conn], 0)
+
+    def elems_of_node(self, node):
+        ''' elems_of_node() - Element ids of the elements that share node'''
+        i = self.node_lookup[node]
+        return self.elem_ids[self.node_elems[self.node_elem_start[i]:self.node_elem_start[i + 1]]]
+
+    def centroids(self):
+        ''' centroids() - Average of the node coordinates of each element,
+            shape (n_elements, 2)'''
+        import numpy as np
+
+        valid = self.conn >= 0
+        n = valid.sum(axis=1)
+        return np.column_stack(((self.vx * valid).sum(axis=1) / n,
+                                (self.vy * valid).sum(axis=1) / n))
+
+    def areas(self):
+        ''' areas() - Area of each element, shape (n_elements,)'''
+        import numpy as np
+
+        x, y = self.vx, self.vy
+        return 0.5 * np.abs((x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y).sum(axis=1))
+
+    def bounds(self):
+        ''' bounds() - Bounding box of each element, shape (n_elements, 4)
+            with columns xmin, ymin, xmax, ymax'''
+        import numpy as np
+
+        return np.column_stack((self.vx.min(axis=1), self.vy.min(axis=1),
+                                self.vx.max(axis=1), self.vy.max(axis=1)))
+
+    def poly_coords(self):
+        ''' poly_coords() - List of the closed polygon coordinates of each
+            element, [(x0, y0), (x1, y1), (x2, y2), <(x3, y3),> (x0, y0)]'''
+        import numpy as np
+
+        # -- append the first vertex, triangles are already closed by the padding
+        x = np.column_stack((self.vx, self.vx[:, 0])).tolist()
+        y = np.column_stack((self.vy, self.vy[:, 0])).tolist()
+        return [list(zip(xe[:n + 1], ye[:n + 1])) for xe, ye, n in zip(x, y, self.nverts.tolist())]
+
+    def geojson(self):
+        ''' geojson() - List of GeoJSON Polygon coordinates of each element,
+            [[[x0, y0], [x1, y1], ..., [x0, y0]]]'''
+        return [[[list(p) for p in coords]] for coords in self.poly_coords()]
+
+    def wkt(self):
+        ''' wkt() - List of WKT polygons of the elements,
+            'POLYGON ((X0 Y0, X1 Y1, X2 Y2, X3 Y3, X0 Y0))' '''
+        return ['POLYGON ((' + ', '.join(f'{x} {y}' for x, y in coords) + '))'
+                for coords in self.poly_coords()]
@@ -17,7 +17,7 @@
 # -----------------------------------------------------------------------------
 
 
-def nearest(d_nodes, x, y):
+def nearest(d_nodes, x, y, index=None):
     ''' nearest() - Find the nearest node to a point from a node dictionary
 
     Parameters
@@ -31,6 +31,9 @@ def nearest(d_nodes, x, y):
     y : float
         y location of point
 
+    index : node_index, default=None
+        node_index built from d_nodes, default builds a new one
+
     Returns
     -------
     nearest : int
@@ -39,13 +42,7 @@ def nearest(d_nodes, x, y):
     '''
     import iwfm as iwfm
 
-    point = [x, y]
-    dist = 9.9e30
-    nearest = -1
-    for key in d_nodes:
-        pt = d_nodes[key]
-        new_dist = iwfm.distance(point, pt)
-        if dist > new_dist:
-            dist = new_dist
-            nearest = key
-    return nearest
+    if index is None:
+        index = iwfm.node_index(d_nodes)
+    ids, _ = index.nearest([[x, y]])
+    return ids[0].item()
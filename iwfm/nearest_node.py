@@ -18,7 +18,7 @@
 # -----------------------------------------------------------------------------
 
 
-def nearest_node(point, node_set):
+def nearest_node(point, node_set, index=None):
     ''' nearest_node() - Find the nearest node to a point from the node array
 
     ** INCOMPLETE **
@@ -32,6 +32,9 @@ def nearest_node(point, node_set):
     node_set : list
         list of node numbers with x and y of each
 
+    index : node_index, default=None
+        index of the nodes in node_set (None = build it here)
+
     Returns
     -------
     nearest : int
@@ -40,15 +43,10 @@ def nearest_node(point, node_set):
     '''
     import iwfm as iwfm
 
-    dist, nearest = 9.9e30, -1
-    for j in range(0, len(node_set)):
-        line = node_set[j]
-        pt = [line[1], line[2]]
-        # Compute distance between each pair of the two collections of inputs.
-        new_dist = iwfm.distance(point, pt)
-        if dist > new_dist:
-            dist, nearest = new_dist, line[0]
-    return nearest
+    if index is None:
+        index = iwfm.node_index(node_set)
+    i, _ = index.query([point])
+    return node_set[i[0]][0]
 
 if __name__ == '__main__':
     ' Run nearest_node() from command line '
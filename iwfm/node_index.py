@@ -0,0 +1,97 @@
+# node_index.py
+# Python class to find the model nodes nearest to a set of points
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+class node_index:
+    """node_index - KD-tree of node coordinates for nearest node, k-nearest
+    and radius queries.  The tree is built once, and each query takes an
+    array of points and returns arrays, so matching many points to nodes
+    costs O(points * log(nodes)) instead of O(points * nodes).  Pass one
+    node_index as the index argument of iwfm_nearest_node(), nearest_node()
+    or nearest() when calling them for many points, so the tree is not
+    rebuilt for each point.
+
+    Parameters
+    ----------
+    node_set : list or dictionary
+        list of [node id, x, y, ...] items, as returned by iwfm_read_nodes(),
+        or dictionary with key = node id, values = [x, y]
+
+    """
+
+    def __init__(self, node_set):
+        import numpy as np
+        from scipy.spatial import cKDTree
+
+        if isinstance(node_set, dict):
+            ids = list(node_set.keys())
+            xy = [value[:2] for value in node_set.values()]
+        else:
+            ids = [node[0] for node in node_set]
+            xy = [node[1:3] for node in node_set]
+
+        self.ids = np.array(ids)
+        self.xy = np.array(xy, dtype=float)
+        self.tree = cKDTree(self.xy)
+
+    def query(self, points, k=1):
+        """ query() - Return the position in the node set and the distance
+        of the k nodes nearest to each point
+
+        Parameters
+        ----------
+        points : array-like
+            (x, y) point coordinates, shape (n_points, 2)
+
+        k : int, default=1
+            number of nearest nodes
+
+        Returns
+        -------
+        index : numpy array
+            position of the nearest nodes in the node set, shape (n_points,)
+            for k = 1, otherwise (n_points, k)
+
+        dist : numpy array
+            distances to the nearest nodes, same shape as index
+
+        """
+        import numpy as np
+
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        dist, index = self.tree.query(points, k=k)
+        return index, dist
+
+    def nearest(self, points, k=1):
+        """ nearest() - Return the ids and distances of the k nodes nearest
+        to each point, shape (n_points,) for k = 1, otherwise (n_points, k)"""
+        index, dist = self.query(points, k=k)
+        return self.ids[index], dist
+
+    def within(self, points, radius):
+        """ within() - Return, for each point, arrays of the ids and the
+        distances of all nodes within radius of the point, nearest first"""
+        import numpy as np
+
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        result = []
+        for point, index in zip(points, self.tree.query_ball_point(points, radius)):
+            dist = np.hypot(*(self.xy[index] - point).T)
+            order = np.argsort(dist, kind='stable')
+            result.append((self.ids[index][order], dist[order]))
+        return result
@@ -25,10 +25,11 @@ from iwfm.plot.get_XYvalues import get_XYvalues
 from iwfm.plot.flip_y import flip_y
 from iwfm.plot.map_to_nodes import map_to_nodes
 from iwfm.plot.map_to_nodes_png import map_to_nodes_png
+from iwfm.plot.nodal_grid_interpolator import nodal_grid_interpolator
 from iwfm.plot.map_to_nodes_contour import map_to_nodes_contour
 from iwfm.plot.map_gw_params import map_gw_params
 
-from iwfm.plot.map_rz_params_npc import map_rz_params_npc
+from iwfm.plot.map_rz_params import map_rz_params
 
 from iwfm.plot.data_to_color import data_to_color
 from iwfm.plot.contour_levels import contour_levels
@@ -28,8 +28,9 @@ def gw_hyd_obs(sim_well_list,obs,gwhyd_sim,sim_hyd_names,sim_well_dict,title_wor
     sim_well_list : list of str
         simulated hydrograph well name, often state well number
     
-    obs : list
-        list of observed values
+    obs : list or calib.smp_store
+        observed values, items [site, date as MM/DD/YYYY, time, value] as
+        returned by read_obs_smp(), or an smp_store
     
     gwhyd_sim : list
         simulated IWFM groundwater hydrographs: [0]==dates, [1 to no_hyds]==datasets
@@ -55,6 +56,7 @@ def gw_hyd_obs(sim_well_list,obs,gwhyd_sim,sim_hyd_names,sim_well_dict,title_wor
     
     '''
     import iwfm.plot as iplot
+    import iwfm.calib as calib
     import numpy as np
     import matplotlib          
     import matplotlib.dates as mdates
@@ -62,13 +64,11 @@ def gw_hyd_obs(sim_well_list,obs,gwhyd_sim,sim_hyd_names,sim_well_dict,title_wor
 
     no_sim_hyds = len(gwhyd_sim)  # number of simulation time series to be graphed
 
-    # extract a list of unique well names from first column of obs (all wells with obs data)
-    obs_well_list = []
-    for j in range(0, len(obs)):
-        if obs[j][0] not in obs_well_list:
-            obs_well_list.append(obs[j][0])
+    # index the observations by well name (all wells with obs data)
+    if not isinstance(obs, calib.smp_store):
+        obs = calib.smp_store.from_records(obs)
 
-    print(f'\n     Processing {len(sim_well_list):,} wells,  {no_sim_hyds} simulation(s),  observation data for {len(obs_well_list):,} wells\n')
+    print(f'\n     Processing {len(sim_well_list):,} wells,  {no_sim_hyds} simulation(s),  observation data for {obs.n_sites:,} wells\n')
 
     # compile simulated hydrographs for each well
     count = 0
@@ -77,14 +77,8 @@ def gw_hyd_obs(sim_well_list,obs,gwhyd_sim,sim_hyd_names,sim_well_dict,title_wor
             print(f' ==> Processing well {sim_well_name}, {col+1} of {len(sim_well_list)}')
 
         # get observed data for this well
-        obs_dates = []
-        obs_meas = []
-        for j in range(0, len(obs)):
-            if obs[j][0] == sim_well_name:
-                obs_dates.append(obs[j][1])
-                obs_meas.append(obs[j][3])
-        obs_dates = np.array([datetime.datetime.strptime(obs_dates[i], '%m/%d/%Y') for i in range(0, len(obs_dates))])
-        obs_meas = np.array(obs_meas)
+        obs_dates, obs_meas = obs.site_data(sim_well_name)
+        obs_dates = obs_dates.astype('datetime64[s]').astype(datetime.datetime)
         if verbose:
             print(f'     {len(obs_dates):,} observations for well {sim_well_name}')
 
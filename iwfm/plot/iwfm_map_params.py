@@ -109,7 +109,7 @@ def get_params(data_filename, param_type, param_values, verbose=False):
 
 
 def iwfm_map_params(dataset, bounding_poly, image_basename, cmap='rainbow', title="Parameter values", label='Z values', 
-                    units='', no_levels=20, contour='line', verbose=False):
+                    units='', no_levels=20, contour='line', interp=None, verbose=False):
     """iwfm_map_params() - Create a contour map representing nodal values such as groundwater data.
 
     Parameters
@@ -139,6 +139,11 @@ def iwfm_map_params(dataset, bounding_poly, image_basename, cmap='rainbow', titl
     contour : str, default = 'line'
         Type of contour to be plotted.  Options are 'line' or 'filled'.
 
+    interp : nodal_grid_interpolator, default = None
+        Grid, triangulation and boundary mask for the dataset x and y 
+        coordinates, built once and reused by maps of the same nodes.
+        None = build them on this call.
+
     verbose : bool, default = False
         If True, print status messages.  
 
@@ -149,7 +154,6 @@ def iwfm_map_params(dataset, bounding_poly, image_basename, cmap='rainbow', titl
     import matplotlib.pyplot as plt
     from matplotlib.path import Path
     from matplotlib.patches import PathPatch
-    from scipy.interpolate import griddata
     import numpy as np
     import iwfm.plot as iplot
 
@@ -160,14 +164,11 @@ def iwfm_map_params(dataset, bounding_poly, image_basename, cmap='rainbow', titl
     # Define the contour levels
     levels = iplot.contour_levels(Z, no_levels=no_levels, verbose=verbose)
 
-    # create a regular grid for interpolation
-    ratio = (X.max() - X.min()) / (Y.max() - Y.min())
-    xi = np.linspace(X.min(), X.max(), int(len(X) * ratio * 0.5 ))
-    yi = np.linspace(Y.min(), Y.max(), int(len(Y) / ratio * 0.5 ))
-    Xi, Yi = np.meshgrid(xi, yi)
-
-    # interpolate the irregular data onto the regular grid
-    Zi = griddata((X, Y), Z, (Xi, Yi), method='linear')
+    # interpolate the irregular data onto the regular grid, masked by the boundary
+    if interp is None:
+        interp = iplot.nodal_grid_interpolator(X, Y, bounding_poly)
+    Xi, Yi = interp.Xi, interp.Yi
+    Zi = interp(Z)
 
     # Set figure size, width and height in inches
     fig, ax = plt.subplots(figsize=(10, 8))
@@ -175,12 +176,6 @@ def iwfm_map_params(dataset, bounding_poly, image_basename, cmap='rainbow', titl
     # create path from boundary polygon
     path = Path(bounding_poly)
 
-    # create a mask from the path
-    mask = path.contains_points(np.column_stack((Xi.ravel(),Yi.ravel()))).reshape(Xi.shape)
-
-    # apply the mask to the data
-    Zi = np.ma.masked_array(Zi, mask=~mask) 
-
     # plot the masked data
     if contour == 'filled':
         plt.contourf(Xi, Yi, Zi, levels=levels, cmap=cmap)    # filled contours
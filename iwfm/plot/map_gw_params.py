@@ -16,7 +16,8 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 # -----------------------------------------------------------------------------
 
-def plot_one(param_name, plot_data, bounding_poly, layer, basename, units='', point_width=100, format='tiff', verbose=False ):
+def plot_one(param_name, plot_data, bounding_poly, layer, basename, units='', point_width=100, format='tiff', interp=None, 
+             verbose=False ):
     ''' plot_one() - Draw and save one plot
 
     Parameters
@@ -45,6 +46,10 @@ def plot_one(param_name, plot_data, bounding_poly, layer, basename, units='', po
     format : string, default = 'tiff'
         output file format: eps, jpeg, jpg, pdf, pgf, png, ps, raw, rgba, svg, svgz, tif, tiff, webp
 
+    interp : nodal_grid_interpolator, default = None
+        Grid, triangulation and boundary mask for the plot_data x and y 
+        coordinates, reused for each contour map. None = build on each map.
+
     verbose : bool, default = False
         If True, print status messages.
     
@@ -68,13 +73,13 @@ def plot_one(param_name, plot_data, bounding_poly, layer, basename, units='', po
         #  Produce contour lines map
         image_name = f'{basename}_{param_name}{layer+1}_contour.'+format       #  Set image file name
         iplot.map_to_nodes_contour(plot_data, bounding_poly, image_name, title=f'{param_name} layer {layer+1}', 
-                               label=f'{param_name}', units=units, format=format )
+                               label=f'{param_name}', units=units, format=format, interp=interp )
         count += 1
 
         #  Produce filled contour map
         image_name = f'{basename}_{param_name}{layer+1}_contourf.'+format      #  Set image file name
         iplot.map_to_nodes_contour(plot_data, bounding_poly, image_name, title=f'{param_name} layer {layer+1}', 
-                               label=f'{param_name}', units=units, format=format, contour='filled' )
+                               label=f'{param_name}', units=units, format=format, contour='filled', interp=interp )
         count += 1
 
     return count
@@ -84,7 +89,7 @@ def plot_one(param_name, plot_data, bounding_poly, layer, basename, units='', po
 
 
 def map_gw_params(param_type, param_values, node_coords, layers, bounding_poly, strat, format='tiff', basename='gw_param_map',
-                   point_width=100, verbose=False):
+                   point_width=100, interp=None, verbose=False):
     ''' map_gw_params() - Create PNG images of groundwater parameters from an IWFM simulation
 
     Parameters
@@ -117,6 +122,10 @@ def map_gw_params(param_type, param_values, node_coords, layers, bounding_poly,
     point_width : int, default = 100
         The width of the polygon or diameter of the circle to be drawn around each data point.
 
+    interp : nodal_grid_interpolator, default = None
+        Grid, triangulation and boundary mask for node_coords, reused for 
+        each layer and parameter. None = build once for this call.
+
 
     Returns
     -------
@@ -124,6 +133,12 @@ def map_gw_params(param_type, param_values, node_coords, layers, bounding_poly,
         number of parameter maps created
     '''
     import numpy as np
+    import iwfm.plot as iplot
+
+    # -- grid, triangulation and mask are the same for every layer
+    if interp is None:
+        interp = iplot.nodal_grid_interpolator([c[1] for c in node_coords], [c[2] for c in node_coords], 
+                                               bounding_poly)
 
     count = 0
     for layer in range(layers):
@@ -154,7 +169,8 @@ def map_gw_params(param_type, param_values, node_coords, layers, bounding_poly,
                 else:
                     plot_data.append([node_coords[i][1], node_coords[i][2], 0 ]) 
 
-            result = plot_one(param_type, plot_data, bounding_poly, layer, basename, units, point_width=point_width, format=format)
+            result = plot_one(param_type, plot_data, bounding_poly, layer, basename, units, point_width=point_width, format=format,
+                              interp=interp)
 
             if verbose and result > 0: print(f'  Mapped {param_type} for layer {layer+1} ')
 
@@ -168,6 +184,7 @@ if __name__ == "__main__":
     import numpy as np
     import iwfm as iwfm
     import iwfm.gis as igis
+    import iwfm.plot as iplot
     import iwfm.debug as idb
 
     point_width_default = 100
@@ -217,21 +234,25 @@ if __name__ == "__main__":
 
     strat = np.array([np.array(i) for i in strat])          # stratigraphy to numpy array
 
+    # -- grid, triangulation and mask shared by all parameter maps
+    interp = iplot.nodal_grid_interpolator([c[1] for c in node_coords], [c[2] for c in node_coords], 
+                                           bounding_poly)
+
 
     count = map_gw_params('Kh', Kh, node_coords, layers, bounding_poly, strat, format=format, 
-                          basename=basename, point_width=point_width, verbose=verbose)
+                          basename=basename, point_width=point_width, interp=interp, verbose=verbose)
 
     count += map_gw_params('Kv', Kv, node_coords, layers, bounding_poly, strat, format=format, 
-                          basename=basename, point_width=point_width, verbose=verbose)
+                          basename=basename, point_width=point_width, interp=interp, verbose=verbose)
 
     count += map_gw_params('Kq', Kq, node_coords, layers, bounding_poly, strat, format=format, 
-                          basename=basename, point_width=point_width, verbose=verbose)
+                          basename=basename, point_width=point_width, interp=interp, verbose=verbose)
 
     count += map_gw_params('Sy', Sy, node_coords, layers, bounding_poly, strat, format=format, 
-                          basename=basename, point_width=point_width, verbose=verbose)
+                          basename=basename, point_width=point_width, interp=interp, verbose=verbose)
 
     count += map_gw_params('Ss', Ss, node_coords, layers, bounding_poly, strat, format=format, 
-                          basename=basename, point_width=point_width, verbose=verbose)
+                          basename=basename, point_width=point_width, interp=interp, verbose=verbose)
 
 
     print(f'  Created {count:,} groundwater parameter maps')  # update cli
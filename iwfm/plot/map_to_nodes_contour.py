@@ -17,7 +17,7 @@
 # -----------------------------------------------------------------------------
 
 def map_to_nodes_contour(dataset, bounding_poly, image_name, cmap='rainbow', title="Parameter values", 
-                 label='Z values', units='', no_levels=20, contour='line', format='tiff', verbose=False):
+                 label='Z values', units='', no_levels=20, contour='line', format='tiff', interp=None, verbose=False):
     """map_to_nodes_contour() - Create a contour map representing nodal values such as groundwater data.
 
     Parameters
@@ -53,6 +53,11 @@ def map_to_nodes_contour(dataset, bounding_poly, image_name, cmap='rainbow', tit
     format : str, default = 'tiff'
         output file format: eps, jpeg, jpg, pdf, pgf, png, ps, raw, rgba, svg, svgz, tif, tiff, webp
 
+    interp : nodal_grid_interpolator, default = None
+        Grid, triangulation and boundary mask for the dataset x and y 
+        coordinates, built once and reused by maps of the same nodes.
+        None = build them on this call.
+
     verbose : bool, default = False
         If True, print status messages.  
 
@@ -63,7 +68,6 @@ def map_to_nodes_contour(dataset, bounding_poly, image_name, cmap='rainbow', tit
     import matplotlib.pyplot as plt
     from matplotlib.path import Path
     from matplotlib.patches import PathPatch
-    from scipy.interpolate import griddata
     import numpy as np
     import iwfm.plot as iplot
 
@@ -72,14 +76,11 @@ def map_to_nodes_contour(dataset, bounding_poly, image_name, cmap='rainbow', tit
     # Define the contour levels
     levels = iplot.contour_levels(Z, no_levels=no_levels, verbose=verbose)
 
-    # create a regular grid for interpolation
-    ratio = (X.max() - X.min()) / (Y.max() - Y.min())
-    xi = np.linspace(X.min(), X.max(), int(len(X) * ratio * 0.5 ))
-    yi = np.linspace(Y.min(), Y.max(), int(len(Y) / ratio * 0.5 ))
-    Xi, Yi = np.meshgrid(xi, yi)
-
-    # interpolate the irregular data onto the regular grid
-    Zi = griddata((X, Y), Z, (Xi, Yi), method='linear')
+    # interpolate the irregular data onto the regular grid, masked by the boundary
+    if interp is None:
+        interp = iplot.nodal_grid_interpolator(X, Y, bounding_poly)
+    Xi, Yi = interp.Xi, interp.Yi
+    Zi = interp(Z)
 
     # Set figure size, width and height in inches
     fig, ax = plt.subplots(figsize=(10, 8))
@@ -87,12 +88,6 @@ def map_to_nodes_contour(dataset, bounding_poly, image_name, cmap='rainbow', tit
     # create path from boundary polygon
     path = Path(bounding_poly)
 
-    # create a mask from the path
-    mask = path.contains_points(np.column_stack((Xi.ravel(),Yi.ravel()))).reshape(Xi.shape)
-
-    # apply the mask to the data
-    Zi = np.ma.masked_array(Zi, mask=~mask) 
-
     # plot the masked data
     if contour == 'filled':
         plt.contourf(Xi, Yi, Zi, levels=levels, cmap=cmap)    # filled contours
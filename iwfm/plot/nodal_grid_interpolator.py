@@ -0,0 +1,88 @@
+# nodal_grid_interpolator.py
+# Python class to interpolate nodal values onto a regular grid
+# Copyright (C) 2023-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+class nodal_grid_interpolator:
+    """nodal_grid_interpolator - Linear interpolation of nodal values onto the
+    regular grid used by map_to_nodes_contour().  The grid, Delaunay
+    triangulation, barycentric weights and boundary mask depend only on the
+    node coordinates, so they are computed once and the interpolator is then
+    applied to any number of value vectors (layers, parameters, dates) with
+    one sparse matrix product each.
+
+    Parameters
+    ----------
+    X, Y : numpy arrays
+        x and y coordinates of the nodes, in the order of the values that
+        will be interpolated
+
+    bounding_poly : list of (x, y) tuples, default = None
+        Model boundary polygon; grid points outside it are masked.
+        None = no boundary mask.
+
+    nx, ny : int, default = None
+        Number of grid columns and rows.  None = the map_to_nodes_contour()
+        default based on the number of nodes and the x/y extent ratio.
+
+    """
+
+    def __init__(self, X, Y, bounding_poly=None, nx=None, ny=None):
+        import numpy as np
+        from matplotlib.path import Path
+        from scipy.spatial import Delaunay
+        from scipy.sparse import csr_matrix
+
+        X, Y = np.asarray(X, dtype=float), np.asarray(Y, dtype=float)
+
+        # create a regular grid for interpolation
+        ratio = (X.max() - X.min()) / (Y.max() - Y.min())
+        if nx is None:
+            nx = int(len(X) * ratio * 0.5)
+        if ny is None:
+            ny = int(len(Y) / ratio * 0.5)
+        self.Xi, self.Yi = np.meshgrid(np.linspace(X.min(), X.max(), nx), np.linspace(Y.min(), Y.max(), ny))
+        points = np.column_stack((self.Xi.ravel(), self.Yi.ravel()))
+
+        # create a mask from the boundary polygon
+        if bounding_poly is None:
+            self.mask = np.ones(self.Xi.shape, dtype=bool)
+        else:
+            self.mask = Path(bounding_poly).contains_points(points).reshape(self.Xi.shape)
+
+        # barycentric weights of each grid point inside the triangulation
+        tri = Delaunay(np.column_stack((X, Y)))
+        simplex = tri.find_simplex(points)
+        self.inside = simplex >= 0
+        rows = np.flatnonzero(self.inside)
+        s = simplex[rows]
+        transform = tri.transform[s]
+        b = np.einsum('ijk,ik->ij', transform[:, :2, :], points[rows] - transform[:, 2, :])
+        weights = np.column_stack((b, 1.0 - b.sum(axis=1)))
+
+        self.weights = csr_matrix((weights.ravel(), (np.repeat(np.arange(len(rows)), 3), tri.simplices[s].ravel())),
+                                  shape=(len(rows), len(X)))
+
+    def __call__(self, values):
+        """ __call__() - Interpolate values at the nodes onto the grid, and
+        return a masked array with NaN outside the triangulation and masked
+        outside the boundary polygon"""
+        import numpy as np
+
+        Zi = np.full(self.Xi.size, np.nan)
+        Zi[self.inside] = self.weights @ np.asarray(values, dtype=float)
+        return np.ma.masked_array(Zi.reshape(self.Xi.shape), mask=~self.mask)
@@ -0,0 +1,141 @@
+# read_hyd_array.py
+# Read an IWFM hydrograph output file into numpy arrays
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def read_hyd_array(hyd_file, names=None, cache=False):
+    ''' read_hyd_array() - Read an IWFM hydrograph output file (groundwater,
+        stream, subsidence, tile drain ...) into a float array of shape
+        (n_times, n_hydrographs) and a datetime64 date array. The header
+        is read once and the value columns are parsed by the numpy C
+        parser.
+
+    Parameters
+    ----------
+    hyd_file : str
+        IWFM hydrograph output file name
+
+    names : list of str, default=None
+        hydrograph names of the columns to return, in this order, matched
+        without case against the names in the last header line; None =
+        all columns
+
+    cache : bool, default=False
+        True = read the values from a binary cache file next to hyd_file,
+        hyd_file + '.hyd.npz', building it first if it is missing or if
+        the size or modification time of hyd_file have changed
+
+    Returns
+    -------
+    values : numpy array
+        hydrograph values, shape (n_times, n_hydrographs)
+
+    dates : numpy array
+        time step dates, dtype datetime64[D]
+
+    hyd_names : list of str
+        hydrograph name of each column of values
+
+    '''
+    import os
+    import zipfile
+    import numpy as np
+
+    cache_file = hyd_file + '.hyd.npz'
+    stat = os.stat(hyd_file)
+    stamp = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+    if cache and os.path.isfile(cache_file):
+        try:
+            with np.load(cache_file) as f:
+                if np.array_equal(f['stamp'], stamp):
+                    values, dates, hyd_names = f['values'], f['dates'], f['names'].tolist()
+                    if names is None:
+                        return values, dates, hyd_names
+                    cols = hyd_columns(hyd_names, names)
+                    return values[:, cols], dates, [hyd_names[i] for i in cols]
+        except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
+            pass                                                        # partial or old cache, rebuilt below
+
+    # -- header lines run to the first line that starts with a date
+    header, dates = [], []
+    with open(hyd_file) as f:
+        for line in f:
+            if line[:1].isdigit():
+                ncols = len(line.split()) - 1
+                dates.append(line[:10])
+                break
+            header.append(line)
+        dates.extend(line[:10] for line in f if line[:1].isdigit())
+    dates = np.array([f'{d[6:10]}-{d[0:2]}-{d[3:5]}' for d in dates], dtype='datetime64[D]')
+
+    # -- hydrograph names from the last header line, else column numbers
+    items = header[-1].lstrip('*').split() if header else []
+    if len(items) > ncols:
+        hyd_names = items[-ncols:]
+    else:
+        hyd_names = [str(i + 1) for i in range(ncols)]
+
+    # -- parse only the selected columns unless the cache needs them all
+    cols = hyd_columns(hyd_names, names)
+    usecols = range(ncols) if cache else cols
+    values = np.loadtxt(hyd_file, skiprows=len(header), usecols=[c + 1 for c in usecols],
+                        ndmin=2, comments=None)
+
+    if cache:
+        # -- written under a temporary name and renamed, so readers never see a partial file
+        tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
+                np.savez(f, values=values, dates=dates, names=np.array(hyd_names, dtype=str),
+                         stamp=stamp)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+        if names is not None:
+            values = values[:, cols]
+
+    return values, dates, [hyd_names[i] for i in cols]
+
+
+def hyd_columns(hyd_names, names):
+    ''' hyd_columns() - Column positions of names in hyd_names, matched
+        without case, or all columns if names is None '''
+    if names is None:
+        return list(range(len(hyd_names)))
+    lookup = {name.lower(): i for i, name in enumerate(hyd_names)}
+    return [lookup[name.lower()] for name in names]
+
+
+if __name__ == '__main__':
+    ' Run read_hyd_array() from command line '
+    import sys
+    import iwfm.debug as idb
+    import iwfm as iwfm
+
+    if len(sys.argv) > 1:  # arguments are listed on the command line
+        hyd_file = sys.argv[1]
+    else:  # ask for file names from terminal
+        hyd_file = input('IWFM hydrograph file name: ')
+
+    iwfm.file_test(hyd_file)
+
+    idb.exe_time()  # initialize timer
+    values, dates, hyd_names = read_hyd_array(hyd_file)
+
+    print(f'  Read {values.shape[0]} time steps of {values.shape[1]} hydrographs from {hyd_file}.')
+    idb.exe_time()  # print elapsed time
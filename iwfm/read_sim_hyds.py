@@ -29,22 +29,17 @@ def read_sim_hyds(gwhyd_files):
     Returns
     -------
     gwhyd_sim : list
-        list with one item of hydrograph values for each input hydrograph file
+        list with one item of hydrograph values for each input hydrograph file,
+        each row [date as 'MM/DD/YYYY', value, value, ...]
 
     '''
+    import iwfm as iwfm
+
     gwhyd_sim = []
 
     for k in range(0, len(gwhyd_files)):
-        gwhyd_lines = (open(gwhyd_files[k]).read().splitlines())
-        gwhyd_lines = [word.replace('_24:00', ' ') for word in gwhyd_lines]
-
-        temp_sim = []
-        for j in range(9, len(gwhyd_lines)):
-            items= gwhyd_lines[j].split()
-            temp = [items.pop(0)]                   # date
-            alist = [float(x) for x in items]       # values to floats
-            temp.extend(alist)
-            temp_sim.append(temp)
-        gwhyd_sim.append(temp_sim)
+        values, dates, hyd_names = iwfm.read_hyd_array(gwhyd_files[k])
+        dates = [f'{d[5:7]}/{d[8:10]}/{d[0:4]}' for d in dates.astype(str).tolist()]
+        gwhyd_sim.append([[date] + row for date, row in zip(dates, values.tolist())])
 
     return gwhyd_sim
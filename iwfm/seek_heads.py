@@ -0,0 +1,68 @@
+# seek_heads.py
+# Read the heads for one date from a headall.out file
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+def seek_heads(heads_file, out_date, skip=5, dtype='float64'):
+    ''' seek_heads() - Read the heads for one date from an IWFM HeadAll.out
+        file, seeking directly to the time step with headall_index()
+
+    Parameters
+    ----------
+    heads_file : str
+        IWFM HeadAll.out file name
+
+    out_date : str or numpy datetime64
+        date, as a MM/DD/YYYY string or numpy datetime64
+
+    skip : int, default=5
+        number of header lines
+
+    dtype : str, default='float64'
+        numpy data type of the heads
+
+    Returns
+    -------
+    heads : numpy array
+        heads for out_date, shape (n_layers, n_nodes)
+
+    '''
+    import iwfm as iwfm
+
+    return iwfm.heads_for_dates(heads_file, [out_date], skip=skip, dtype=dtype).heads[0]
+
+
+if __name__ == '__main__':
+    ' Run seek_heads() from command line '
+    import sys
+    import iwfm.debug as idb
+    import iwfm as iwfm
+
+    if len(sys.argv) > 1:  # arguments are listed on the command line
+        heads_file = sys.argv[1]
+        out_date = sys.argv[2]
+    else:  # ask for file names from terminal
+        heads_file = input('IWFM Headall file name: ')
+        out_date   = input('Date (MM/DD/YYYY): ')
+
+    iwfm.file_test(heads_file)
+
+    idb.exe_time()  # initialize timer
+    heads = seek_heads(heads_file, out_date)
+
+    print(f'  Read heads for {out_date}, {heads.shape[0]} layers and {heads.shape[1]} nodes.')
+    idb.exe_time()  # print elapsed time
@@ -28,17 +28,13 @@ def simhyd_obs(gwhyd_file):
     Returns
     -------
     simhyd_obs : list
-        table of hydrograph information
+        table of hydrograph information, each row [date as 'MM/DD/YYYY',
+        value, value, ...]
     
     ''' 
+    import iwfm as iwfm
 
-    gwhyd_lines = open(gwhyd_file).read().splitlines() 
-    gwhyd_lines = [word.replace('_24:00', ' ') for word in gwhyd_lines]
-
-    simhyd_obs = []
-    for j in range(9, len(gwhyd_lines)):
-        line = gwhyd_lines[j].split()
-        for i in range(1, len(line)):
-            line[i] = float(line[i])
-        simhyd_obs.append(line)
+    values, dates, hyd_names = iwfm.read_hyd_array(gwhyd_file)
+    dates = [f'{d[5:7]}/{d[8:10]}/{d[0:4]}' for d in dates.astype(str).tolist()]
+    simhyd_obs = [[date] + row for date, row in zip(dates, values.tolist())]
     return simhyd_obs
@@ -17,53 +17,61 @@
 # -----------------------------------------------------------------------------
 
 # ** Incomplete **
-import datetime, bisect
+import datetime
 
 class simhyds:
     
-    def __init__(self, filename):
-        self.sim_vals, self.sim_dates = [], []
-        with open(filename, 'r') as inputfile:
-            lines = inputfile.read().splitlines()
-        lines = [word.replace('_24:00', ' ') for word in lines]
-
-        for j in range(9, len(lines)):
-            line = lines[j].split()
-            line[0]=datetime.datetime.strptime(line[0],'%m/%d/%Y')
-            self.sim_dates.append(line[0])
-            for i in range(1, len(line)):
-                line[i] = float(line[i])
-            self.sim_vals.append(line)
-        #print(f' ==> symhyds.sim_vals read {len(self.sim_vals)} hydrographs ')
-        #print(f' ==> each with {len(self.sim_vals[0])} data points ')
-        print(f' ==> self.sim_dates[0:3]: {self.sim_dates[0:3]} ')
+    def __init__(self, filename, cache=False):
+        import iwfm as iwfm
+
+        # -- values as a (n_times, n_hydrographs) array, dates as datetime64[D],
+        # -- cache = True keeps the parsed file in a binary cache between calls
+        self.values, self.dates, self.names = iwfm.read_hyd_array(filename, cache=cache)
+
+        self.sim_dates = self.dates.astype('datetime64[s]').astype(datetime.datetime).tolist()
+        self.sim_vals = [[date] + row for date, row in zip(self.sim_dates, self.values.tolist())]
 
     def sim_head(self, date, col):
-        dt = datetime.datetime.strptime(date,'%m/%d/%Y')
-        closest = min(self.sim_dates, key=lambda d: abs(d - dt))
-        after  = bisect.bisect_left(self.sim_dates,dt)
-        
-        print(f' ==> date: {date}, dt: {dt}')
-        print(f' ==> closest: {closest}')
-        print(f' ==> self.sim_dates[after]: {self.sim_dates[after]}')
-
-        if self.sim_dates[after] > dt:
-            before = after - 1
-        else: 
-            before, after = after, after + 1
-
-        # numerator: days to observed value
-        num = (dt - self.sim_dates[before]).days
-
-        # denominator: days between simulated values
-        den = (self.sim_dates[after] - self.sim_dates[before]).days
-
-        print(f' ==> num: {num}, den = {den}')
-        print(f' ==> num: {num}, den = {den}')
-
-        return self.sim_vals[before][col] + (
-            self.sim_vals[after][col] - self.sim_vals[before][col]
-        ) * (num / den)
+        ''' sim_head() - Simulated value of column col interpolated to date,
+            'MM/DD/YYYY' '''
+        return float(self.sim_values_at([date], [col])[0])
+
+    def sim_values_at(self, dates, cols):
+        ''' sim_values_at() - Simulated values interpolated linearly in time
+            to many dates at once, with one search of the simulated dates
+
+        Parameters
+        ----------
+        dates : array-like
+            dates as 'MM/DD/YYYY' strings, datetime objects or datetime64
+
+        cols : int or array-like
+            hydrograph columns, numbered from 1 as in sim_vals rows, one
+            for each date or one for all dates
+
+        Returns
+        -------
+        values : numpy array
+            interpolated values, nan for dates outside the simulation period
+
+        '''
+        import numpy as np
+
+        dates = np.asarray(dates)
+        if dates.dtype.kind in 'US':
+            dates = np.array([f'{d[6:10]}-{d[0:2]}-{d[3:5]}' for d in dates.tolist()])
+        dates = dates.astype('datetime64[D]')
+        cols = np.asarray(cols, dtype=int) - 1
+
+        t1 = np.clip(np.searchsorted(self.dates, dates, side='right'), 1, len(self.dates) - 1)
+        t0 = t1 - 1
+        num = (dates - self.dates[t0]).astype(float)          # days to observed value
+        den = (self.dates[t1] - self.dates[t0]).astype(float)  # days between simulated values
+
+        v0, v1 = self.values[t0, cols], self.values[t1, cols]
+        values = v0 + (v1 - v0) * (num / den)
+        values[(dates < self.dates[0]) | (dates > self.dates[-1])] = np.nan
+        return values
 
     def get_head(self, row, col):
         return self.sim_vals[row][col]
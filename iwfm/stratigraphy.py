@@ -0,0 +1,131 @@
+# stratigraphy.py
+# Python class for IWFM nodal stratigraphy as numpy arrays
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+class stratigraphy:
+    ''' stratigraphy - IWFM nodal stratigraphy as a numpy array of shape
+        (n_nodes, 2 * n_layers + 1) holding the land surface elevation and
+        the aquitard and aquifer thickness of each layer. The elevations of
+        all layer surfaces are computed once with a cumulative sum, and the
+        land surface, top, bottom and thickness arrays, shape
+        (n_nodes, n_layers), are views into the thickness and elevation
+        arrays.
+
+    Parameters
+    ----------
+    strat : list or numpy array
+        [node, lse, aquitard thickness, aquifer thickness, ...] for each
+        node, as returned by iwfm_read_strat()
+
+    '''
+
+    def __init__(self, strat):
+        import numpy as np
+
+        strat = np.asarray(strat, dtype=float)
+        self.nodes = strat[:, 0].astype(int)
+        self.table = strat[:, 1:]
+
+        # -- elevation of land surface and the bottom of each aquitard and aquifer
+        self.elev = np.empty_like(self.table)
+        self.elev[:, 0] = self.table[:, 0]
+        self.elev[:, 1:] = self.table[:, :1] - np.cumsum(self.table[:, 1:], axis=1)
+
+        self.lookup = np.full(self.nodes.max() + 1, -1, dtype=int)
+        self.lookup[self.nodes] = np.arange(len(self.nodes))
+
+    @property
+    def n_nodes(self):
+        return self.table.shape[0]
+
+    @property
+    def nlayers(self):
+        return (self.table.shape[1] - 1) // 2
+
+    @property
+    def lse(self):
+        return self.table[:, 0]
+
+    @property
+    def aquitard_thick(self):
+        return self.table[:, 1::2]
+
+    @property
+    def aquifer_thick(self):
+        return self.table[:, 2::2]
+
+    @property
+    def aquitard_top(self):
+        return self.elev[:, 0:-1:2]
+
+    @property
+    def aquitard_bottom(self):
+        return self.elev[:, 1::2]
+
+    @property
+    def aquifer_top(self):
+        return self.elev[:, 1::2]
+
+    @property
+    def aquifer_bottom(self):
+        return self.elev[:, 2::2]
+
+    def layer(self, layer):
+        ''' layer() - Return the aquitard top, aquifer top and aquifer bottom
+            of model layer, zero-based, each of shape (n_nodes,)'''
+        return self.elev[:, 2 * layer], self.elev[:, 2 * layer + 1], self.elev[:, 2 * layer + 2]
+
+    def index(self, nodes):
+        ''' index() - Position of node numbers in the stratigraphy arrays'''
+        import numpy as np
+
+        return self.lookup[np.asarray(nodes, dtype=int)]
+
+    def elem_average(self, values, e_nodes):
+        ''' elem_average() - Return the average of nodal values over the
+            nodes of each element
+
+        Parameters
+        ----------
+        values : numpy array
+            nodal values such as lse or aquifer_top, shape (n_nodes,) or
+            (n_nodes, n_layers)
+
+        e_nodes : list
+            nodes of each element, 3 for triangles or 4 for quadrilaterals
+
+        Returns
+        -------
+        averages : numpy array
+            element values, shape (n_elements,) or (n_elements, n_layers)
+
+        '''
+        import numpy as np
+
+        nodes = np.array([list(n) + [0] * (4 - len(n)) for n in e_nodes], dtype=int)
+        valid = nodes > 0
+        index = np.where(valid, self.lookup[nodes], 0)
+
+        values = np.asarray(values, dtype=float)
+        weights = valid.reshape(valid.shape + (1,) * (values.ndim - 1))
+        return (values[index] * weights).sum(axis=1) / weights.sum(axis=1)
+
+    def as_dict(self):
+        ''' as_dict() - Return a dictionary with key = node, values = list of
+            the land surface and the bottom of each aquitard and aquifer'''
+        return dict(zip(self.nodes.tolist(), self.elev.tolist()))
@@ -0,0 +1,167 @@
+# stream_network.py
+# Python class for the stream node and reach network of an IWFM model
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+
+class stream_network:
+    """stream_network - Stream nodes and reaches of an IWFM model as arrays,
+    with the downstream node of each stream node, the upstream nodes in
+    compressed sparse row form, and a topological order from the headwaters
+    to the outlets.  Everything is built in linear time, stream node ids are
+    looked up through an index array, and flows or other nodal values are
+    accumulated downstream with one pass over the topological order.
+
+    Parameters
+    ----------
+    reach_list : list
+        [reach, upper stream node, lower stream node, outflow stream node]
+        for each reach, as returned by iwfm_read_streams(); outflow node 0
+        means the reach flows out of the model
+
+    stnodes_dict : dictionary
+        key = stream node ID, values = [groundwater node, reach, elevation],
+        with the nodes of each reach in upstream to downstream order
+
+    """
+
+    def __init__(self, reach_list, stnodes_dict):
+        import numpy as np
+
+        # -- stream node table
+        self.snodes = np.array(list(stnodes_dict.keys()), dtype=int)
+        info = list(stnodes_dict.values())
+        self.gw_nodes = np.array([v[0] for v in info], dtype=int)
+        self.node_reach = np.array([v[1] for v in info], dtype=int)
+        self.bottom = np.array([v[2] for v in info], dtype=float)
+        n = len(self.snodes)
+
+        self.lookup = np.full(self.snodes.max() + 1, -1, dtype=int)
+        self.lookup[self.snodes] = np.arange(n)
+
+        # -- reach table
+        reaches = np.array(reach_list, dtype=int).reshape(-1, 4)
+        self.reaches, self.upper, self.lower, self.outflow = reaches.T
+        self.reach_lookup = np.full(self.reaches.max() + 1, -1, dtype=int)
+        self.reach_lookup[self.reaches] = np.arange(len(self.reaches))
+
+        # -- downstream node: next node in the reach, or the outflow node of
+        # -- the reach for its last node, -1 = flows out of the model
+        self.down = np.full(n, -1, dtype=int)
+        same = self.node_reach[1:] == self.node_reach[:-1]
+        self.down[:-1][same] = np.arange(1, n)[same]
+        last = self.lookup[self.lower]
+        has_outflow = self.outflow > 0
+        self.down[last[has_outflow]] = self.lookup[self.outflow[has_outflow]]
+
+        # -- upstream nodes in compressed sparse row form
+        flows = np.flatnonzero(self.down >= 0)
+        order = np.argsort(self.down[flows], kind='stable')
+        self.up_nodes = flows[order]
+        self.up_start = np.zeros(n + 1, dtype=int)
+        np.cumsum(np.bincount(self.down[flows], minlength=n), out=self.up_start[1:])
+
+        # -- topological order, headwaters first
+        count = np.diff(self.up_start)
+        stack = list(np.flatnonzero(count == 0)[::-1])
+        topo = []
+        while stack:
+            i = stack.pop()
+            topo.append(i)
+            d = self.down[i]
+            if d >= 0:
+                count[d] -= 1
+                if count[d] == 0:
+                    stack.append(d)
+        if len(topo) < n:
+            raise ValueError('Stream network contains a loop')
+        self.topo = np.array(topo, dtype=int)
+
+        # -- downstream reach of each reach, and reach topological order from
+        # -- the order of the last node of each reach
+        self.down_reach = np.full(len(self.reaches), -1, dtype=int)
+        self.down_reach[has_outflow] = self.reach_lookup[self.node_reach[self.lookup[self.outflow[has_outflow]]]]
+        topo_position = np.empty(n, dtype=int)
+        topo_position[self.topo] = np.arange(n)
+        self.reach_topo = np.argsort(topo_position[last], kind='stable')
+
+    @property
+    def n_snodes(self):
+        """ n_snodes - Number of stream nodes"""
+        return len(self.snodes)
+
+    def index(self, snodes):
+        """ index() - Position of stream node ids in the node table"""
+        import numpy as np
+
+        return self.lookup[np.asarray(snodes, dtype=int)]
+
+    def gw_node(self, snode):
+        """ gw_node() - Groundwater node of a stream node"""
+        return int(self.gw_nodes[self.lookup[snode]])
+
+    def reach_nodes(self, reach):
+        """ reach_nodes() - Stream nodes of a reach, upstream to downstream"""
+        return self.snodes[self.node_reach == reach]
+
+    def downstream(self, snode):
+        """ downstream() - Stream nodes downstream of snode, to the outlet"""
+        nodes = []
+        i = self.down[self.lookup[snode]]
+        while i >= 0:
+            nodes.append(int(self.snodes[i]))
+            i = self.down[i]
+        return nodes
+
+    def upstream(self, snode):
+        """ upstream() - All stream nodes that flow into snode, directly or
+        through other stream nodes"""
+        nodes = []
+        stack = [self.lookup[snode]]
+        while stack:
+            i = stack.pop()
+            up = self.up_nodes[self.up_start[i]:self.up_start[i + 1]]
+            nodes.extend(self.snodes[up].tolist())
+            stack.extend(up)
+        return nodes
+
+    def accumulate(self, values):
+        """ accumulate() - Sum of values at each stream node and all nodes
+        upstream of it, values in the order of the node table"""
+        import numpy as np
+
+        total = np.array(values, dtype=float)
+        for i in self.topo:
+            if self.down[i] >= 0:
+                total[self.down[i]] += total[i]
+        return total
+
+    def reach_totals(self, values):
+        """ reach_totals() - Sum of nodal values over each reach, in the
+        order of the reach table"""
+        import numpy as np
+
+        return np.bincount(self.reach_lookup[self.node_reach], weights=values,
+                           minlength=len(self.reaches))
+
+    def accumulate_reaches(self, values):
+        """ accumulate_reaches() - Sum of nodal values over each reach and
+        all reaches upstream of it, in the order of the reach table"""
+        total = self.reach_totals(values)
+        for r in self.reach_topo:
+            if self.down_reach[r] >= 0:
+                total[self.down_reach[r]] += total[r]
+        return total
@@ -85,17 +85,16 @@ def sub_pp_streams(stream_file, node_list):
     else:
         exit_now(stream_type)
 
-    sub_snodes = []
-    for sn in snode_ids:
-        if snode_dict[sn] in nodes:
-            sub_snodes.append(sn)
+    nodes = set(nodes)
+    sub_snodes = [sn for sn in snode_ids if snode_dict[sn] in nodes]
+    sub_snodes_set = set(sub_snodes)
 
     # -- cycle through stream reaches, determine if all in, part in, or out of submodel
     sub_reach_info = []
     for i in range(0, len(reach_info)):
         reach_snodes = []
         for j in range(0, len(reach_info[i][4])):
-            if reach_info[i][4][j] in sub_snodes:
+            if reach_info[i][4][j] in sub_snodes_set:
                 reach_snodes.append(reach_info[i][4][j])
         if len(reach_snodes) > 0:
             temp = reach_info[i][0:4]
@@ -106,7 +105,7 @@ def sub_pp_streams(stream_file, node_list):
     rattab_sns = [*rattab_dict]
     sub_rattab_dict = {}
     for sn in rattab_sns:
-        if sn in sub_snodes:
+        if sn in sub_snodes_set:
             sub_rattab_dict[sn] = rattab_dict[sn]
 
     return sub_reach_info, snode_dict, sub_rattab_dict, rating_header, stream_aq, sub_snodes
@@ -0,0 +1,35 @@
+# test_headall2map.py
+# Tests of the dates mapped by headall2map
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+from iwfm.headall2map import map_dates
+
+
+def test_map_dates_single_date():
+    assert map_dates(' 10/31/1973 ') == (['10/31/1973'], [''])
+
+
+def test_map_dates_string_with_spaces():
+    out_dates, date_tags = map_dates('12/31/1973, 10/31/1973 ,11/30/1973')
+    assert out_dates == ['12/31/1973', '10/31/1973', '11/30/1973']
+    assert date_tags == ['_12_31_1973', '_10_31_1973', '_11_30_1973']
+
+
+def test_map_dates_list_with_spaces():
+    out_dates, date_tags = map_dates(['12/31/1973 ', ' 10/31/1973'])
+    assert out_dates == ['12/31/1973', '10/31/1973']
+    assert date_tags == ['_12_31_1973', '_10_31_1973']
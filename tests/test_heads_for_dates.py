@@ -0,0 +1,57 @@
+# test_heads_for_dates.py
+# Tests of reading HeadAll.out time steps for a list of dates
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+import datetime
+
+import numpy as np
+
+import iwfm
+
+
+def write_headall(heads_file, n_nodes=7, n_layers=3, n_times=10):
+    ''' Write a small HeadAll.out file with known heads, return the heads
+        as an (n_times, n_layers, n_nodes) array and the date strings'''
+    rng = np.random.default_rng(1)
+    heads = np.round(rng.uniform(-50, 500, (n_times, n_layers, n_nodes)), 4)
+    dates = []
+    date = datetime.date(1973, 10, 31)
+    with open(heads_file, 'w') as f:
+        for _ in range(5):
+            f.write('*' + ' ' * 40 + '*  HEADS *\n')
+        f.write('*    NODE' + ''.join(f'{n:>12d}' for n in range(1, n_nodes + 1)) + '\n')
+        for t in range(n_times):
+            dates.append(date.strftime('%m/%d/%Y'))
+            for l in range(n_layers):
+                pre = f'{dates[-1]}_24:00' if l == 0 else ' ' * 16
+                f.write(pre + ''.join(f'{h:12.4f}' for h in heads[t, l]) + '\n')
+            date += datetime.timedelta(days=31)
+    return heads, dates
+
+
+def test_heads_for_dates_unsorted(tmp_path):
+    heads_file = str(tmp_path / 'HeadAll.out')
+    heads, dates = write_headall(heads_file)
+
+    out_dates = [dates[9], dates[2], dates[5], dates[2]]
+    hd = iwfm.heads_for_dates(heads_file, out_dates)
+
+    assert hd.n_times == 3
+    assert hd.date_strings() == [dates[2], dates[5], dates[9]]
+    for d in out_dates:
+        np.testing.assert_allclose(hd.heads_for_date(d), heads[dates.index(d)])
+
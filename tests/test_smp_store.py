@@ -0,0 +1,51 @@
+# test_smp_store.py
+# Tests of reading PEST sample bore (smp) records
+# Copyright (C) 2020-2024 University of California
+# -----------------------------------------------------------------------------
+# This information is free; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This work is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+# -----------------------------------------------------------------------------
+
+import datetime
+
+import numpy as np
+
+import iwfm.calib as calib
+
+
+SMP_LINES = ['w1  12/25/1999  00:00:00  1.0',
+             'w2  1/5/2000  00:00:00  3.0',
+             'w2  10/15/1999  00:00:00  5.0']
+
+
+def test_obs_smp_unpadded_dates():
+    obs_data, obs_sites, missing = calib.obs_smp(SMP_LINES, ['w2'])
+    assert obs_data == [['w2', datetime.date(1999, 10, 15), '10/15/1999'],
+                        ['w2', datetime.date(2000, 1, 5), '1/5/2000']]
+    assert obs_sites == ['w2']
+    assert missing == ['w1']
+
+
+def test_smp_store_unpadded_dates(tmp_path):
+    smp_file = tmp_path / 'obs.smp'
+    smp_file.write_text('\n'.join(SMP_LINES) + '\n')
+    store = calib.smp_store(str(smp_file))
+
+    dates, values = store.site_data('w2')
+    assert dates.tolist() == [datetime.date(1999, 10, 15), datetime.date(2000, 1, 5)]
+    assert values.tolist() == [5.0, 3.0]
+    assert np.array_equal(store.first_date(), np.array(['1999-12-25', '1999-10-15'], dtype='datetime64[D]'))
+
+    averages = calib.smp_avg(str(smp_file))
+    assert [line.split()[1] for line in averages] == ['12/25/1999', '1/5/2000', '10/15/1999']
+    assert [float(line.split()[-1]) for line in averages] == [1.0, 4.0, 4.0]